@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Memory Benchmark
+Pic mémoire (tracemalloc) des étapes fetch → filtre → texte → scoring → sortie,
+DataFrames de bout en bout vs ArticleBatch (records + TextStore)
+
+Usage:
+    python benchmark_memory.py                   # 100k articles
+    python benchmark_memory.py --articles 20000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from veille_motorsport.article_records import ArticleBatch
+from veille_motorsport.article_scorer import load_scoring_rules, rank_articles, rank_records
+from veille_motorsport.rss_aggregator import filter_recent_articles, filter_recent_records
+
+VOCABULARY = (
+    "the a of to in and said on for with was this that car season new weekend grid qualifying "
+    "race pace tyre strategy driver team ferrari mercedes mclaren red bull f1 wec le mans hypercar "
+    "downforce aerodynamics telemetry sponsor contract podium championship regulation cadillac"
+).split()
+
+
+def synthetic_feed(n, seed=3):
+    """
+    Entrées RSS (dicts) + textes extraits (url -> texte) pour ~60% des articles
+
+    Construits avant la mesure : seuls les coûts du pipeline sont comptés.
+    """
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    entries = []
+    extracted = {}
+
+    for i in range(n):
+        link = f'https://example.com/{i}'
+        published = now - timedelta(hours=rnd.randint(0, 24 * 14))
+        entries.append({
+            'source': rnd.choice(['Autosport_All', 'Motorsport_All', 'RaceFans', 'The_Race_F1']),
+            'title': ' '.join(rnd.choices(VOCABULARY, k=9)),
+            'link': link,
+            'published': published.strftime('%a, %d %b %Y %H:%M:%S +0000'),
+            'summary': ' '.join(rnd.choices(VOCABULARY, k=40)),
+        })
+        if rnd.random() < 0.6:
+            extracted[link] = ' '.join(rnd.choices(VOCABULARY, k=300))
+
+    return entries, extracted
+
+
+def dataframe_pipeline(entries, extracted):
+    """Chemin DataFrame : DataFrame à chaque étape, merge pour le texte"""
+    articles_df = pd.DataFrame([dict(entry, fetched_at=datetime.now().isoformat()) for entry in entries])
+    recent_df = filter_recent_articles(articles_df, hours=168)
+
+    full_df = pd.DataFrame([{'url': url, 'text': text} for url, text in extracted.items()])
+    merged_df = recent_df.merge(full_df, left_on='link', right_on='url', how='left')
+    merged_df['text'] = merged_df['text'].fillna(merged_df['summary'])
+
+    ranked_df = rank_articles(merged_df)
+    return ranked_df[ranked_df['relevance_score'] >= 20].copy()
+
+
+def records_pipeline(entries, extracted):
+    """Chemin records : ArticleBatch jusqu'à la sortie, DataFrame final seulement"""
+    articles = ArticleBatch()
+    fetched_at = datetime.now().isoformat()
+    for entry in entries:
+        articles.add(entry['source'], entry['title'], entry['link'], entry['published'],
+                     entry['summary'], fetched_at)
+
+    # Seul le compte du fetch survit au filtre : les records hors fenêtre sont libérés
+    recent = filter_recent_records(articles, hours=168)
+    del articles
+    for record in recent:
+        text = extracted.get(record.link)
+        if text:
+            recent.set_text(record, text)
+
+    ranked = rank_records(recent)
+    return ranked.filter(lambda record: record.relevance_score >= 20).to_dataframe()
+
+
+def measure(pipeline, entries, extracted):
+    """(pic mémoire Mo, secondes, lignes en sortie)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    output = pipeline(entries, extracted)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6, elapsed, len(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Peak memory of the article pipeline stages')
+    parser.add_argument('--articles', type=int, default=100000, help='Synthetic articles (default: 100000)')
+    args = parser.parse_args()
+
+    load_scoring_rules()
+    entries, extracted = synthetic_feed(args.articles)
+
+    results = {}
+    for name, pipeline in [('dataframe', dataframe_pipeline), ('records', records_pipeline)]:
+        results[name] = measure(pipeline, entries, extracted)
+
+    print("=" * 70)
+    print(f"MEMORY BENCHMARK ({args.articles} articles, tracemalloc peak)")
+    print("=" * 70)
+    print()
+    print(f"{'Pipeline':<12} {'peak':>10} {'time':>10} {'rows out':>10}")
+    print("-" * 70)
+    for name, (peak_mb, elapsed, rows) in results.items():
+        print(f"{name:<12} {peak_mb:>8.1f}MB {elapsed:>9.1f}s {rows:>10}")
+    print()
+    print(f"Peak reduction: {1 - results['records'][0] / results['dataframe'][0]:.0%}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Scoring Benchmark
+Compare le matching par sous-chaînes (ancien scorer) au matching par mots
+(article_scorer actuel) : précision sur le corpus de régression + vitesse
++ équivalence des scores avec le scoring v2 (mots-clés superposés)
+
+Usage:
+    python benchmark_scoring.py                # corpus scoring_corpus.json
+    python benchmark_scoring.py --repeat 500   # plus d'articles pour la vitesse
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from veille_motorsport.article_scorer import (
+    load_scoring_rules, score_article_v2, score_matches, _LITERAL_RE, _plural_forms
+)
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scoring_corpus.json')
+
+
+def substring_match(rules, title, text):
+    """Ancien matching : `keyword in text` sur titre (x2) + texte en minuscules"""
+    text_full = f"{title} {title} {text}".lower()
+    return {rules.keywords[idx] for idx, keyword in enumerate(rules.keywords) if keyword in text_full}
+
+
+def token_match(rules, title, text):
+    """Matching actuel : mots + phrases à chaque position, ponctuation littérale"""
+    fired = rules.match_text(text, rules.match_text(title))
+    return {rules.keywords[idx] for idx in fired}
+
+
+def keyword_patterns(rules):
+    """Une regex naïve par mot-clé (frontières de mots) : référence lente mais évidente"""
+    word = r'0-9a-z\u00df-\u00f6\u00f8-\u00ff\u0100-\u017f'
+    patterns = []
+    for keyword in rules.keywords:
+        if _LITERAL_RE.search(keyword):
+            patterns.append(re.compile(re.escape(keyword)))
+            continue
+        words = keyword.split()
+        last = '|'.join(re.escape(form) for form in _plural_forms(words[-1]))
+        body = f'[^{word}]+'.join([re.escape(w) for w in words[:-1]] + [f'(?:{last})'])
+        patterns.append(re.compile(f'(?<![{word}]){body}(?![{word}])'))
+    return patterns
+
+
+def v2_reference_score(rules, patterns, title, text):
+    """
+    Scoring v2 : chaque mot-clé cherché indépendamment sur titre (x2) + texte,
+    sans consommation entre mots-clés qui se chevauchent
+    """
+    text_full = f"{title} {title} {text}".lower()
+    title_lower = title.lower()
+    fired = {idx for idx, pattern in enumerate(patterns) if pattern.search(text_full)}
+    title_fired = {idx for idx, pattern in enumerate(patterns) if pattern.search(title_lower)}
+    return score_matches(rules, fired, title_fired, text)
+
+
+def evaluate(rules, cases, match_fn):
+    """
+    Précision / rappel au niveau mot-clé sur les cas annotés
+
+    Returns:
+        (précision, rappel, liste des faux positifs)
+    """
+
+    true_positives = 0
+    expected_total = 0
+    false_positives = []
+
+    for case in cases:
+        fired = match_fn(rules, case['title'], case['text'])
+        true_positives += len(fired & set(case['expected']))
+        expected_total += len(case['expected'])
+        false_positives += [(case['title'], kw) for kw in case['unexpected'] if kw in fired]
+
+    fired_total = true_positives + len(false_positives)
+    precision = true_positives / fired_total if fired_total else 1.0
+    recall = true_positives / expected_total if expected_total else 1.0
+
+    return precision, recall, false_positives
+
+
+def time_per_article(fn, articles):
+    """Temps moyen par article (µs), meilleur de 3 passes"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for title, text in articles:
+            fn(title, text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(articles) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark keyword matching precision and speed')
+    parser.add_argument('--corpus', default=CORPUS_PATH, help='Regression corpus (JSON)')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='Synthetic ~3000-char articles per corpus case for timing (default: 200)')
+    args = parser.parse_args()
+
+    with open(args.corpus, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    cases = corpus['cases']
+
+    rules = load_scoring_rules()
+
+    print("=" * 70)
+    print(f"SCORING BENCHMARK (rules {rules.scoring_version}, {len(cases)} cases)")
+    print("=" * 70)
+    print()
+
+    print(f"{'Matcher':<12} {'precision':>10} {'recall':>10} {'false pos.':>12}")
+    print("-" * 70)
+
+    results = {}
+    for name, match_fn in [('substring', substring_match), ('token', token_match)]:
+        precision, recall, false_positives = evaluate(rules, cases, match_fn)
+        results[name] = false_positives
+        print(f"{name:<12} {precision:>10.1%} {recall:>10.1%} {len(false_positives):>12}")
+
+    print()
+    print("False positives removed by token matching:")
+    for title, keyword in results['substring']:
+        if (title, keyword) not in results['token']:
+            print(f"  • '{keyword}' in \"{title}\"")
+
+    # Relevance (score > 0) sur les cas annotés
+    misclassified = [case['title'] for case in cases
+                     if (score_article_v2(case['text'], case['title']) > 0) != case['relevant']]
+    print()
+    print(f"Relevance: {len(cases) - len(misclassified)}/{len(cases)} cases classified as annotated")
+    for title in misclassified:
+        print(f"  ⚠️  {title}")
+
+    # Équivalence : mêmes scores que v2 (mots-clés superposés, tables croisées)
+    patterns = keyword_patterns(rules)
+    score_diffs = []
+    for case in cases + corpus.get('equivalence', []):
+        expected = v2_reference_score(rules, patterns, case['title'], case['text'])
+        actual = score_article_v2(case['text'], case['title'])
+        if actual != expected:
+            score_diffs.append((case['title'], expected, actual))
+    print()
+    print(f"Equivalence with v2 scores: {len(score_diffs)} diff(s)")
+    for title, expected, actual in score_diffs:
+        print(f"  ❌ {title}: v2 {expected} → {actual}")
+    
+    # Vitesse : articles synthétiques (~3000 caractères) construits depuis le corpus
+    body = ' '.join(case['text'] for case in cases)
+    articles = [(case['title'], f"{body[i % len(body):]} {body[:i % len(body)]} {case['text']}")
+                for i in range(args.repeat) for case in cases]
+
+    substring_us = time_per_article(lambda title, text: substring_match(rules, title, text), articles)
+    token_us = time_per_article(lambda title, text: token_match(rules, title, text), articles)
+    score_us = time_per_article(lambda title, text: score_article_v2(text, title), articles)
+
+    print()
+    print(f"Speed ({len(articles)} articles):")
+    print(f"  • substring match:  {substring_us:>7.1f} µs/article")
+    print(f"  • token match:      {token_us:>7.1f} µs/article ({substring_us / token_us:.2f}x)")
+    print(f"  • score_article_v2: {score_us:>7.1f} µs/article")
+    print()
+
+    if score_diffs:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Mesure le coût d'import des outils légers avec `python -X importtime`
+
+Usage:
+    python benchmark_startup.py            # 5 runs par cible
+    python benchmark_startup.py --runs 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Points d'entrée mesurés (outil -> instruction d'import)
+TARGETS = {
+    'python (baseline)': 'pass',
+    'package': 'import veille_motorsport',
+    'manual_editor': 'from veille_motorsport.manual_editor import DigestEditor',
+    'index_generator': 'from veille_motorsport.web_generator import generate_index_page',
+    'feed_generator': 'from veille_motorsport.feed_generator import save_digest_feeds',
+    'scorer': 'from veille_motorsport.article_scorer import score_article_v2',
+    'full_pipeline': 'from veille_motorsport.main import generate_weekly_digest',
+}
+
+# Dépendances lourdes à surveiller
+HEAVY_MODULES = ['pandas', 'feedparser', 'newspaper', 'bs4', 'anthropic', 'dotenv', 'requests']
+
+
+def measure_import(statement):
+    """
+    Lancer un interpréteur neuf avec -X importtime
+
+    Returns:
+        (temps cumulé des imports en ms, set des modules top-level importés)
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total_us = 0
+    modules = set()
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+        modules.add(name.strip().split('.')[0])
+
+        # Seuls les imports de premier niveau (non indentés) : pas de double comptage
+        if not name.startswith('  '):
+            total_us += int(cumulative)
+
+    return total_us / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark import time of motorsport digest tools')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per target (default: 5)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("STARTUP BENCHMARK (python -X importtime)")
+    print("=" * 70)
+    print()
+    print(f"{'Target':<20} {'median':>10} {'min':>10}   heavy deps loaded")
+    print("-" * 70)
+
+    for target, statement in TARGETS.items():
+        try:
+            # Run de chauffe (compilation .pyc) non comptabilisé
+            measure_import(statement)
+            timings = []
+            for _ in range(args.runs):
+                elapsed_ms, modules = measure_import(statement)
+                timings.append(elapsed_ms)
+        except RuntimeError as e:
+            print(f"{target:<20} ❌ {e}")
+            continue
+
+        heavy = [m for m in HEAVY_MODULES if m in modules]
+        print(f"{target:<20} {statistics.median(timings):>8.1f}ms {min(timings):>8.1f}ms   "
+              f"{', '.join(heavy) or '-'}")
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
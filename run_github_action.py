@@ -30,12 +30,16 @@ def main():
         print()
         
         # Run pipeline
+        # Re-run du workflow : même GITHUB_RUN_ID, checkpoints restaurés depuis le cache
         summaries = generate_weekly_digest(
             days_back=7,
             max_articles_extract=50,
             max_articles_summarize=15,
             min_relevance_score=20,
-            language='fr'
+            language='fr',
+            # Runner éphémère : data/archive ne survivrait pas au run
+            archive=False,
+            run_id=os.environ.get('GITHUB_RUN_ID')
         )
         
         if summaries.empty:
@@ -0,0 +1,65 @@
+"""
+Tests archive Parquet : semaines exportées avec des colonnes différentes
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from veille_motorsport.archive_export import export_archive, read_archive
+
+
+def test_read_column_missing_from_one_week(tmp_path):
+    archive_dir = str(tmp_path / 'archive')
+    
+    # Semaine 1 : avant scoring (pas de relevance_score ni de dédup)
+    export_archive(pd.DataFrame({
+        'source': ['Autosport'],
+        'title': ['Ferrari upgrade'],
+        'link': ['https://example.com/a'],
+        'published': ['2026-01-13T10:00:00+00:00'],
+        'text': ['Ferrari brings a new floor.'],
+    }), archive_dir=archive_dir)
+    
+    # Semaine 2 : colonnes de scoring et de dédup remplies
+    export_archive(pd.DataFrame({
+        'source': ['The Race'],
+        'title': ['Toyota on pole'],
+        'link': ['https://example.com/b'],
+        'published': ['2026-01-20T10:00:00+00:00'],
+        'text': ['Toyota took pole at Le Mans.'],
+        'relevance_score': [42],
+        'also_covered_by': ['[{"source": "Autosport"}]'],
+        'kept': [True],
+    }), archive_dir=archive_dir)
+    
+    df = read_archive(['week', 'link', 'relevance_score', 'also_covered_by'], archive_dir=archive_dir)
+    df = df.sort_values('week').reset_index(drop=True)
+    
+    assert df['week'].tolist() == ['2026-W03', '2026-W04']
+    assert pd.isna(df.loc[0, 'relevance_score'])
+    assert df.loc[1, 'relevance_score'] == 42
+    assert df.loc[1, 'also_covered_by'] == '[{"source": "Autosport"}]'
+    
+    # Jointure texte + colonne absente de la semaine 1, filtrée sur cette semaine
+    week = read_archive(['link', 'kept', 'text'], weeks=['2026-W03'], archive_dir=archive_dir)
+    assert week['link'].tolist() == ['https://example.com/a']
+    assert pd.isna(week.loc[0, 'kept'])
+    assert week.loc[0, 'text'] == 'Ferrari brings a new floor.'
+
+
+def test_rewrite_keeps_latest_version(tmp_path):
+    archive_dir = str(tmp_path / 'archive')
+    article = {
+        'source': 'Autosport',
+        'title': 'Ferrari upgrade',
+        'link': 'https://example.com/a',
+        'published': '2026-01-13T10:00:00+00:00',
+    }
+    
+    export_archive(pd.DataFrame([article]), archive_dir=archive_dir)
+    export_archive(pd.DataFrame([{**article, 'relevance_score': 30}]), archive_dir=archive_dir)
+    
+    df = read_archive(['link', 'relevance_score'], archive_dir=archive_dir)
+    assert df['relevance_score'].tolist() == [30]
@@ -0,0 +1,38 @@
+"""
+Tests records : batch passé entre étapes et relu depuis un checkpoint
+"""
+
+from veille_motorsport.article_records import RECORD_COLUMNS, ArticleBatch
+from veille_motorsport.run_checkpoints import RunCheckpoint
+
+
+def _batch():
+    batch = ArticleBatch()
+    record = batch.add('Autosport', 'Ferrari upgrade', 'https://example.com/a',
+                       'Tue, 13 Jan 2026 10:00:00 GMT', 'Ferrari brings a new floor.')
+    record.article_id = 'a'
+    record.published_ts = 1768298400
+    batch.set_text(record, 'Full text about the new Ferrari floor.')
+    return batch
+
+
+def test_schema_does_not_depend_on_filled_columns():
+    # Avant scoring : relevance_score, also_covered_by... jamais remplis
+    assert _batch().to_dataframe().columns.tolist() == RECORD_COLUMNS
+    assert ArticleBatch().to_dataframe().columns.tolist() == RECORD_COLUMNS
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = RunCheckpoint('run-1', params={}, runs_dir=str(tmp_path / 'runs'))
+    checkpoint.save('collect', {'recent': _batch()}, {})
+    
+    frames, _ = RunCheckpoint('run-1', runs_dir=str(tmp_path / 'runs')).load('collect')
+    assert frames['recent'].columns.tolist() == RECORD_COLUMNS
+    
+    batch = ArticleBatch.coerce(frames['recent'])
+    record = batch.records[0]
+    assert record.article_id == 'a'
+    assert record.published_ts == 1768298400
+    assert record.relevance_score is None  # NULL relu, pas NaN
+    assert batch.summary(record) == 'Ferrari brings a new floor.'
+    assert batch.text(record) == 'Full text about the new Ferrari floor.'
@@ -0,0 +1,65 @@
+"""
+Tests backfill : re-scoring avec un fichier de règles non par défaut
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from veille_motorsport.article_scorer import RULES_PATH, load_scoring_rules, score_article_v2
+from veille_motorsport.backfill import backfill_scores
+
+ARTICLES = [
+    ('Ferrari tire strategy under scrutiny', "Ferrari's F1 tire strategy relied on telemetry and simulation."),
+    ('Alpine confirms new title sponsor', 'The F1 team announced a sponsorship deal with a new sponsor.'),
+    ('MotoGP star tests F1 car', 'The MotoGP champion drove an F1 car at Mugello.'),
+]
+
+
+@pytest.fixture
+def custom_rules(tmp_path, monkeypatch):
+    """Copie des règles par défaut avec des poids techniques modifiés"""
+    monkeypatch.chdir(tmp_path)  # Cache des règles compilées dans tmp_path/data
+    
+    with open(RULES_PATH, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    rules['keywords_technical']['technique']['tire strategy'] = 40
+    rules['keywords_technical']['data_ia']['telemetry'] = 1
+    
+    path = tmp_path / 'custom_rules.json'
+    path.write_text(json.dumps(rules), encoding='utf-8')
+    return str(path)
+
+
+def _make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE articles (title TEXT, text TEXT)")
+    conn.executemany("INSERT INTO articles (title, text) VALUES (?, ?)", ARTICLES)
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_backfill_uses_custom_rules(tmp_path, custom_rules, workers):
+    db_path = str(tmp_path / 'articles.db')
+    _make_db(db_path)
+    
+    custom = load_scoring_rules(custom_rules, force=True)
+    default = load_scoring_rules(RULES_PATH, force=True)
+    assert custom.scoring_version != default.scoring_version
+    
+    stats = backfill_scores(db_path=db_path, workers=workers, chunk_size=2, rules_path=custom_rules)
+    assert stats['articles'] == len(ARTICLES)
+    
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT title, text, relevance_score, scoring_version FROM articles").fetchall()
+    conn.close()
+    
+    for title, text, score, version in rows:
+        assert version == custom.scoring_version
+        assert score == score_article_v2(text, title, rules=custom)
+    
+    # Le poids modifié change bien le score par rapport aux règles par défaut
+    title, text = ARTICLES[0]
+    assert score_article_v2(text, title, rules=custom) != score_article_v2(text, title, rules=default)
@@ -0,0 +1,53 @@
+"""
+Tests extraction priorisée : arrêt anticipé du budget d'extraction
+"""
+
+from veille_motorsport import article_extractor
+from veille_motorsport.article_extractor import extract_prioritized
+
+# url: (score provisoire RSS, score complet après extraction)
+SCORES = {
+    'https://example.com/a': (30, 60),
+    'https://example.com/b': (29, 31),
+    'https://example.com/c': (28, 59),  # Provisoire plus bas que b, mais gagne sur le texte complet
+    'https://example.com/d': (5, 6),
+    'https://example.com/e': (4, 5),
+}
+
+
+def _run(monkeypatch, scores):
+    extracted = []
+    
+    def fake_extract(url):
+        extracted.append(url)
+        return {'url': url, 'title': url, 'text': url}
+    
+    monkeypatch.setattr(article_extractor, 'extract_full_article', fake_extract)
+    candidates = [(url, provisional) for url, (provisional, _) in scores.items()]
+    articles, stats = extract_prioritized(
+        candidates,
+        score_fn=lambda article: scores[article['url']][1],
+        top_n=2, max_articles=len(candidates), delay=0, batch_size=1, patience=1
+    )
+    return extracted, stats
+
+
+def test_lower_provisional_candidate_wins_on_full_text(monkeypatch):
+    extracted, stats = _run(monkeypatch, SCORES)
+    
+    # c (provisoire 28 < 31, score complet de b) doit être extrait : +30 déjà observé sur a
+    assert 'https://example.com/c' in extracted
+    top = sorted(extracted, key=lambda url: SCORES[url][1], reverse=True)[:2]
+    assert top == ['https://example.com/a', 'https://example.com/c']
+    
+    # Puis arrêt après d : même avec +31, e (4) ne peut plus dépasser 59
+    assert stats['saved'] == 1
+
+
+def test_stops_early_when_top_cannot_change(monkeypatch):
+    scores = {url: (provisional, provisional + 2) for url, (provisional, _) in SCORES.items()}
+    extracted, stats = _run(monkeypatch, scores)
+    
+    # Gain observé +2 : c (28 + 2) ne peut pas dépasser b (31)
+    assert extracted == ['https://example.com/a', 'https://example.com/b']
+    assert stats['saved'] == 3
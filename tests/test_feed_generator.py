@@ -0,0 +1,22 @@
+"""
+Tests flux du digest : lignes incomplètes
+"""
+
+import pandas as pd
+
+from veille_motorsport.feed_generator import _feed_items
+
+
+def test_missing_score_does_not_break_feed():
+    # Résumés réutilisés + nouveaux : score absent pour une partie des lignes (NaN après concat)
+    summaries = pd.concat([
+        pd.DataFrame({'url': ['https://example.com/a'], 'title': ['Ferrari upgrade'], 'score': [85]}),
+        pd.DataFrame({'url': ['https://example.com/b'], 'title': ['Toyota on pole']}),
+    ], ignore_index=True)
+    
+    items = _feed_items(summaries)
+    
+    assert [(item['url'], item['score']) for item in items] == [
+        ('https://example.com/a', 85),
+        ('https://example.com/b', 0),
+    ]
@@ -0,0 +1,40 @@
+"""
+Tests état inter-runs : export puis import dans une base vide
+"""
+
+import pandas as pd
+
+from veille_motorsport.digest_history import DigestHistory, digest_week
+from veille_motorsport.pipeline_state import export_state, import_state
+from veille_motorsport.url_identity import IdentityIndex
+
+FINGERPRINT = '1b4bcf81aafd5f0a'
+
+
+def test_history_survives_a_fresh_database(tmp_path):
+    db_path = str(tmp_path / 'run-1.db')
+    state_path = str(tmp_path / 'state' / 'pipeline_state.jsonl')
+    
+    history = DigestHistory(db_path, current_week=digest_week(pd.Timestamp('now') - pd.Timedelta(weeks=1)))
+    history.add_published(pd.DataFrame({
+        'article_id': ['a1'],
+        'title': ['Ferrari brings a new floor to Monza for the Italian Grand Prix'],
+        'link': ['https://example.com/a'],
+        'body_fingerprint': [FINGERPRINT],
+    }))
+    identity = IdentityIndex(db_path)
+    article_id, _ = identity.resolve('https://example.com/b', 'Toyota on pole at Le Mans', 'The Race')
+    identity.save()
+    
+    counts = export_state(db_path, state_path)
+    assert counts['published_stories'] == 1
+    assert counts['url_identity'] == 1
+    
+    # Run suivant : runner neuf, base vide
+    fresh_path = str(tmp_path / 'run-2.db')
+    import_state(fresh_path, state_path)
+    
+    fresh = DigestHistory(fresh_path)
+    assert fresh.lookup('a1') == history.current_week
+    assert fresh.lookup(body_fingerprint=FINGERPRINT) == history.current_week  # Bandes reconstruites
+    assert IdentityIndex(fresh_path).resolve('https://example.com/b', '', 'The Race')[0] == article_id
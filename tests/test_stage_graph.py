@@ -0,0 +1,70 @@
+"""
+Tests graphe d'étapes : réutilisation des étapes entre runs
+"""
+
+from datetime import timedelta
+
+import pandas as pd
+
+from veille_motorsport.run_checkpoints import RunCheckpoint
+from veille_motorsport.stage_graph import StageGraph
+
+
+def _graph(weeks, calls, max_age):
+    """collect (résultat différent à chaque exécution) → rank"""
+    graph = StageGraph()
+    
+    def collect():
+        calls.append('collect')
+        return {'recent': pd.DataFrame({'week': [weeks.pop(0)]})}, {}
+    
+    def rank(collect):
+        calls.append('rank')
+        return {'ranked': collect['recent'].copy()}, {}
+    
+    graph.add('collect', collect, max_age=max_age)
+    graph.add('rank', rank, inputs=('collect',))
+    return graph
+
+
+def test_downstream_reruns_when_upstream_reruns(tmp_path):
+    runs_dir = str(tmp_path / 'runs')
+    weeks = ['2026-W03', '2026-W04']
+    calls = []
+    # max_age ~ nul : 'collect' d'un run précédent n'est jamais réutilisée
+    graph = _graph(weeks, calls, max_age=timedelta(microseconds=1))
+    
+    graph.run({}, RunCheckpoint('run-1', params={}, runs_dir=runs_dir))
+    results = graph.run({}, RunCheckpoint('run-2', params={}, runs_dir=runs_dir))
+    
+    assert calls == ['collect', 'rank', 'collect', 'rank']
+    assert results['rank'][0]['ranked']['week'].tolist() == ['2026-W04']
+
+
+def test_downstream_reused_with_reused_upstream(tmp_path):
+    runs_dir = str(tmp_path / 'runs')
+    calls = []
+    graph = _graph(['2026-W03'], calls, max_age=timedelta(hours=6))
+    
+    graph.run({}, RunCheckpoint('run-1', params={}, runs_dir=runs_dir))
+    results = graph.run({}, RunCheckpoint('run-2', params={}, runs_dir=runs_dir))
+    
+    assert calls == ['collect', 'rank']
+    assert results['rank'][0]['ranked']['week'].tolist() == ['2026-W03']
+    
+    # Origine conservée à la copie : un troisième run réutilise toujours les deux étapes
+    graph.run({}, RunCheckpoint('run-3', params={}, runs_dir=runs_dir))
+    assert calls == ['collect', 'rank']
+    assert RunCheckpoint('run-3', runs_dir=runs_dir).stage_origin('rank') == 'run-1'
+
+
+def test_resume_restores_from_current_run(tmp_path):
+    runs_dir = str(tmp_path / 'runs')
+    calls = []
+    graph = _graph(['2026-W03'], calls, max_age=timedelta(microseconds=1))
+    
+    graph.run({}, RunCheckpoint('run-1', params={}, runs_dir=runs_dir))
+    results = graph.run({}, RunCheckpoint.resume('run-1', runs_dir=runs_dir))
+    
+    assert calls == ['collect', 'rank']
+    assert results['rank'][0]['ranked']['week'].tolist() == ['2026-W03']
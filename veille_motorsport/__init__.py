@@ -3,33 +3,54 @@ Veille Motorsport - SystÃ¨me de veille automatisÃ©e
 Pour F1, F2, WEC et sport automobile
 
 Package principal contenant tous les modules de veille.
+
+Submodules are loaded lazily (PEP 562): importing the package does not pull
+in pandas, feedparser, newspaper, bs4 or anthropic.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Votre Nom"
 
-# Imports principaux pour faciliter l'utilisation
-from .rss_aggregator import fetch_rss_feeds, filter_recent_articles, save_to_database
-from .article_extractor import extract_full_article, extract_batch_articles
-from .article_scorer import score_article_v2, rank_articles, get_top_articles
-from .ai_summarizer import summarize_article_claude, summarize_batch
-from .web_generator import generate_weekly_digest_html, save_weekly_digest
-from .web_scraper import scrape_wec_news, scrape_f1technical_news, scrape_all_sources
-
-__all__ = [
-    'fetch_rss_feeds',
-    'filter_recent_articles',
-    'save_to_database',
-    'extract_full_article',
-    'extract_batch_articles',
-    'score_article_v2',
-    'rank_articles',
-    'get_top_articles',
-    'summarize_article_claude',
-    'summarize_batch',
-    'generate_weekly_digest_html',
-    'save_weekly_digest',
-    'scrape_wec_news',
-    'scrape_f1technical_news',
-    'scrape_all_sources',
-]
+# Imports principaux pour faciliter l'utilisation (name -> submodule)
+_LAZY_ATTRIBUTES = {
+    'fetch_rss_feeds': 'rss_aggregator',
+    'filter_recent_articles': 'rss_aggregator',
+    'save_to_database': 'rss_aggregator',
+    'extract_full_article': 'article_extractor',
+    'extract_batch_articles': 'article_extractor',
+    'score_article_v2': 'article_scorer',
+    'rank_articles': 'article_scorer',
+    'get_top_articles': 'article_scorer',
+    'summarize_article_claude': 'ai_summarizer',
+    'summarize_batch': 'ai_summarizer',
+    'generate_weekly_digest_html': 'web_generator',
+    'save_weekly_digest': 'web_generator',
+    'generate_atom_feed': 'feed_generator',
+    'generate_json_feed': 'feed_generator',
+    'save_digest_feeds': 'feed_generator',
+    'scrape_wec_news': 'web_scraper',
+    'scrape_f1technical_news': 'web_scraper',
+    'scrape_all_sources': 'web_scraper',
+    'fetch_sources': 'sources',
+    'default_sources': 'sources',
+    'build_source': 'sources',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import the owning submodule on first access to an exported name"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value  # Cached: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
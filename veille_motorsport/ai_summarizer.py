@@ -3,16 +3,10 @@ AI Summarizer Module
 Génère des résumés automatiques d'articles avec Claude API
 """
 
-import anthropic
 import os
-import pandas as pd
 from datetime import datetime
 import time
 
-# Charger variables d'environnement
-from dotenv import load_dotenv
-load_dotenv()
-
 
 def summarize_article_claude(article_text, article_title, article_url, language='fr'):
     """
@@ -28,6 +22,12 @@ def summarize_article_claude(article_text, article_title, article_url, language=
         Résumé texte ou None si erreur
     """
     
+    import anthropic
+    from dotenv import load_dotenv
+    
+    # Charger variables d'environnement (à l'appel, pas à l'import du module)
+    load_dotenv()
+    
     # Vérifier API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     
@@ -144,6 +144,8 @@ def summarize_batch(articles_df, max_articles=15, delay=1, language='fr'):
         DataFrame avec résumés
     """
     
+    import pandas as pd
+    
     if articles_df.empty:
         print("⚠️  No articles to summarize")
         return pd.DataFrame()
@@ -254,6 +256,9 @@ if __name__ == "__main__":
     print()
     
     # Vérifier API key
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     
     if not api_key:
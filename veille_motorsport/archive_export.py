@@ -0,0 +1,289 @@
+"""
+Archive Export Module
+Archive colonnaire (Parquet) des articles scorés, pour l'analyse historique
+
+Layout (partitionné par semaine ISO et source, format hive) :
+    data/archive/meta/week=2026-W03/source=Autosport_All/part-0.parquet
+    data/archive/text/week=2026-W03/source=Autosport_All/part-0.parquet
+
+Le texte complet (colonne la plus lourde) est stocké à part, clé `link` :
+une analyse "scores par série / mix de sources / taux de dédup" ne lit que
+les colonnes demandées des partitions demandées, sans jamais charger le texte.
+
+Chaque partition est écrite avec le même schéma explicite (`_schemas`),
+colonnes absentes d'un run comprises (nulles) : les semaines restent
+lisibles ensemble même quand le pipeline n'a pas rempli les mêmes colonnes.
+
+pyarrow est optionnel (pip install pyarrow) : sans lui, export_archive lève
+ImportError (le pipeline l'intercepte et saute l'export).
+"""
+
+import os
+import re
+
+ARCHIVE_DIR = 'data/archive'
+PART_FILENAME = 'part-0.parquet'
+
+# Colonnes stockées dans le dataset texte (le reste va dans meta)
+TEXT_COLUMNS = ['text']
+
+# Clés de partition (dossiers week=/source=), hors des fichiers Parquet
+PARTITION_COLUMNS = ['week', 'source']
+
+
+def _load_pyarrow():
+    """Importer pyarrow à la demande (ImportError explicite si absent)"""
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("pyarrow is required for the Parquet archive (pip install pyarrow)") from e
+    return pyarrow
+
+
+def _schemas(pa):
+    """
+    Schémas fixes (meta, texte) de toutes les partitions
+    
+    Colonnes de ArticleBatch.to_dataframe (voir RECORD_COLUMNS) + 'kept' ;
+    une nouvelle colonne du pipeline doit être ajoutée ici pour être archivée.
+    """
+    string, integer = pa.string(), pa.int64()
+    meta = pa.schema([
+        ('article_id', string),
+        ('title', string),
+        ('link', string),
+        ('published', string),
+        ('published_dt', pa.timestamp('us', tz='UTC')),
+        ('summary', string),
+        ('fetched_at', string),
+        ('body_fingerprint', string),
+        ('relevance_score', integer),
+        ('scoring_version', string),
+        ('score_explain', string),
+        ('provisional_score', integer),
+        ('also_covered_by', string),
+        ('kept', pa.bool_()),
+    ])
+    text = pa.schema([('link', string), ('text', string)])
+    return meta, text
+
+
+def _dataset(pa, path, schema):
+    """Dataset hive (week, source) ouvert avec le schéma fixe, pas celui du premier fichier"""
+    ds = pa.dataset
+    keys = pa.schema([(column, pa.string()) for column in PARTITION_COLUMNS])
+    full_schema = pa.schema(list(schema) + list(keys))
+    return ds.dataset(path, schema=full_schema, format='parquet',
+                      partitioning=ds.partitioning(keys, flavor='hive'))
+
+
+def _week_key(published):
+    """Semaine ISO 'YYYY-Www' depuis une Series de dates ('unknown' si non parsable)"""
+    import pandas as pd
+    
+    dates = pd.to_datetime(published, utc=True, errors='coerce', format='mixed')
+    iso = dates.dt.isocalendar()
+    weeks = iso['year'].astype('string') + '-W' + iso['week'].astype('string').str.zfill(2)
+    return weeks.fillna('unknown')
+
+
+def _partition_value(value):
+    """Valeur de partition utilisable comme nom de dossier"""
+    return re.sub(r'[^\w.-]', '_', str(value)) or 'unknown'
+
+
+def _to_storable(df):
+    """Convertir les colonnes objet non scalaires (listes, dicts, dates) en texte"""
+    df = df.copy()
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].map(
+                lambda v: v if v is None or isinstance(v, (str, bytes, int, float, bool)) else str(v)
+            )
+    return df
+
+
+def _to_table(pa, df, schema):
+    """Table Arrow au schéma fixe : colonnes manquantes nulles, types convertis"""
+    import pandas as pd
+    
+    df = df.reindex(columns=schema.names)
+    for field in schema:
+        column = df[field.name]
+        if pa.types.is_timestamp(field.type):
+            df[field.name] = pd.to_datetime(column, utc=True, errors='coerce', format='mixed')
+        elif pa.types.is_integer(field.type):
+            df[field.name] = pd.to_numeric(column, errors='coerce').round().astype('Int64')
+        elif pa.types.is_boolean(field.type):
+            df[field.name] = column.astype('boolean')
+        else:
+            df[field.name] = column.map(lambda v: None if pd.isna(v) else str(v)).astype(object)
+    
+    return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def _write_partition(pa, path, df, schema):
+    """
+    Fusionner df dans un fichier de partition (un article = un link, le plus récent gagne)
+    """
+    import pandas as pd
+    
+    if os.path.exists(path):
+        existing = pa.parquet.read_table(path).to_pandas()
+        df = pd.concat([existing, df], ignore_index=True)
+    
+    df = df.drop_duplicates('link', keep='last')
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    pa.parquet.write_table(_to_table(pa, df, schema), tmp_path, compression='zstd')
+    os.replace(tmp_path, path)
+
+
+def export_archive(articles_df, archive_dir=ARCHIVE_DIR):
+    """
+    Écrire/mettre à jour l'archive Parquet partitionnée (semaine, source)
+    
+    Seules les partitions touchées par ce run sont réécrites ; un article
+    déjà archivé (même link) est remplacé par sa version la plus récente.
+    
+    Args:
+        articles_df: DataFrame articles scorés (link, source, published, text...)
+        archive_dir: Dossier racine de l'archive
+    
+    Returns:
+        Nombre de partitions écrites
+    """
+    
+    pa = _load_pyarrow()
+    
+    if articles_df.empty:
+        print("⚠️  No articles to archive")
+        return 0
+    
+    df = articles_df.loc[:, ~articles_df.columns.duplicated()]
+    df = _to_storable(df.dropna(subset=['link']))
+    df['week'] = _week_key(df['published']).values if 'published' in df.columns else 'unknown'
+    df['source'] = df['source'].map(_partition_value) if 'source' in df.columns else 'unknown'
+    
+    meta_schema, text_schema = _schemas(pa)
+    has_text = any(c in df.columns for c in TEXT_COLUMNS)
+    
+    unknown = [c for c in df.columns if c not in meta_schema.names + TEXT_COLUMNS + PARTITION_COLUMNS]
+    if unknown:
+        print(f"⚠️  Columns not in the archive schema (not archived): {', '.join(unknown)}")
+    
+    partitions = 0
+    for (week, source), group in df.groupby(PARTITION_COLUMNS, sort=False):
+        partition = os.path.join(f'week={week}', f'source={source}')
+        
+        _write_partition(pa, os.path.join(archive_dir, 'meta', partition, PART_FILENAME), group, meta_schema)
+        if has_text:
+            _write_partition(pa, os.path.join(archive_dir, 'text', partition, PART_FILENAME), group, text_schema)
+        partitions += 1
+    
+    print(f"🗄️  Archived {len(df)} articles to {archive_dir} ({partitions} partitions)\n")
+    
+    return partitions
+
+
+def read_archive(columns=None, weeks=None, sources=None, archive_dir=ARCHIVE_DIR):
+    """
+    Lire l'archive en ne chargeant que les colonnes et partitions demandées
+    
+    Args:
+        columns: Colonnes voulues (None = toutes les métadonnées, sans le texte) ;
+                 'week' / 'source' sont les clés de partition, 'text' déclenche
+                 la lecture du dataset texte
+        weeks: Liste de semaines 'YYYY-Www' (None = toutes)
+        sources: Liste de sources (None = toutes)
+        archive_dir: Dossier racine de l'archive
+    
+    Returns:
+        DataFrame
+    
+    Ex:
+        read_archive(['week', 'source', 'relevance_score'])       # quelques Mo même sur des années
+        read_archive(['link', 'title', 'text'], weeks=['2026-W03'])
+    """
+    
+    pa = _load_pyarrow()
+    ds = pa.dataset
+    
+    meta_path = os.path.join(archive_dir, 'meta')
+    if not os.path.isdir(meta_path):
+        import pandas as pd
+        print(f"⚠️  No archive found in {archive_dir}")
+        return pd.DataFrame(columns=columns or [])
+    
+    meta_schema, text_schema = _schemas(pa)
+    meta = _dataset(pa, meta_path, meta_schema)
+    
+    condition = None
+    if weeks is not None:
+        condition = ds.field('week').isin(list(weeks))
+    if sources is not None:
+        source_condition = ds.field('source').isin([_partition_value(s) for s in sources])
+        condition = source_condition if condition is None else condition & source_condition
+    
+    if columns is None:
+        columns = meta.schema.names
+    wanted_text = [c for c in columns if c in TEXT_COLUMNS]
+    meta_columns = [c for c in columns if c not in TEXT_COLUMNS]
+    
+    if not wanted_text:
+        return meta.to_table(columns=meta_columns, filter=condition).to_pandas()
+    
+    # Texte demandé : jointure sur link, partitions filtrées des deux côtés
+    table = meta.to_table(columns=list(dict.fromkeys(meta_columns + ['link'])), filter=condition)
+    text = _dataset(pa, os.path.join(archive_dir, 'text'), text_schema)
+    text_table = text.to_table(columns=['link'] + wanted_text, filter=condition)
+    joined = table.join(text_table, keys='link', join_type='left outer')
+    
+    return joined.select(columns).to_pandas()
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """Exporter la base SQLite vers l'archive Parquet, ou résumer l'archive"""
+    
+    import argparse
+    import sqlite3
+    import time
+    
+    import pandas as pd
+    
+    parser = argparse.ArgumentParser(description='Parquet archive of scored articles')
+    parser.add_argument('--from-db', default=None, metavar='DB',
+                        help='Export all articles of a SQLite database into the archive')
+    parser.add_argument('--archive', default=ARCHIVE_DIR, help=f'Archive directory (default: {ARCHIVE_DIR})')
+    args = parser.parse_args()
+    
+    if args.from_db:
+        conn = sqlite3.connect(args.from_db)
+        articles_df = pd.read_sql_query("SELECT * FROM articles", conn)
+        conn.close()
+        export_archive(articles_df, archive_dir=args.archive)
+    
+    # Exemple d'analyse : mix de sources et score moyen par semaine, sans le texte
+    start = time.perf_counter()
+    df = read_archive(['week', 'source', 'relevance_score'], archive_dir=args.archive)
+    elapsed = time.perf_counter() - start
+    
+    if df.empty:
+        return
+    
+    print(f"📊 {len(df)} archived articles loaded in {elapsed:.2f}s "
+          f"({df.memory_usage(deep=True).sum() / 1e6:.1f} MB)\n")
+    print(df.groupby('week')['relevance_score'].agg(['count', 'mean']).round(1).tail(10))
+    print()
+    print(df['source'].value_counts().head(10))
+
+
+if __name__ == "__main__":
+    main()
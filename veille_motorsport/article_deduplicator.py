@@ -3,8 +3,18 @@ Article Deduplicator Module
 Détecte et élimine les doublons d'articles (même news de sources différentes)
 """
 
+import json
+import re
 from difflib import SequenceMatcher
-import pandas as pd
+from itertools import combinations
+
+from .content_fingerprint import SimHashIndex, hamming_distance
+
+# Distance SimHash (bits sur 64) entre textes : doublon quel que soit le titre
+BODY_DUPLICATE_DISTANCE = 10
+# Textes proches + titres proches (seuil titre abaissé de TITLE_MARGIN) : doublon
+BODY_SIMILAR_DISTANCE = 16
+TITLE_MARGIN = 0.2
 
 
 def calculate_similarity(str1, str2):
@@ -47,18 +57,206 @@ def calculate_similarity(str1, str2):
     return base_similarity
 
 
-def deduplicate_articles(df, similarity_threshold=0.7):
+# Hiérarchie sources (plus fiable = plus haut)
+SOURCE_PRIORITY = {
+    # Officiels (priorité max)
+    'f1_official': 10,
+    'formulae_official': 10,
+    'fia': 10,
+    
+    # Techniques spécialisés
+    'f1_technical': 9,
+    'racecar': 9,
+    'sportscar365': 9,
+    
+    # Médias majeurs techniques
+    'autosport': 8,
+    'motorsport': 8,
+    'the_race': 8,
+    'racefans': 7,
+    
+    # Autres
+    'default': 5
+}
+
+
+def get_source_priority(source):
+    """Obtenir priorité d'une source"""
+    source_lower = source.lower()
+    for key, priority in SOURCE_PRIORITY.items():
+        if key in source_lower:
+            return priority
+    return SOURCE_PRIORITY['default']
+
+
+def _body_duplicate_pairs(fingerprints):
+    """Paires (i, j), i < j, de textes quasi identiques (index par bandes)"""
+    index = SimHashIndex.build(enumerate(fingerprints), max_distance=BODY_DUPLICATE_DISTANCE)
+    
+    pairs = set()
+    for i, fingerprint in enumerate(fingerprints):
+        for j, _ in index.query(fingerprint, exclude=i):
+            pairs.add((min(i, j), max(i, j)))
+    return pairs
+
+
+def _is_duplicate(i, j, title_similarity, similarity_threshold, fingerprints, body_pairs):
+    """Décision titre + texte pour les articles i < j"""
+    if title_similarity >= similarity_threshold or (i, j) in body_pairs:
+        return True
+    
+    if fingerprints is None or title_similarity < similarity_threshold - TITLE_MARGIN:
+        return False
+    
+    fingerprint_i, fingerprint_j = fingerprints[i], fingerprints[j]
+    if not isinstance(fingerprint_i, str) or not isinstance(fingerprint_j, str):
+        return False
+    return hamming_distance(fingerprint_i, fingerprint_j) <= BODY_SIMILAR_DISTANCE
+
+
+# Mots vides exclus des clés de blocage des titres
+_TITLE_STOPWORDS = {
+    'the', 'and', 'for', 'with', 'from', 'after', 'his', 'her', 'its', 'has', 'have',
+    'was', 'will', 'into', 'over', 'out', 'new', 'says', 'how', 'why', 'what',
+}
+_TITLE_TOKEN_RE = re.compile(r'\w{3,}')
+
+# Mot présent dans plus de titres que ça : trop courant pour proposer des paires
+MAX_POSTING = 50
+
+
+class _UnionFind:
+    """Union-find (compression de chemin + union par taille)"""
+    
+    __slots__ = ('parent', 'size')
+    
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+    
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+    
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i == root_j:
+            return
+        if self.size[root_i] < self.size[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        self.size[root_i] += self.size[root_j]
+
+
+def _title_candidate_pairs(titles):
+    """Paires (i, j), i < j, de titres partageant un mot peu courant (index inversé)"""
+    postings = {}
+    for i, title in enumerate(titles):
+        for token in set(_TITLE_TOKEN_RE.findall((title or '').lower())) - _TITLE_STOPWORDS:
+            postings.setdefault(token, []).append(i)
+    
+    pairs = set()
+    for positions in postings.values():
+        if 1 < len(positions) <= MAX_POSTING:
+            pairs.update(combinations(positions, 2))
+    return pairs
+
+
+def cluster_articles(titles, scores, sources, similarity_threshold, fingerprints=None, extra_pairs=None):
+    """
+    Regrouper toute la couverture d'une même news (union-find)
+    
+    Les paires candidates viennent d'un index inversé sur les mots des titres
+    et de l'index SimHash des textes ; seules ces paires sont vérifiées
+    (_is_duplicate), puis fusionnées. Le résultat ne dépend pas de l'ordre
+    des articles, et un doublon de doublon rejoint le même cluster.
+    
+    Args:
+        titles, scores, sources: Listes parallèles
+        similarity_threshold: Seuil similarité des titres
+        fingerprints: Empreintes SimHash des textes (hex, None si absente), optionnel
+        extra_pairs: Paires (i, j) déjà jugées doublons (ex: semantic_pairs), optionnel
+    
+    Returns:
+        Liste de clusters (listes de positions), représentant en premier
+        (meilleur score, puis source la plus fiable), clusters triés par score
+        du représentant
+    """
+    
+    body_pairs = _body_duplicate_pairs(fingerprints) if fingerprints is not None else set()
+    
+    clusters = _UnionFind(len(titles))
+    for i, j in _title_candidate_pairs(titles) | body_pairs:
+        similarity = calculate_similarity(titles[i], titles[j])
+        if _is_duplicate(i, j, similarity, similarity_threshold, fingerprints, body_pairs):
+            clusters.union(i, j)
+    
+    for i, j in extra_pairs or ():
+        clusters.union(i, j)
+    
+    groups = {}
+    for i in range(len(titles)):
+        groups.setdefault(clusters.find(i), []).append(i)
+    
+    def rank(i):
+        return (scores[i], get_source_priority(sources[i]))
+    
+    ordered = [sorted(members, key=rank, reverse=True) for members in groups.values()]
+    ordered.sort(key=lambda members: rank(members[0]), reverse=True)
+    
+    return ordered
+
+
+def _also_covered_by(members, titles, sources, links):
+    """Autres articles du cluster (JSON pour la base / le HTML), None si seul"""
+    if len(members) < 2:
+        return None
+    return json.dumps(
+        [{'source': sources[i], 'title': titles[i], 'link': links[i]} for i in members[1:]],
+        ensure_ascii=False
+    )
+
+
+def _semantic_pairs(keys, titles, texts):
+    """Paires sémantiques (semantic_dedup), set vide si le backend est indisponible"""
+    try:
+        from .semantic_dedup import EmbeddingCache, semantic_pairs
+        pairs, _ = semantic_pairs(keys, titles, texts, cache=EmbeddingCache())
+        return pairs
+    except ImportError as e:
+        print(f"  ⚠️  Semantic dedup skipped: {e}")
+        return set()
+
+
+def _print_clusters(clusters, titles, total):
+    """Résumé : doublons retirés + plus gros clusters"""
+    merged = [members for members in clusters if len(members) > 1]
+    
+    for members in sorted(merged, key=len, reverse=True)[:5]:
+        print(f"  → {len(members)} articles: '{titles[members[0]][:60]}'")
+    
+    print(f"✅ Removed {total - len(clusters)} duplicates in {len(merged)} stories "
+          f"({total} → {len(clusters)} articles)\n")
+
+
+def deduplicate_articles(df, similarity_threshold=0.7, semantic=False):
     """
     Éliminer articles en double (même news de sources différentes)
     
     Stratégie :
-    - Compare titres par paires
-    - Si similarité > threshold → garde article avec meilleur score
+    - Regroupe la couverture d'une même news en clusters (cluster_articles)
+    - Doublon si titres similaires (> threshold), textes quasi identiques,
+      ou titres assez proches + textes proches
+    - Garde l'article avec meilleur score
     - Si scores égaux → garde source la plus fiable
+    - Les autres articles du cluster → colonne 'also_covered_by' (JSON)
     
     Args:
         df: DataFrame avec colonnes 'title', 'score', 'source'
         similarity_threshold: Seuil similarité (0.7 = 70% similaire)
+        semantic: Ajouter les paraphrases détectées par embeddings (semantic_dedup)
     
     Returns:
         DataFrame sans doublons
@@ -69,112 +267,93 @@ def deduplicate_articles(df, similarity_threshold=0.7):
     
     print(f"🔍 Checking for duplicates (threshold: {similarity_threshold})...")
     
-    # Hiérarchie sources (plus fiable = plus haut)
-    SOURCE_PRIORITY = {
-        # Officiels (priorité max)
-        'f1_official': 10,
-        'formulae_official': 10,
-        'fia': 10,
-        
-        # Techniques spécialisés
-        'f1_technical': 9,
-        'racecar': 9,
-        'sportscar365': 9,
-        
-        # Médias majeurs techniques
-        'autosport': 8,
-        'motorsport': 8,
-        'the_race': 8,
-        'racefans': 7,
-        
-        # Autres
-        'default': 5
-    }
-    
-    def get_source_priority(source):
-        """Obtenir priorité d'une source"""
-        source_lower = source.lower()
-        for key, priority in SOURCE_PRIORITY.items():
-            if key in source_lower:
-                return priority
-        return SOURCE_PRIORITY['default']
-    
-    # Marquer articles à garder
-    keep_indices = []
-    skip_indices = set()
-    
     # Utiliser 'relevance_score' si disponible, sinon 'score'
     score_col = 'relevance_score' if 'relevance_score' in df.columns else 'score'
     df_sorted = df.sort_values(score_col, ascending=False).reset_index(drop=True)
     
-    duplicates_found = 0
+    titles = df_sorted['title'].tolist()
+    sources = df_sorted['source'].tolist()
+    links = df_sorted['link'].tolist() if 'link' in df_sorted.columns else [None] * len(df_sorted)
     
-    for i in range(len(df_sorted)):
-        if i in skip_indices:
-            continue
-        
-        keep_indices.append(i)
-        title_i = df_sorted.loc[i, 'title']
-        score_i = df_sorted.loc[i, score_col]
-        source_i = df_sorted.loc[i, 'source']
-        
-        # Comparer avec articles suivants
-        for j in range(i + 1, len(df_sorted)):
-            if j in skip_indices:
-                continue
-            
-            title_j = df_sorted.loc[j, 'title']
-            similarity = calculate_similarity(title_i, title_j)
-            
-            if similarity >= similarity_threshold:
-                # Doublon détecté !
-                score_j = df_sorted.loc[j, score_col]
-                source_j = df_sorted.loc[j, 'source']
-                
-                # Décider lequel garder
-                if score_i > score_j:
-                    # Garder i, skip j
-                    skip_indices.add(j)
-                    duplicates_found += 1
-                    print(f"  → Duplicate: '{title_j[:60]}...' (score {score_j}) - keeping better scored version")
-                
-                elif score_i < score_j:
-                    # Garder j, skip i
-                    keep_indices.remove(i)
-                    skip_indices.add(i)
-                    duplicates_found += 1
-                    print(f"  → Duplicate: '{title_i[:60]}...' (score {score_i}) - keeping better scored version")
-                    break  # i est skipped, passer au suivant
-                
-                else:
-                    # Scores égaux → comparer sources
-                    priority_i = get_source_priority(source_i)
-                    priority_j = get_source_priority(source_j)
-                    
-                    if priority_i >= priority_j:
-                        skip_indices.add(j)
-                        duplicates_found += 1
-                        print(f"  → Duplicate: '{title_j[:60]}...' - keeping from {source_i}")
-                    else:
-                        keep_indices.remove(i)
-                        skip_indices.add(i)
-                        duplicates_found += 1
-                        print(f"  → Duplicate: '{title_i[:60]}...' - keeping from {source_j}")
-                        break
-    
-    # Créer DataFrame sans doublons
-    df_deduped = df_sorted.loc[keep_indices].copy()
-    
-    print(f"✅ Removed {duplicates_found} duplicates ({len(df)} → {len(df_deduped)} articles)\n")
+    extra_pairs = None
+    if semantic:
+        key_column = next(c for c in ('article_id', 'link', 'title') if c in df_sorted.columns)
+        text_column = 'text' if 'text' in df_sorted.columns else 'summary'
+        extra_pairs = _semantic_pairs(
+            df_sorted[key_column].astype(str).tolist(),
+            titles,
+            df_sorted[text_column].fillna('').tolist() if text_column in df_sorted.columns else [''] * len(titles)
+        )
+    
+    clusters = cluster_articles(
+        titles,
+        df_sorted[score_col].tolist(),
+        sources,
+        similarity_threshold,
+        df_sorted['body_fingerprint'].tolist() if 'body_fingerprint' in df_sorted.columns else None,
+        extra_pairs
+    )
+    
+    # DataFrame sans doublons (sélection = nouveau DataFrame, pas de .copy() en plus)
+    df_deduped = df_sorted.take([members[0] for members in clusters])
+    df_deduped['also_covered_by'] = [_also_covered_by(members, titles, sources, links) for members in clusters]
+    
+    _print_clusters(clusters, titles, len(df))
     
     return df_deduped
 
 
+def deduplicate_records(batch, similarity_threshold=0.7, semantic=False):
+    """
+    deduplicate_articles pour un ArticleBatch trié ou non (relevance_score)
+    
+    Returns:
+        ArticleBatch sans doublons (même TextStore), also_covered_by renseigné
+    """
+    
+    if len(batch) < 2:
+        return batch
+    
+    print(f"🔍 Checking for duplicates (threshold: {similarity_threshold})...")
+    
+    records = sorted(batch.records, key=lambda record: record.relevance_score, reverse=True)
+    titles = [record.title for record in records]
+    sources = [record.source for record in records]
+    
+    extra_pairs = None
+    if semantic:
+        extra_pairs = _semantic_pairs(
+            [record.article_id or record.link for record in records],
+            titles,
+            [batch.text(record) for record in records]
+        )
+    
+    clusters = cluster_articles(
+        titles,
+        [record.relevance_score for record in records],
+        sources,
+        similarity_threshold,
+        [record.body_fingerprint for record in records],
+        extra_pairs
+    )
+    
+    links = [record.link for record in records]
+    for members in clusters:
+        records[members[0]].also_covered_by = _also_covered_by(members, titles, sources, links)
+    
+    deduped = type(batch)([records[members[0]] for members in clusters], batch.texts)
+    
+    _print_clusters(clusters, titles, len(batch))
+    
+    return deduped
+
+
 # ============================================
 # TEST MODULE
 # ============================================
 
 if __name__ == "__main__":
+    import pandas as pd
     
     print("=" * 70)
     print("DEDUPLICATOR - TEST")
@@ -3,23 +3,41 @@ Article Extractor Module
 Extrait le contenu complet des articles depuis leurs URLs
 """
 
-try:
-    from newspaper import Article
-    NEWSPAPER_AVAILABLE = True
-except ImportError:
-    # Fallback sur BeautifulSoup si newspaper pas installé
-    from bs4 import BeautifulSoup
-    import requests
-    NEWSPAPER_AVAILABLE = False
-    print("⚠️  newspaper3k/4k not available, using BeautifulSoup fallback")
-
-# Importer requests et BeautifulSoup même si newspaper est disponible
-import requests
-from bs4 import BeautifulSoup
 import time
 from datetime import datetime
 import random
 
+from .content_fingerprint import body_fingerprint
+from .http_client import get_session
+
+# newspaper / requests / bs4 sont importés à la première extraction
+# (évite de les charger pour les outils qui n'extraient rien)
+_newspaper_article = None
+NEWSPAPER_AVAILABLE = None  # Inconnu tant que _load_newspaper() n'a pas tourné
+
+
+def _load_newspaper():
+    """
+    Importer newspaper à la demande (une seule fois)
+    
+    Returns:
+        Classe Article de newspaper, ou None (fallback BeautifulSoup)
+    """
+    global _newspaper_article, NEWSPAPER_AVAILABLE
+    
+    if NEWSPAPER_AVAILABLE is None:
+        try:
+            from newspaper import Article
+            _newspaper_article = Article
+            NEWSPAPER_AVAILABLE = True
+        except ImportError:
+            # Fallback sur BeautifulSoup si newspaper pas installé
+            NEWSPAPER_AVAILABLE = False
+            print("⚠️  newspaper3k/4k not available, using BeautifulSoup fallback")
+    
+    return _newspaper_article
+
+
 # ============================================
 # HEADERS SOPHISTIQUÉS - Anti-bot detection
 # ============================================
@@ -78,20 +96,26 @@ def extract_full_article(url):
         url: URL de l'article
     
     Returns:
-        Dict avec contenu article ou None si erreur
+        Dict avec contenu article (+ 'fingerprint' SimHash du texte) ou None si erreur
     """
     
-    if NEWSPAPER_AVAILABLE:
-        return _extract_with_newspaper(url)
+    if _load_newspaper() is not None:
+        article = _extract_with_newspaper(url)
     else:
-        return _extract_with_beautifulsoup(url)
+        article = _extract_with_beautifulsoup(url)
+    
+    # Empreinte calculée une fois ici, stockée avec l'article (dédup sur le texte)
+    if article:
+        article['fingerprint'] = body_fingerprint(article.get('text'))
+    
+    return article
 
 
 def _extract_with_newspaper(url):
     """Extraction avec newspaper (recommandé)"""
     
     try:
-        article = Article(url)
+        article = _load_newspaper()(url)
         
         # Configuration avec headers sophistiqués
         article.config.browser_user_agent = random.choice(USER_AGENTS)
@@ -112,7 +136,7 @@ def _extract_with_newspaper(url):
             'top_image': article.top_image,
             'extracted_at': datetime.now().isoformat()
         }
-        
+    
     except Exception as e:
         # Si newspaper échoue, essayer avec requests + headers
         print(f"  ⚠️  Newspaper failed, trying with custom headers...")
@@ -123,11 +147,13 @@ def _extract_with_custom_headers(url):
     """
     Extraction avec requests + headers sophistiqués (pour contourner CloudFront)
     """
+    from bs4 import BeautifulSoup
+    
     try:
         headers = get_random_headers()
         
-        # Requête avec headers sophistiqués
-        response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
+        # Requête avec headers sophistiqués (session partagée : connexions réutilisées)
+        response = get_session().get(url, headers=headers, timeout=15, allow_redirects=True)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -184,7 +210,7 @@ def _extract_with_custom_headers(url):
             'top_image': top_image,
             'extracted_at': datetime.now().isoformat()
         }
-        
+    
     except Exception as e:
         print(f"  ❌ Custom headers failed: {e}")
         return None
@@ -236,6 +262,97 @@ def extract_batch_articles(urls, delay=1, max_articles=None):
     return articles
 
 
+def extract_prioritized(candidates, score_fn, top_n, max_articles, delay=1, batch_size=10, patience=2):
+    """
+    Extraire par ordre de score provisoire, avec budget adaptatif
+    
+    Les candidats sont extraits du meilleur au moins bon score provisoire
+    (RSS). Après chaque lot, le top N est recalculé (score complet pour les
+    articles extraits, provisoire pour les autres). L'extraction s'arrête
+    avant `max_articles` dès que :
+    - au moins N articles sont extraits,
+    - le top N n'a pas changé depuis `patience` lots,
+    - même avec le plus fort gain (score complet - provisoire) observé jusqu'ici,
+      le prochain candidat resterait sous le N-ième score complet.
+    
+    Le texte complet ajoute souvent des points au score RSS : comparer le
+    provisoire du candidat directement aux scores complets arrêterait
+    l'extraction avant un article qui aurait gagné sa place dans le top.
+    
+    Args:
+        candidates: Liste de (url, score provisoire), triée par priorité
+        score_fn: Fonction article extrait (dict) -> score complet
+        top_n: Taille du top (articles résumés)
+        max_articles: Budget max d'extractions
+        delay: Délai entre requêtes (secondes)
+        batch_size: Extractions entre deux vérifications de stabilité
+        patience: Lots consécutifs sans changement du top N avant arrêt
+    
+    Returns:
+        (liste de dicts avec articles extraits, dict de stats)
+    """
+    
+    candidates = list(candidates)[:max_articles]
+    provisional_scores = dict(candidates)
+    known_scores = dict(provisional_scores)
+    full_scores = {}
+    articles = []
+    total = len(candidates)
+    
+    previous_top = None
+    stable_batches = 0
+    attempted = 0
+    
+    print(f"📄 Extracting up to {total} articles (priority order, top {top_n})...\n")
+    
+    for idx, (url, provisional) in enumerate(candidates, 1):
+        print(f"  [{idx}/{total}] (provisional {provisional}) Extracting...", end=" ")
+        
+        article_data = extract_full_article(url)
+        attempted = idx
+        
+        if article_data:
+            articles.append(article_data)
+            full_scores[url] = known_scores[url] = score_fn(article_data)
+            print(f"✅ {article_data['title'][:50]}... (score {full_scores[url]})")
+        else:
+            print(f"❌ Failed")
+        
+        if idx == total:
+            break
+        
+        # Vérification de stabilité à la fin de chaque lot
+        if idx % batch_size == 0:
+            top = set(sorted(known_scores, key=known_scores.get, reverse=True)[:top_n])
+            stable_batches = stable_batches + 1 if top == previous_top else 0
+            previous_top = top
+            
+            top_full = sorted((full_scores[u] for u in top if u in full_scores), reverse=True)
+            max_gain = max((full_scores[u] - provisional_scores[u] for u in full_scores), default=0)
+            next_best = candidates[idx][1] + max(max_gain, 0)
+            
+            if (len(full_scores) >= top_n and stable_batches >= patience
+                    and len(top_full) == top_n and next_best < top_full[-1]):
+                print(f"\n  ⏹️  Top {top_n} stable for {stable_batches} batches, "
+                      f"next candidate scores at most {next_best} < {top_full[-1]}: stopping early")
+                break
+        
+        # Rate limiting (être respectueux des serveurs)
+        time.sleep(delay)
+    
+    stats = {
+        'attempted': attempted,
+        'extracted': len(articles),
+        'budget': total,
+        'saved': total - attempted,
+    }
+    
+    print(f"\n✅ Successfully extracted {len(articles)}/{attempted} articles "
+          f"({stats['saved']} downloads saved by adaptive budget)\n")
+    
+    return articles, stats
+
+
 def clean_text(text, max_length=None):
     """
     Nettoyer et normaliser le texte extrait
@@ -0,0 +1,193 @@
+"""
+Article Records Module
+Représentation compacte des articles entre les étapes du pipeline
+
+Les étapes fetch → filtre → extraction → scoring → dédup manipulent des
+ArticleRecord (`__slots__`, pas de dict par objet) regroupés dans un
+ArticleBatch. Résumés RSS et textes complets sont stockés une seule fois
+dans un TextStore et référencés par id : filtrer, trier ou retenir un
+sous-ensemble ne copie ni les textes ni les autres colonnes.
+
+Les étapes du pipeline se passent les batches tels quels ; les DataFrames ne
+sont construits qu'aux frontières (checkpoints, base SQLite, archive, résumés
+IA, génération HTML) via ArticleBatch.to_dataframe(), toujours avec les mêmes
+colonnes : un checkpoint relu a le même schéma quel que soit le run.
+"""
+
+
+class TextStore:
+    """
+    Textes (résumés RSS, contenus extraits) stockés une fois, référencés par id
+    
+    Pas d'index inverse texte → id (il coûterait autant que les records) :
+    le partage se fait par id, ex. le résumé sert de texte de repli sans copie.
+    """
+    
+    __slots__ = ('_texts',)
+    
+    def __init__(self):
+        self._texts = []
+    
+    def add(self, text):
+        """Ajouter un texte, retourner son id (None pour texte vide)"""
+        if not text or not isinstance(text, str):
+            return None
+        
+        self._texts.append(text)
+        return len(self._texts) - 1
+    
+    def get(self, text_id):
+        """Texte d'un id ('' pour None)"""
+        return '' if text_id is None else self._texts[text_id]
+    
+    def __len__(self):
+        return len(self._texts)
+
+
+class ArticleRecord:
+    """Article du pipeline (textes référencés par id dans le TextStore du batch)"""
+    
+    __slots__ = (
+        'article_id', 'source', 'title', 'link', 'published', 'published_ts', 'fetched_at',
+        'summary_id', 'text_id', 'body_fingerprint',
+        'relevance_score', 'scoring_version', 'score_explain', 'provisional_score',
+        'also_covered_by',
+    )
+    
+    def __init__(self, source, title, link, published='', summary_id=None, fetched_at=None):
+        self.article_id = None  # Id stable (url_identity), clé primaire en base
+        self.source = source
+        self.title = title
+        self.link = link
+        self.published = published
+        self.published_ts = None  # Epoch UTC (secondes) : int plutôt qu'un Timestamp par article
+        self.fetched_at = fetched_at
+        self.summary_id = summary_id
+        self.text_id = None
+        self.body_fingerprint = None  # SimHash hex du texte extrait (content_fingerprint)
+        self.relevance_score = None
+        self.scoring_version = None
+        self.score_explain = None
+        self.provisional_score = None
+        self.also_covered_by = None  # JSON des autres articles de la même news (dédup)
+
+
+# Colonnes exportées par to_dataframe (ordre des DataFrames historiques)
+RECORD_COLUMNS = [
+    'article_id', 'source', 'title', 'link', 'published', 'published_dt', 'summary', 'fetched_at', 'text', 'body_fingerprint',
+    'relevance_score', 'scoring_version', 'score_explain', 'provisional_score', 'also_covered_by',
+]
+
+
+class ArticleBatch:
+    """
+    Liste d'ArticleRecord + TextStore partagé
+    
+    filter / sort / head retournent un nouveau batch qui partage le même
+    TextStore (seule la liste de références est nouvelle).
+    """
+    
+    __slots__ = ('records', 'texts')
+    
+    def __init__(self, records=None, texts=None):
+        self.records = records if records is not None else []
+        self.texts = texts if texts is not None else TextStore()
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def __iter__(self):
+        return iter(self.records)
+    
+    @property
+    def empty(self):
+        return not self.records
+    
+    def add(self, source, title, link, published='', summary='', fetched_at=None):
+        """Créer un record (résumé stocké dans le TextStore) et l'ajouter"""
+        record = ArticleRecord(source, title, link, published, self.texts.add(summary), fetched_at)
+        self.records.append(record)
+        return record
+    
+    def summary(self, record):
+        return self.texts.get(record.summary_id)
+    
+    def text(self, record):
+        """Texte complet, ou résumé RSS si l'extraction a échoué"""
+        text_id = record.text_id if record.text_id is not None else record.summary_id
+        return self.texts.get(text_id)
+    
+    def set_text(self, record, text):
+        record.text_id = self.texts.add(text)
+    
+    def filter(self, predicate):
+        return ArticleBatch([r for r in self.records if predicate(r)], self.texts)
+    
+    def sort(self, key, reverse=False):
+        return ArticleBatch(sorted(self.records, key=key, reverse=reverse), self.texts)
+    
+    def head(self, n):
+        return ArticleBatch(self.records[:n], self.texts)
+    
+    @classmethod
+    def coerce(cls, articles):
+        """Batch tel quel, ou DataFrame (sortie d'étape relue d'un checkpoint) converti"""
+        return articles if isinstance(articles, cls) else cls.from_dataframe(articles)
+    
+    @classmethod
+    def from_dataframe(cls, df):
+        """Construire un batch depuis un DataFrame (colonnes manquantes → vides)"""
+        batch = cls()
+        
+        for row in df.to_dict('records'):
+            record = batch.add(
+                row.get('source', ''),
+                row.get('title', ''),
+                row.get('link', ''),
+                row.get('published', ''),
+                row.get('summary', ''),
+                row.get('fetched_at'),
+            )
+            published_dt = row.get('published_dt')
+            if published_dt is not None and published_dt == published_dt:  # NaT
+                record.published_ts = int(published_dt.timestamp())
+            if isinstance(row.get('text'), str):
+                batch.set_text(record, row['text'])
+            for column in ('article_id', 'body_fingerprint', 'relevance_score', 'scoring_version',
+                           'score_explain', 'provisional_score', 'also_covered_by'):
+                value = row.get(column)
+                if value is not None and value == value:  # NaN (colonne relue d'un checkpoint) → None
+                    setattr(record, column, value)
+        
+        return batch
+    
+    def to_dataframe(self, include_text=True, columns=None):
+        """
+        DataFrame de frontière (checkpoints, base, archive, résumés, HTML)
+        
+        Colonnes fixes, même jamais remplies (ex: scores avant scoring) :
+        le schéma ne dépend pas du contenu du run.
+        
+        Args:
+            include_text: Inclure 'summary' / 'text' (matérialisés ici seulement)
+            columns: Sous-ensemble de RECORD_COLUMNS (défaut: toutes)
+        """
+        import pandas as pd
+        
+        columns = columns or RECORD_COLUMNS
+        if not include_text:
+            columns = [c for c in columns if c not in ('summary', 'text')]
+        
+        data = {}
+        for column in columns:
+            if column == 'published_dt':
+                data[column] = pd.to_datetime([r.published_ts for r in self.records], unit='s', utc=True)
+            elif column == 'summary':
+                data[column] = [self.summary(r) for r in self.records]
+            elif column == 'text':
+                data[column] = [self.text(r) for r in self.records]
+            else:
+                data[column] = [getattr(r, column) for r in self.records]
+        
+        return pd.DataFrame(data, columns=columns)
+        
\ No newline at end of file
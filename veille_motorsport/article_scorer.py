@@ -3,211 +3,399 @@ Article Scorer v2 - Système de scoring simplifié et efficace
 Principe : FILTRAGE puis SCORING
 """
 
+import hashlib
+import json
+import os
+import pickle
+import re
+import time
+
+from .article_records import ArticleBatch
+
 # ============================================
-# ÉTAPE 1 : FILTRAGE - Sports acceptés/rejetés
+# RÈGLES DE SCORING - Fichier de données versionné
 # ============================================
 
-# Sports ACCEPTÉS (périmètre du digest)
-SPORTS_ACCEPTED = [
-    # F1 et formules monoplace
-    'formula 1', 'f1', 'formula one',
-    'formula 2', 'f2',
-    'formula 3', 'f3',
-    'super formula',
-    'f1 academy',
-    
-    # Endurance et GT
-    'wec', 'world endurance', 'le mans', 'lmp', 'hypercar',
-    'gt world challenge', 'gtwc', 'gt3', 'gt4',
-    'imsa', 'gtd', 'gtp',
-    'spa 24', 'nurburgring 24', 'bathurst 12', 'daytona 24', 'rolex 24',
-    
-    # Formule E (uniquement le terme complet pour éviter faux positifs)
-    'formula e',  # Supprimé 'fe' car trop de faux positifs
-]
+# Tables de mots-clés (sports acceptés/rejetés, gossip, niveaux 1-3, écuries,
+# constructeurs, pilotes), poids, caps et bonus : voir scoring_rules.json
+RULES_PATH = os.environ.get(
+    'SCORING_RULES_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scoring_rules.json')
+)
 
-# Sports REJETÉS (hors périmètre)
-SPORTS_REJECTED = [
-    # Rally et cross
-    'wrc', 'world rally', 'rallying', 'rally championship',
-    'dakar', 'rally raid',
-    'rallycross',
-    
-    # Moto
-    'motogp', 'moto2', 'moto3',
-    'superbike', 'sbk',
-    'vr46', 'rossi bike', 'rossi team', "rossi's vr46",
-    
-    # IndyCar et ovales US
-    'indycar', 'indy nxt', 'indy 500', 'indianapolis 500',
-    'indy lights',
-    
-    # NASCAR et US
-    'nascar', 'cup series', 'xfinity',
-    'chili bowl',
-    
-    # Karting (sauf si pilote F1/WEC mentionné dans titre)
-    'karting academy', 'karting championship', 'karting series',
-    'opens registrations for', 'karting returns',
-    
-    # Autres
-    'drag racing',
-    'drifting', 'drift championship',
-    'formula student',
-]
+# Cache disque des règles compilées (un pickle par hash de fichier de règles)
+RULES_CACHE_DIR = 'data/cache'
 
-# Mots-clés GOSSIP à rejeter (ventes, lifestyle)
-GOSSIP_REJECTED = [
-    # Ventes aux enchères
-    'heads to auction', 'auction with', 'expected to fetch',
-    'auction estimate',
-    
-    # Collectibles et jouets
-    'meccano', 'lego', 'scale model', '1:8-scale', '1:18-scale',
-    'trading card', 'memorabilia',
-    
-    # Lifestyle gossip
-    'spotted driving', 'seen driving', 'rare car',
-    'girlfriend', 'boyfriend', 'dating', 'relationship',
-    'vacation', 'holiday',
-    
-    # Fan gossip & social media drama
-    'fans lose it', 'fans deliver verdict', 'fans erupt',
-    'twitter rant', 'social media rant', 'social media erupts',
-    'describes rivals as', 'calls out', 'slams',
-    
-    # Faits divers
-    'stolen kart', 'kart recovered', 'theft',
-    'round-up:', 'news round-up',
-]
+# Intervalle min entre deux vérifications du fichier (secondes)
+RELOAD_CHECK_INTERVAL = 2.0
 
-# ============================================
-# ÉTAPE 2 : SCORING - Qualité du contenu
-# ============================================
+# Format des règles compilées : à incrémenter quand CompiledRuleSet change,
+# pour invalider les pickles en cache et la version portée par les scores
+MATCHER_FORMAT = 5
 
-# NIVEAU 1 - TECHNIQUE & PERFORMANCE (score max : +60)
-KEYWORDS_TECHNICAL = {
-    # Data & IA (poids max)
-    'artificial intelligence': 15,
-    'machine learning': 15,
-    'data analytics': 12,
-    'algorithm': 12,
-    'telemetry': 10,
-    'simulation': 10,
-    'predictive': 10,
-    
-    # Technique pure
-    'aerodynamics': 10,
-    'aero': 8,
-    'downforce': 10,
-    'drag': 8,
-    'ground effect': 10,
-    'suspension': 8,
-    'power unit': 10,
-    'hybrid': 8,
-    'ers': 10,
-    'drs': 8,
-    'tire compound': 10,
-    'tire strategy': 8,
-    'cooling': 8,
-    'reliability': 8,
-    'lap time': 8,
-    'pace': 6,
-    'performance': 6,
-    'development': 6,
-    'testing': 6,
-}
+# Découpage en mots sur texte en minuscules (chiffres + lettres latines accentuées)
+_WORD_RE = re.compile(r'[0-9a-z\u00df-\u00f6\u00f8-\u00ff\u0100-\u017f]+')
+# Mot-clé avec ponctuation ('round-up:', 'e-fuel') : matché tel quel, pas découpé
+_LITERAL_RE = re.compile(r'[^0-9a-z\u00df-\u00f6\u00f8-\u00ff\u0100-\u017f ]')
 
-# NIVEAU 2 - BUSINESS & ÉCURIES (score max : +40)
-KEYWORDS_BUSINESS = {
-    # Partenariats et business
-    'partnership': 10,
-    'sponsor': 8,
-    'technical partnership': 12,
-    'deal': 8,
-    'contract': 6,
-    'investment': 10,
-    'funding': 10,
-    'acquisition': 10,
-    
-    # Management et stratégie
-    'team principal': 8,
-    'technical director': 8,
-    'ceo': 8,
-    'strategy': 8,
-    'recruitment': 6,
-    'hiring': 6,
-    
-    # Règlements et innovation
-    'regulation': 8,
-    'technical directive': 10,
-    'efuel': 10,
-    'e-fuel': 10,
-    'sustainability': 8,
-    'carbon neutral': 8,
+# Tables de mots-clés du fichier de règles
+KEYWORD_TABLES = [
+    'sports_accepted', 'sports_rejected', 'gossip_rejected',
+    'rejection_override_keywords',
+    'keywords_technical', 'keywords_business', 'keywords_general',
+    'teams_f1', 'teams_wec_gt', 'constructeurs', 'pilotes_majeurs',
+    'endurance_keywords',
+]
+
+# Noms historiques des tables -> clé dans scoring_rules.json
+LEGACY_TABLES = {
+    'SPORTS_ACCEPTED': 'sports_accepted',
+    'SPORTS_REJECTED': 'sports_rejected',
+    'GOSSIP_REJECTED': 'gossip_rejected',
+    'KEYWORDS_TECHNICAL': 'keywords_technical',
+    'KEYWORDS_BUSINESS': 'keywords_business',
+    'KEYWORDS_GENERAL': 'keywords_general',
+    'TEAMS_F1': 'teams_f1',
+    'TEAMS_WEC_GT': 'teams_wec_gt',
+    'CONSTRUCTEURS': 'constructeurs',
+    'PILOTES_MAJEURS': 'pilotes_majeurs',
 }
 
-# NIVEAU 3 - ACTUALITÉS GÉNÉRALES (score max : +20)
-KEYWORDS_GENERAL = {
-    # Design et branding
-    'livery': 6,
-    'design': 5,
-    'branding': 5,
-    
-    # Pilotes et transferts
-    'driver': 4,
-    'signs': 5,
-    'announces': 5,
-    'confirms': 5,
-    
-    # Course
-    'race': 3,
-    'championship': 4,
-    'podium': 3,
-    'victory': 3,
+# État du dernier chargement (chemin, signature fichier, règles compilées)
+_rules_state = {
+    'path': None,
+    'signature': None,
+    'checked_at': 0.0,
+    'ruleset': None,
 }
 
-# ÉCURIES - Liste complète pour détection
-TEAMS_F1 = [
-    'mercedes', 'ferrari', 'red bull', 'mclaren', 'alpine',
-    'aston martin', 'williams', 'haas', 'sauber', 'stake',
-    'racing bulls', 'rb', 'visa rb', 'cadillac',
-]
 
-TEAMS_WEC_GT = [
-    'toyota', 'ferrari', 'porsche', 'cadillac', 'bmw',
-    'peugeot', 'alpine', 'lamborghini', 'aston martin',
-    'corvette', 'ford',
-]
+def _flatten_keywords(table):
+    """
+    Aplatir une table groupée du fichier de règles
+    
+    {'groupe': [kw, ...]} -> [kw, ...] ; {'groupe': {kw: pts}} -> {kw: pts}
+    """
+    if isinstance(table, list):
+        return [kw.lower() for kw in table]
+    
+    values = list(table.values())
+    if values and all(isinstance(v, (int, float)) for v in values):
+        return {kw.lower(): points for kw, points in table.items()}
+    
+    if values and all(isinstance(v, dict) for v in values):
+        merged = {}
+        for group in values:
+            merged.update(_flatten_keywords(group))
+        return merged
+    
+    merged = []
+    for group in values:
+        merged.extend(_flatten_keywords(group))
+    return merged
 
-# CONSTRUCTEURS - Tous les constructeurs majeurs
-CONSTRUCTEURS = [
-    'mercedes', 'ferrari', 'red bull', 'honda', 'renault',
-    'toyota', 'porsche', 'bmw', 'audi', 'lamborghini',
-    'mclaren', 'aston martin', 'ford', 'chevrolet', 'cadillac',
-]
 
-# PILOTES MAJEURS - Top pilotes à suivre
-PILOTES_MAJEURS = [
-    # F1 actuels
-    'verstappen', 'hamilton', 'leclerc', 'norris', 'sainz',
-    'russell', 'alonso', 'piastri', 'perez', 'gasly',
+def tokenize(text):
+    """Découper un texte en mots minuscules (limites de mots pour le matching)"""
+    return _WORD_RE.findall(text.lower())
+
+
+def _plural_forms(word):
+    """Formes acceptées pour le dernier mot d'un mot-clé (pluriels anglais simples)"""
+    if len(word) < 3 or not word.isalpha():
+        return (word,)
+    
+    forms = [word, word + 's']
+    if word.endswith(('s', 'x', 'ch', 'sh')):
+        forms.append(word + 'es')
+    elif word.endswith('y') and word[-2] not in 'aeiou':
+        forms.append(word[:-1] + 'ies')
+    
+    return tuple(forms)
+
+
+class CompiledRuleSet:
+    """
+    Règles de scoring compilées (version + hash + index de phrases)
+    
+    Chaque mot-clé unique reçoit un id ; les tables deviennent des ensembles
+    d'ids et des poids par id. Le texte est découpé en mots puis parcouru une
+    seule fois (`match`) : les mots-clés respectent les limites de mots
+    ('rb' ne matche plus 'carbon', 'ers' plus 'drivers'). Comme avec l'ancien
+    matching par sous-chaînes, chaque mot-clé est cherché à chaque position :
+    'technical director' déclenche aussi 'technical', 'tire strategy' aussi
+    'strategy'. Exception dans la table des sports acceptés : une phrase plus
+    longue de la même table couvre les mots d'un mot-clé plus court ('f1
+    academy' ne déclenche pas 'f1'). Les mots-clés avec ponctuation
+    ('round-up:') restent matchés tels quels dans le texte (`match_text`).
+    
+    Picklable : mise en cache disque par hash du fichier de règles.
+    """
     
-    # F1 légendes/experts
-    'newey', 'adrian newey', 'horner', 'wolff', 'binotto',
-    'vasseur',
+    def __init__(self, raw_rules, rules_hash):
+        self.version = str(raw_rules.get('version', 0))
+        self.rules_hash = rules_hash
+        # Version portée par chaque score : version déclarée + hash du contenu
+        self.scoring_version = f"{self.version}-{rules_hash[:8]}"
+        
+        self.rules = {key: _flatten_keywords(raw_rules.get(key, [])) for key in KEYWORD_TABLES}
+        self.caps = dict(raw_rules.get('caps', {}))
+        self.bonus = dict(raw_rules.get('bonus', {}))
+        self.long_article_chars = raw_rules.get('long_article_chars', 1500)
+        
+        keyword_ids = {}
+        for key in KEYWORD_TABLES:
+            for keyword in self.rules[key]:
+                keyword_ids.setdefault(keyword, len(keyword_ids))
+        
+        self.keywords = tuple(keyword_ids)
+        
+        def ids(key):
+            return frozenset(keyword_ids[kw] for kw in self.rules[key])
+        
+        def weights(key):
+            return {keyword_ids[kw]: points for kw, points in self.rules[key].items()}
+        
+        self.sports_accepted = ids('sports_accepted')
+        self.sports_rejected = ids('sports_rejected')
+        self.gossip_rejected = ids('gossip_rejected')
+        self.rejection_override = ids('rejection_override_keywords')
+        self.teams = ids('teams_f1') | ids('teams_wec_gt')
+        self.pilotes = ids('pilotes_majeurs')
+        self.constructeurs = ids('constructeurs')
+        self.endurance = ids('endurance_keywords')
+        self.technical = weights('keywords_technical')
+        self.business = weights('keywords_business')
+        self.general = weights('keywords_general')
+        # Points par mot-clé tous niveaux confondus (explications de score)
+        self.points = {**self.general, **self.business, **self.technical}
+        
+        self._build_phrase_index(keyword_ids)
+    
+    def _build_phrase_index(self, keyword_ids):
+        """
+        Indexer les mots-clés découpés en mots (+ pluriels simples du dernier mot)
+        
+        - single_words : {mot: ids} pour les mots qui n'apparaissent dans
+          aucune phrase multi-mots → résolus par intersection d'ensembles
+        - phrase_starts : {premier mot: ((longueur, phrase, ids, couverts,
+          couvrables), ...)} pour les mots qui font partie d'une phrase, du
+          plus long au plus court ; couverts = ids des sports acceptés plus
+          courts contenus dans la phrase, couvrables = ids de l'entrée qui
+          peuvent l'être
+        - literals : ((mot-clé, ids), ...) des mots-clés avec ponctuation
+        """
+        variants = {}
+        literals = {}
+        for keyword, idx in keyword_ids.items():
+            if _LITERAL_RE.search(keyword):
+                literals.setdefault(keyword, set()).add(idx)
+                continue
+            words = tuple(tokenize(keyword))
+            if not words:
+                continue
+            for last in _plural_forms(words[-1]):
+                variants.setdefault(words[:-1] + (last,), set()).add(idx)
+        
+        phrase_words = {word for phrase in variants if len(phrase) > 1 for word in phrase}
+        
+        # Sports acceptés couvrables : seulement dans cette table (les autres tables
+        # gardent le matching à chaque position)
+        other_tables = set()
+        for key in KEYWORD_TABLES:
+            if key != 'sports_accepted':
+                other_tables.update(keyword_ids[kw] for kw in self.rules[key])
+        sport_variants = {
+            phrase: (phrase_ids & self.sports_accepted) - other_tables
+            for phrase, phrase_ids in variants.items()
+        }
+        
+        def covered_by(phrase, phrase_ids):
+            """Ids de sports acceptés plus courts dont les mots sont contenus dans la phrase"""
+            if not phrase_ids & self.sports_accepted:
+                return frozenset()
+            covered = set()
+            for shorter, shorter_ids in sport_variants.items():
+                n = len(shorter)
+                if shorter_ids and n < len(phrase) and any(
+                    phrase[i:i + n] == shorter for i in range(len(phrase) - n + 1)
+                ):
+                    covered |= shorter_ids
+            return frozenset(covered)
+        
+        single_words = {}
+        phrase_starts = {}
+        for phrase, phrase_ids in variants.items():
+            if len(phrase) == 1 and phrase[0] not in phrase_words:
+                single_words[phrase[0]] = frozenset(phrase_ids)
+            else:
+                phrase_starts.setdefault(phrase[0], []).append((
+                    len(phrase), phrase, frozenset(phrase_ids),
+                    covered_by(phrase, phrase_ids), frozenset(sport_variants[phrase]),
+                ))
+        
+        self.literals = tuple((keyword, frozenset(ids)) for keyword, ids in literals.items())
+        self.single_words = single_words
+        self.single_word_set = frozenset(single_words)
+        self.phrase_words = frozenset(phrase_words)
+        self.phrase_starts = {
+            word: tuple(sorted(candidates, key=lambda c: -c[0]))
+            for word, candidates in phrase_starts.items()
+        }
+    
+    def match(self, words, fired=None):
+        """
+        Ids des mots-clés présents dans une liste de mots (un seul parcours)
+        
+        Args:
+            words: Mots en minuscules (tokenize)
+            fired: Set à compléter (optionnel)
+        
+        Returns:
+            Set d'ids de mots-clés
+        """
+        if fired is None:
+            fired = set()
+        
+        word_set = set(words)
+        
+        # Mots isolés : intersection d'ensembles (C)
+        for word in self.single_word_set.intersection(word_set):
+            fired |= self.single_words[word]
+        
+        # Mots qui participent à une phrase : toutes les phrases à chaque position
+        phrase_words = self.phrase_words
+        if phrase_words.isdisjoint(word_set):
+            return fired
+        phrase_starts = self.phrase_starts
+        covered_until = {}  # id de sport accepté -> fin de la plus longue phrase qui le couvre
+        
+        for i, word in enumerate(words):
+            if word not in phrase_words:
+                continue
+            for length, phrase, phrase_ids, covers, coverable in phrase_starts.get(word, ()):
+                if length == 1 or tuple(words[i:i + length]) == phrase:
+                    end = i + length
+                    for idx in covers:
+                        covered_until[idx] = max(covered_until.get(idx, 0), end)
+                    if coverable:
+                        phrase_ids = phrase_ids - {idx for idx in coverable if covered_until.get(idx, 0) >= end}
+                    fired |= phrase_ids
+        
+        return fired
+    
+    def match_text(self, text, fired=None):
+        """match() sur un texte brut, mots-clés avec ponctuation compris"""
+        lowered = text.lower()
+        fired = self.match(_WORD_RE.findall(lowered), fired)
+        
+        for keyword, keyword_ids in self.literals:
+            if keyword in lowered:
+                fired |= keyword_ids
+        
+        return fired
+
+
+def _compile_rules(raw_bytes, rules_hash):
+    """
+    Compiler les règles, via le cache pickle si le même fichier a déjà été compilé
     
-    # WEC/Endurance
-    'kobayashi', 'buemi', 'hartley', 'conway',
-    'pier guidi', 'calado', 'molina',
-]
+    Returns:
+        CompiledRuleSet
+    """
+    cache_path = os.path.join(RULES_CACHE_DIR, f'scoring_rules-{rules_hash[:16]}.pkl')
+    
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                ruleset = pickle.load(f)
+            if isinstance(ruleset, CompiledRuleSet) and ruleset.rules_hash == rules_hash:
+                return ruleset
+        except Exception:
+            pass  # Cache illisible (classe modifiée...) → recompiler
+    
+    ruleset = CompiledRuleSet(json.loads(raw_bytes), rules_hash)
+    
+    try:
+        os.makedirs(RULES_CACHE_DIR, exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(ruleset, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache optionnel (dossier en lecture seule...)
+    
+    return ruleset
+
+
+def load_scoring_rules(path=None, force=False):
+    """
+    Charger les règles de scoring (rechargées si le fichier a changé)
+    
+    Le fichier n'est relu que si sa signature (mtime, taille) change ; il
+    n'est recompilé que si son contenu (hash) n'est pas déjà en cache disque.
+    Un process longue durée récupère ainsi les nouveaux poids sans réimport.
+    
+    Args:
+        path: Chemin fichier règles (défaut: RULES_PATH)
+        force: Relire même si le fichier n'a pas changé
+    
+    Returns:
+        CompiledRuleSet
+    """
+    path = path or RULES_PATH
+    now = time.monotonic()
+    
+    if (not force and _rules_state['path'] == path
+            and now - _rules_state['checked_at'] < RELOAD_CHECK_INTERVAL):
+        return _rules_state['ruleset']
+    
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    _rules_state['checked_at'] = now
+    
+    if not force and _rules_state['path'] == path and _rules_state['signature'] == signature:
+        return _rules_state['ruleset']
+    
+    with open(path, 'rb') as f:
+        raw_bytes = f.read()
+    
+    rules_hash = hashlib.sha256(f'matcher-{MATCHER_FORMAT}\n'.encode() + raw_bytes).hexdigest()
+    previous = _rules_state['ruleset']
+    
+    if previous is None or previous.rules_hash != rules_hash:
+        ruleset = _compile_rules(raw_bytes, rules_hash)
+        if previous is not None:
+            print(f"🔄 Scoring rules reloaded from {path} (version {ruleset.scoring_version})")
+    else:
+        ruleset = previous  # Fichier touché mais contenu identique
+    
+    _rules_state.update({
+        'path': path,
+        'signature': signature,
+        'ruleset': ruleset,
+    })
+    
+    return ruleset
+
+
+def get_scoring_version():
+    """Version des règles actives (stockée avec chaque score)"""
+    return load_scoring_rules().scoring_version
+
+
+def __getattr__(name):
+    """Compatibilité : SPORTS_ACCEPTED, KEYWORDS_TECHNICAL... lus depuis le fichier"""
+    if name in LEGACY_TABLES:
+        return load_scoring_rules().rules[LEGACY_TABLES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================
 # FONCTION DE SCORING
 # ============================================
 
-def score_article_v2(article_text, article_title, source=''):
+def score_article_v2(article_text, article_title, source='', explain=False, rules=None):
     """
     Scorer un article selon le nouveau système simplifié
     
@@ -219,104 +407,286 @@ def score_article_v2(article_text, article_title, source=''):
         article_text: Contenu article
         article_title: Titre
         source: Source (optionnel)
+        explain: Retourner aussi le détail du score (même passe, pas de re-scan)
+        rules: CompiledRuleSet à utiliser (défaut: règles actives, RULES_PATH)
     
     Returns:
-        Score 0-100
+        Score 0-100, ou (score, explication) si explain=True
+        
+        L'explication est un vecteur creux : liste de paires (composante,
+        valeur) limitée aux composantes présentes, ex.
+        [('kw:drag', 8), ('kw:f1', 0), ('tier:technical', 8),
+         ('bonus:title_sport', 10)] ou [('kw:motogp', 0), ('reject:sports_rejected', 1)]
+        Composantes : kw:<mot-clé> (points, 0 = sport/écurie/rejet), tier:<niveau> (somme brute),
+        cap:<niveau|total> (points retirés par le plafond), bonus:<nom>, reject:<règle>.
     """
     
-    # Combiner titre + texte (titre compte 2x)
-    text_full = f"{article_title} {article_title} {article_text}".lower()
-    title_lower = article_title.lower()
+    rules = rules or load_scoring_rules()
+    
+    # Un seul parcours des mots du titre puis du texte
+    title_fired = rules.match_text(article_title)
+    fired = rules.match_text(article_text, set(title_fired))
+    
+    return score_matches(rules, fired, title_fired, article_text, explain)
+
+
+def score_matches(rules, fired, title_fired, article_text, explain=False):
+    """
+    Score depuis les mots-clés déjà matchés (voir score_article_v2)
+    
+    Args:
+        rules: CompiledRuleSet
+        fired: Ids des mots-clés du titre + texte
+        title_fired: Ids des mots-clés du titre (bonus title_sport)
+        article_text: Contenu article (bonus long_article)
+    """
+    caps = rules.caps
+    bonus = rules.bonus
+    
+    explanation = None
+    if explain:
+        keywords = rules.keywords
+        points = rules.points
+        explanation = [(f'kw:{keywords[i]}', points.get(i, 0)) for i in sorted(fired)]
     
     # ============================================
     # ÉTAPE 1 : FILTRAGE BINAIRE
     # ============================================
     
-    # 1A. Vérifier sports REJETÉS → Score 0 immédiat
-    for sport_rejected in SPORTS_REJECTED:
-        if sport_rejected in text_full:
-            # Exception : Si article mentionne aussi sport accepté ET contexte technique
-            has_accepted_sport = any(sport in text_full for sport in SPORTS_ACCEPTED)
-            has_technical = any(kw in text_full for kw in ['partnership', 'technical', 'development'])
-            
-            if not (has_accepted_sport and has_technical):
-                return 0  # REJET
-    
-    # 1B. Vérifier GOSSIP rejeté → Score 0 immédiat
-    for gossip in GOSSIP_REJECTED:
-        if gossip in text_full:
-            return 0  # REJET
-    
-    # 1C. Vérifier au moins UN sport accepté présent
-    has_relevant_sport = any(sport in text_full for sport in SPORTS_ACCEPTED)
-    if not has_relevant_sport:
-        # Pas de sport explicite mais peut-être écurie F1/WEC ?
-        has_team = any(team in text_full for team in TEAMS_F1 + TEAMS_WEC_GT)
-        if not has_team:
-            return 0  # REJET (aucun sport pertinent détecté)
+    rejected_by = None
+    
+    # 1A. Sports REJETÉS → Score 0 immédiat
+    # Exception : Si article mentionne aussi sport accepté ET contexte technique
+    if fired & rules.sports_rejected:
+        if not (fired & rules.sports_accepted and fired & rules.rejection_override):
+            rejected_by = 'sports_rejected'
+    
+    # 1B. GOSSIP rejeté → Score 0 immédiat
+    if rejected_by is None and fired & rules.gossip_rejected:
+        rejected_by = 'gossip_rejected'
+    
+    # 1C. Au moins UN sport accepté (ou une écurie F1/WEC) présent
+    if rejected_by is None and not (fired & rules.sports_accepted or fired & rules.teams):
+        rejected_by = 'no_accepted_sport'
+    
+    if rejected_by is not None:
+        if explain:
+            explanation.append((f'reject:{rejected_by}', 1))
+            return 0, explanation
+        return 0  # REJET
     
     # ============================================
     # ÉTAPE 2 : SCORING QUALITÉ
     # ============================================
     
-    score = 0
-    
     # NIVEAU 1 : Technique & Performance (max 60 pts)
-    for keyword, points in KEYWORDS_TECHNICAL.items():
-        if keyword in text_full:
-            score += points
-    
-    # Cap niveau 1
-    score = min(score, 60)
+    technical = rules.technical
+    technical_points = sum(technical[i] for i in fired if i in technical)
     
     # NIVEAU 2 : Business & Écuries (max +40 pts)
-    business_score = 0
-    for keyword, points in KEYWORDS_BUSINESS.items():
-        if keyword in text_full:
-            business_score += points
-    
-    business_score = min(business_score, 40)
-    score += business_score
+    business = rules.business
+    business_points = sum(business[i] for i in fired if i in business)
     
     # NIVEAU 3 : Actualités générales (max +20 pts)
-    general_score = 0
-    for keyword, points in KEYWORDS_GENERAL.items():
-        if keyword in text_full:
-            general_score += points
+    general = rules.general
+    general_points = sum(general[i] for i in fired if i in general)
     
-    general_score = min(general_score, 20)
-    score += general_score
+    score = (min(technical_points, caps['technical'])
+             + min(business_points, caps['business'])
+             + min(general_points, caps['general']))
     
-    # BONUS : Pilotes/constructeurs majeurs (+5 pts)
-    if any(pilote in text_full for pilote in PILOTES_MAJEURS):
-        score += 5
+    bonuses = []
     
-    if any(constructeur in text_full for constructeur in CONSTRUCTEURS):
-        score += 3
+    # BONUS : Pilotes/constructeurs majeurs
+    if fired & rules.pilotes:
+        bonuses.append('pilote_majeur')
     
-    # BONUS : Titre contient sport accepté (+10 pts)
-    if any(sport in title_lower for sport in SPORTS_ACCEPTED):
-        score += 10
+    if fired & rules.constructeurs:
+        bonuses.append('constructeur')
     
-    # BONUS : WEC/Endurance/GT explicite (+30 pts car moins couvert que F1)
-    endurance_keywords = ['wec', 'le mans', 'hypercar', 'lmp', 'imsa', 'gt3', 'gt4', 'gtwc']
-    if any(kw in text_full for kw in endurance_keywords):
-        score += 30
+    # BONUS : Titre contient sport accepté
+    if title_fired & rules.sports_accepted:
+        bonuses.append('title_sport')
     
-    # BONUS : Article long = plus de substance (+5 pts)
-    if len(article_text) > 1500:
-        score += 5
+    # BONUS : WEC/Endurance/GT explicite (moins couvert que F1)
+    if fired & rules.endurance:
+        bonuses.append('endurance')
     
-    # Cap final
-    score = min(score, 100)
+    # BONUS : Article long = plus de substance
+    if len(article_text) > rules.long_article_chars:
+        bonuses.append('long_article')
     
-    return score
+    for name in bonuses:
+        score += bonus[name]
+    
+    # Cap final
+    capped_score = min(score, caps['total'])
+    
+    if explain:
+        for tier, tier_points in (('technical', technical_points),
+                                  ('business', business_points),
+                                  ('general', general_points)):
+            if tier_points:
+                explanation.append((f'tier:{tier}', tier_points))
+            if tier_points > caps[tier]:
+                explanation.append((f'cap:{tier}', tier_points - caps[tier]))
+        explanation.extend((f'bonus:{name}', bonus[name]) for name in bonuses)
+        if score > capped_score:
+            explanation.append(('cap:total', score - capped_score))
+        return capped_score, explanation
+    
+    return capped_score
 
 
 # ============================================
 # FONCTION DE RANKING (compatible avec ancien code)
 # ============================================
 
+def serialize_explanation(explanation):
+    """Explication de score → JSON compact (colonne score_explain)"""
+    return json.dumps(explanation, ensure_ascii=False, separators=(',', ':'))
+
+
+def _score_rows(articles_df):
+    """
+    Scorer les lignes d'un DataFrame (score + explication JSON en une passe)
+    
+    Returns:
+        (liste de scores, liste d'explications sérialisées pour la base)
+    """
+    scores = []
+    explanations = []
+    
+    for title, text, source in zip(
+        articles_df['title'] if 'title' in articles_df.columns else [''] * len(articles_df),
+        articles_df['text'] if 'text' in articles_df.columns else [''] * len(articles_df),
+        articles_df['source'] if 'source' in articles_df.columns else [''] * len(articles_df),
+    ):
+        score, explanation = score_article_v2(
+            text if isinstance(text, str) else '',
+            title if isinstance(title, str) else '',
+            source,
+            explain=True
+        )
+        scores.append(score)
+        explanations.append(serialize_explanation(explanation))
+    
+    return scores, explanations
+
+
+# Règles de rejet fiables dès le titre + résumé RSS (pas besoin du texte complet)
+TRIAGE_REJECTIONS = ('sports_rejected', 'gossip_rejected')
+
+
+def _triage_one(title, summary):
+    """Score provisoire (titre + résumé) et règle de rejet triage ('' si gardé)"""
+    score, explanation = score_article_v2(
+        summary if isinstance(summary, str) else '',
+        title if isinstance(title, str) else '',
+        explain=True
+    )
+    reject = explanation[-1][0].partition(':')[2] if score == 0 and explanation else ''
+    return score, (reject if reject in TRIAGE_REJECTIONS else '')
+
+
+def triage_records(batch):
+    """
+    triage_articles pour un ArticleBatch (renseigne record.provisional_score)
+    
+    Returns:
+        (batch candidats triés par score provisoire décroissant, batch rejetés)
+    """
+    candidates = []
+    rejected = []
+    
+    for record in batch:
+        record.provisional_score, reject = _triage_one(record.title, batch.summary(record))
+        (rejected if reject else candidates).append(record)
+    
+    # sort() est stable : à score égal, l'ordre d'origine (date) est conservé
+    candidates.sort(key=lambda record: record.provisional_score, reverse=True)
+    
+    return ArticleBatch(candidates, batch.texts), ArticleBatch(rejected, batch.texts)
+
+
+def triage_articles(articles_df):
+    """
+    Tri avant extraction : scorer sur titre + résumé RSS uniquement
+    
+    Les articles clairement hors périmètre (sport rejeté, gossip) ne sont pas
+    téléchargés ; les autres sont classés par score provisoire pour dépenser
+    le budget d'extraction sur les meilleurs candidats. L'absence de sport
+    accepté n'est pas un rejet ici : le résumé RSS est souvent trop court.
+    
+    Args:
+        articles_df: DataFrame RSS (title, summary, link)
+    
+    Returns:
+        (candidats triés par 'provisional_score' décroissant, rejetés avec 'triage_reject')
+    """
+    
+    provisional_scores = []
+    rejections = []
+    
+    for title, summary in zip(articles_df['title'], articles_df['summary']):
+        score, reject = _triage_one(title, summary)
+        provisional_scores.append(score)
+        rejections.append(reject)
+    
+    triaged_df = articles_df.assign(provisional_score=provisional_scores, triage_reject=rejections)
+    rejected = triaged_df['triage_reject'] != ''
+    
+    # Tri stable : à score égal, l'ordre d'origine (date) est conservé
+    candidates_df = triaged_df[~rejected].sort_values('provisional_score', ascending=False, kind='mergesort')
+    
+    return candidates_df, triaged_df[rejected]
+
+
+def _print_score_stats(scores):
+    """Statistiques de scoring (liste de scores)"""
+    import statistics
+    
+    print(f"📊 Scoring statistics (v2):")
+    print(f"  • Mean score: {statistics.fmean(scores):.1f}")
+    print(f"  • Median score: {statistics.median(scores):.1f}")
+    print(f"  • Max score: {max(scores):.0f}")
+    print(f"  • Articles > 50: {sum(1 for score in scores if score > 50)}")
+    print(f"  • Articles > 30: {sum(1 for score in scores if score > 30)}")
+    print(f"  • Articles REJECTED (score 0): {sum(1 for score in scores if score == 0)}\n")
+
+
+def rank_records(batch):
+    """
+    rank_articles pour un ArticleBatch : score, explication et version
+    stockés sur chaque record (textes lus dans le TextStore, pas de copie)
+    
+    Returns:
+        ArticleBatch trié par score décroissant
+    """
+    
+    if batch.empty:
+        print("⚠️  No articles to rank")
+        return batch
+    
+    version = get_scoring_version()
+    print(f"🎯 Scoring article relevance (v2 - rules {version})...\n")
+    
+    # Explications identiques (rejets, mêmes mots-clés) : une seule chaîne partagée
+    explanations = {}
+    
+    for record in batch:
+        score, explanation = score_article_v2(batch.text(record), record.title or '', record.source, explain=True)
+        serialized = serialize_explanation(explanation)
+        record.relevance_score = score
+        record.score_explain = explanations.setdefault(serialized, serialized)
+        record.scoring_version = version
+    
+    ranked = batch.sort(key=lambda record: record.relevance_score, reverse=True)
+    _print_score_stats([record.relevance_score for record in ranked])
+    
+    return ranked
+
+
 def rank_articles(articles_df):
     """
     Classer articles avec nouveau scorer v2
@@ -327,29 +697,16 @@ def rank_articles(articles_df):
         print("⚠️  No articles to rank")
         return articles_df
     
-    print("🎯 Scoring article relevance (v2 - simplified)...\n")
+    print(f"🎯 Scoring article relevance (v2 - rules {get_scoring_version()})...\n")
     
-    # Calculer scores
-    articles_df['relevance_score'] = articles_df.apply(
-        lambda row: score_article_v2(
-            row.get('text', ''),
-            row.get('title', ''),
-            row.get('source', '')
-        ),
-        axis=1
-    )
+    # Calculer scores + explications (+ version des règles utilisées)
+    articles_df['relevance_score'], articles_df['score_explain'] = _score_rows(articles_df)
+    articles_df['scoring_version'] = get_scoring_version()
     
     # Trier
     ranked = articles_df.sort_values('relevance_score', ascending=False)
     
-    # Stats
-    print(f"📊 Scoring statistics (v2):")
-    print(f"  • Mean score: {ranked['relevance_score'].mean():.1f}")
-    print(f"  • Median score: {ranked['relevance_score'].median():.1f}")
-    print(f"  • Max score: {ranked['relevance_score'].max():.0f}")
-    print(f"  • Articles > 50: {(ranked['relevance_score'] > 50).sum()}")
-    print(f"  • Articles > 30: {(ranked['relevance_score'] > 30).sum()}")
-    print(f"  • Articles REJECTED (score 0): {(ranked['relevance_score'] == 0).sum()}\n")
+    _print_score_stats(ranked['relevance_score'].tolist())
     
     return ranked
 
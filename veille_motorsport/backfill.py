@@ -0,0 +1,211 @@
+"""
+Backfill Module
+Re-scoring de tout l'historique de la base sur plusieurs cœurs
+
+Après un changement de scoring_rules.json, `rank_articles` (DataFrame.apply,
+un seul cœur) est trop lent sur une année d'articles. Ici la table est lue
+par tranches de rowid, seuls (id, titre, texte) partent vers les workers
+d'un ProcessPoolExecutor, et les scores reviennent en UPDATE groupés.
+
+Usage:
+    python -m veille_motorsport.backfill                 # articles à re-scorer
+    python -m veille_motorsport.backfill --all --workers 8
+"""
+
+import os
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .article_scorer import load_scoring_rules, score_article_v2, serialize_explanation
+
+DB_PATH = 'data/veille_motorsport.db'
+
+# Colonnes écrites par le scoring (ajoutées si la base est plus ancienne)
+SCORE_COLUMNS = {
+    'relevance_score': 'INTEGER',
+    'scoring_version': 'TEXT',
+    'score_explain': 'TEXT',
+}
+
+# Règles du backfill dans le process courant (fixées par _init_worker)
+_worker_state = {'rules': None}
+
+
+def _init_worker(rules_path):
+    """Charger les règles une fois par process worker"""
+    _worker_state['rules'] = load_scoring_rules(rules_path, force=True)
+
+
+def _score_chunk(rows):
+    """
+    Scorer une tranche d'articles (exécuté dans un worker)
+    
+    Args:
+        rows: Liste de (rowid, titre, texte)
+    
+    Returns:
+        Liste de (score, explication JSON, version, rowid) prête pour executemany
+    """
+    rules = _worker_state['rules']
+    version = rules.scoring_version
+    results = []
+    
+    for rowid, title, text in rows:
+        score, explanation = score_article_v2(text or '', title or '', explain=True, rules=rules)
+        results.append((score, serialize_explanation(explanation), version, rowid))
+    
+    return results
+
+
+def _ensure_score_columns(conn):
+    """Ajouter les colonnes de scoring manquantes à la table articles"""
+    existing = {column[1] for column in conn.execute("PRAGMA table_info(articles)")}
+    
+    for column, column_type in SCORE_COLUMNS.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE articles ADD COLUMN {column} {column_type}")
+    
+    conn.commit()
+
+
+def _iter_chunks(conn, rowids, chunk_size, version):
+    """Lire (rowid, titre, texte) par tranches de rowid consécutifs"""
+    for start in range(0, len(rowids), chunk_size):
+        batch = rowids[start:start + chunk_size]
+        yield conn.execute(
+            """
+            SELECT rowid, title, text FROM articles
+            WHERE rowid BETWEEN ? AND ? AND scoring_version IS NOT ?
+            """,
+            (batch[0], batch[-1], version)
+        ).fetchall()
+
+
+def backfill_scores(db_path=DB_PATH, workers=None, chunk_size=500, rescore_all=False, rules_path=None):
+    """
+    Re-scorer les articles de la base en parallèle
+    
+    Args:
+        db_path: Base SQLite (table articles)
+        workers: Nombre de process (défaut: nombre de cœurs)
+        chunk_size: Articles par tranche envoyée à un worker
+        rescore_all: Re-scorer aussi les articles déjà à la version courante
+        rules_path: Fichier de règles (défaut: RULES_PATH)
+    
+    Returns:
+        Dict de stats (articles, secondes, articles/s, articles/s/cœur)
+    """
+    
+    workers = workers or os.cpu_count() or 1
+    version = load_scoring_rules(rules_path).scoring_version
+    
+    if not os.path.exists(db_path):
+        print(f"❌ Database not found: {db_path}")
+        return {}
+    
+    conn = sqlite3.connect(db_path)
+    _ensure_score_columns(conn)
+    
+    if rescore_all:
+        conn.execute("UPDATE articles SET scoring_version = NULL")
+        conn.commit()
+    
+    rowids = [row[0] for row in conn.execute(
+        "SELECT rowid FROM articles WHERE scoring_version IS NOT ? ORDER BY rowid",
+        (version,)
+    )]
+    
+    total = len(rowids)
+    print(f"🔄 Backfill: {total} articles to score (rules {version}, {workers} workers)\n")
+    
+    if not total:
+        conn.close()
+        return {'articles': 0, 'seconds': 0.0, 'per_second': 0.0, 'per_second_per_core': 0.0}
+    
+    update_sql = "UPDATE articles SET relevance_score = ?, score_explain = ?, scoring_version = ? WHERE rowid = ?"
+    chunks = _iter_chunks(conn, rowids, chunk_size, version)
+    done = 0
+    start_time = time.perf_counter()
+    
+    def write(results):
+        conn.executemany(update_sql, results)
+        conn.commit()
+    
+    if workers == 1:
+        _init_worker(rules_path)
+        for rows in chunks:
+            write(_score_chunk(rows))
+            done += len(rows)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(rules_path,)) as executor:
+            pending = set()
+            report_every = max(total // 10, chunk_size)
+            next_report = report_every
+            
+            # Au plus 2 tranches en vol par worker : mémoire bornée sur gros historiques
+            for rows in chunks:
+                pending.add(executor.submit(_score_chunk, rows))
+                
+                if len(pending) >= workers * 2:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        results = future.result()
+                        write(results)
+                        done += len(results)
+                    if done >= next_report:
+                        print(f"  • {done}/{total} articles scored")
+                        next_report += report_every
+            
+            for future in pending:
+                results = future.result()
+                write(results)
+                done += len(results)
+    
+    conn.close()
+    
+    elapsed = time.perf_counter() - start_time
+    per_second = done / elapsed if elapsed else 0.0
+    stats = {
+        'articles': done,
+        'seconds': elapsed,
+        'per_second': per_second,
+        'per_second_per_core': per_second / workers,
+    }
+    
+    print()
+    print(f"✅ Backfill complete: {done} articles in {elapsed:.1f}s")
+    print(f"  • {per_second:.0f} articles/s ({stats['per_second_per_core']:.0f} articles/s/core)\n")
+    
+    return stats
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """Point d'entrée CLI"""
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Re-score stored articles on all cores')
+    parser.add_argument('--db', default=DB_PATH, help=f'SQLite database (default: {DB_PATH})')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Articles per worker task (default: 500)')
+    parser.add_argument('--all', action='store_true', help='Re-score every article, not only outdated ones')
+    parser.add_argument('--rules', default=None, help='Scoring rules file (default: SCORING_RULES_PATH)')
+    args = parser.parse_args()
+    
+    backfill_scores(
+        db_path=args.db,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        rescore_all=args.all,
+        rules_path=args.rules
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,7 @@ Bilingual Summarizer - Extension pour ai_summarizer.py
 Génère résumés FR + EN en une seule passe
 """
 
-import anthropic
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 def summarize_article_bilingual(article_text, article_title, article_url):
@@ -23,6 +19,11 @@ def summarize_article_bilingual(article_text, article_title, article_url):
         Dict {'summary_fr': str, 'summary_en': str}
     """
     
+    import anthropic
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    
     api_key = os.getenv('ANTHROPIC_API_KEY')
     if not api_key:
         print("❌ ANTHROPIC_API_KEY not found in environment")
@@ -206,6 +207,7 @@ def summarize_batch_bilingual(articles_df, max_articles=20, delay=2):
                     'score': row.get('relevance_score', 0),
                     'source': row.get('source', ''),
                     'published': row.get('published', ''),
+                    'also_covered_by': row.get('also_covered_by'),
                     'summarized_at': datetime.now().isoformat()
                 })
                 
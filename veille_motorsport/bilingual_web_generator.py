@@ -4,6 +4,22 @@ GÃ©nÃ¨re page HTML avec sÃ©lecteur FR/EN
 """
 
 from datetime import datetime
+import html as html_lib
+import json
+
+
+def _also_covered_html(also_covered_by):
+    """Liens "aussi couvert par" (JSON de la dédup), '' si article seul"""
+    if not isinstance(also_covered_by, str) or not also_covered_by:
+        return ''
+    
+    links = ', '.join(
+        f'<a href="{html_lib.escape(item.get("link") or "#")}" target="_blank" '
+        f'title="{html_lib.escape(item.get("title") or "")}">{html_lib.escape(item.get("source") or "?")}</a>'
+        for item in json.loads(also_covered_by)
+    )
+    return (f'<div class="article-also lang-fr">Aussi couvert par : {links}</div>'
+            f'<div class="article-also lang-en">Also covered by: {links}</div>')
 
 
 def generate_bilingual_html(summaries_df, additional_articles_df=None, output_path='docs/latest.html'):
@@ -43,6 +59,8 @@ def generate_bilingual_html(summaries_df, additional_articles_df=None, output_pa
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Motorsport Digest - {generated_date}</title>
+    <link rel="alternate" type="application/atom+xml" title="Motorsport Digest (Atom)" href="feed.xml">
+    <link rel="alternate" type="application/feed+json" title="Motorsport Digest (JSON Feed)" href="feed.json">
     <style>
         * {{
             margin: 0;
@@ -172,6 +190,16 @@ def generate_bilingual_html(summaries_df, additional_articles_df=None, output_pa
             margin-bottom: 12px;
         }}
         
+        .article-also {{
+            color: #7f8c8d;
+            font-size: 0.85em;
+            margin: -6px 0 12px;
+        }}
+        
+        .article-also a {{
+            color: #7f8c8d;
+        }}
+        
         .article-summary {{
             color: #34495e;
             line-height: 1.7;
@@ -282,6 +310,7 @@ def generate_bilingual_html(summaries_df, additional_articles_df=None, output_pa
                 <div class="article-meta">
                     <strong>Source:</strong> {source}, {source_lang} â€¢ <span class="article-score">Score: {score}</span>
                 </div>
+                {_also_covered_html(row.get('also_covered_by'))}
                 
                 <div class="article-summary lang-fr">
                     {row['summary_fr']}
@@ -0,0 +1,163 @@
+"""
+Content Fingerprint Module
+Empreintes SimHash du texte des articles + index par bandes
+
+Une dépêche d'agence reprise avec un autre titre échappe à la comparaison
+des titres. Le SimHash (64 bits, sur les paires de mots consécutifs du
+texte) de deux versions d'un même article diffère de quelques bits (≈ 3-15 pour une reprise
+retouchée, ≈ 25-35 pour deux articles sans rapport) : la distance de Hamming
+mesure la proximité des contenus.
+
+L'empreinte est calculée une fois à l'extraction et stockée avec l'article
+(colonne body_fingerprint, hex). SimHashIndex découpe les 64 bits en bandes :
+deux empreintes à distance <= d partagent au moins k bandes parmi d + k
+(principe des tiroirs), la recherche ne compare donc que les candidats
+ayant k bandes communes, sans balayer toute l'archive.
+
+Avec d = 10 et k = 1 (11 bandes de 5-6 bits), un article sans rapport tombe
+dans une bande commune environ une fois sur 5 : adapté à un seul run (quelques
+centaines d'articles). Pour l'archive ou l'historique (milliers d'empreintes),
+k = 2 ou 3 divise le nombre de candidats comparés par 5 à 20, sans perte.
+"""
+
+import hashlib
+import re
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 2
+
+# Texte trop court (résumé RSS, extraction ratée) : pas d'empreinte fiable
+MIN_WORDS = 50
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def simhash(text, shingle_size=SHINGLE_SIZE):
+    """
+    SimHash 64 bits d'un texte
+    
+    Returns:
+        int, ou None si le texte a moins de MIN_WORDS mots
+    """
+    import numpy as np
+    
+    words = _WORD_RE.findall((text or '').lower())
+    if len(words) < MIN_WORDS:
+        return None
+    
+    shingles = {' '.join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    digests = b''.join(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest() for s in shingles)
+    
+    # Vote bit à bit : bit à 1 si majoritaire parmi les hashes des shingles
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    
+    return int.from_bytes(np.packbits(votes, bitorder='little').tobytes(), 'little')
+
+
+def body_fingerprint(text):
+    """Empreinte stockable (hex 16 caractères) du texte, None si trop court"""
+    fingerprint = simhash(text)
+    return None if fingerprint is None else format(fingerprint, '016x')
+
+
+def _as_int(fingerprint):
+    return int(fingerprint, 16) if isinstance(fingerprint, str) else fingerprint
+
+
+def hamming_distance(a, b):
+    """Bits différents entre deux empreintes (hex ou int)"""
+    return bin(_as_int(a) ^ _as_int(b)).count('1')  # int.bit_count() : Python 3.10+
+
+
+def _band_layout(max_distance, min_hits=1):
+    """(décalage, masque) des max_distance + min_hits bandes couvrant les 64 bits"""
+    bands = min(max_distance + min_hits, FINGERPRINT_BITS)
+    bounds = [FINGERPRINT_BITS * i // bands for i in range(bands + 1)]
+    return [(start, (1 << (end - start)) - 1) for start, end in zip(bounds, bounds[1:])]
+
+
+def band_values(fingerprint, max_distance, min_hits=1):
+    """
+    Clés de bandes (n° de bande, valeur) d'une empreinte
+    
+    Deux empreintes à distance <= max_distance partagent au moins min_hits
+    clés : permet une recherche indexée (dict, index SQLite) sans tout
+    comparer. min_hits > 1 écarte plus de candidats sans rien perdre.
+    """
+    fingerprint = _as_int(fingerprint)
+    layout = _band_layout(max_distance, min_hits)
+    return [(band, (fingerprint >> shift) & mask) for band, (shift, mask) in enumerate(layout)]
+
+
+class SimHashIndex:
+    """
+    Recherche des empreintes proches (distance de Hamming <= max_distance)
+    
+    min_hits : bandes communes exigées avant de comparer un candidat. 1 (défaut)
+    convient à l'index d'un run ; monter à 2-3 pour une archive (voir l'en-tête).
+    
+    Ex:
+        index = SimHashIndex(max_distance=10)
+        for link, fingerprint in archived:
+            index.add(link, fingerprint)
+        index.query(new_fingerprint)  # [(link, distance), ...]
+    """
+    
+    def __init__(self, max_distance=10, min_hits=1):
+        self.max_distance = max_distance
+        self.min_hits = min_hits
+        self._bands = _band_layout(max_distance, min_hits)
+        self._buckets = [{} for _ in self._bands]
+        self._fingerprints = {}
+    
+    @classmethod
+    def build(cls, pairs, max_distance=10, min_hits=1):
+        """Index depuis des paires (clé, empreinte), empreintes None ignorées"""
+        index = cls(max_distance, min_hits)
+        for key, fingerprint in pairs:
+            index.add(key, fingerprint)
+        return index
+    
+    def __len__(self):
+        return len(self._fingerprints)
+    
+    def add(self, key, fingerprint):
+        if fingerprint is None or fingerprint != fingerprint:  # None / NaN (DataFrame)
+            return
+        
+        fingerprint = _as_int(fingerprint)
+        self._fingerprints[key] = fingerprint
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            buckets.setdefault((fingerprint >> shift) & mask, []).append(key)
+    
+    def query(self, fingerprint, exclude=None):
+        """
+        Clés à distance <= max_distance, les plus proches d'abord
+        
+        Args:
+            fingerprint: Empreinte cherchée (hex ou int)
+            exclude: Clé à ignorer (l'article lui-même)
+        
+        Returns:
+            Liste de (clé, distance)
+        """
+        if fingerprint is None or fingerprint != fingerprint:
+            return []
+        
+        fingerprint = _as_int(fingerprint)
+        hits = {}
+        for buckets, (shift, mask) in zip(self._buckets, self._bands):
+            for key in buckets.get((fingerprint >> shift) & mask, ()):
+                hits[key] = hits.get(key, 0) + 1
+        hits.pop(exclude, None)
+        
+        matches = []
+        for key, count in hits.items():
+            if count < self.min_hits:
+                continue
+            distance = bin(self._fingerprints[key] ^ fingerprint).count('1')
+            if distance <= self.max_distance:
+                matches.append((key, distance))
+        
+        return sorted(matches, key=lambda match: match[1])
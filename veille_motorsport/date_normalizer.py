@@ -0,0 +1,122 @@
+"""
+Date Normalizer Module
+Normalisation des dates de publication RSS en epoch UTC (secondes)
+
+Ordre des tentatives, du moins cher au plus cher :
+    1. struct feedparser (published_parsed / updated_parsed, déjà en UTC)
+    2. RFC 822 ("Tue, 13 Jan 2026 10:00:00 +0000 / GMT")
+    3. ISO 8601 ("2026-01-13T10:00:00Z", "2026-01-13 10:00:00+01:00")
+    4. dateutil (formats exotiques), en dernier recours
+
+Les chaînes sont mémoïsées : un même flux répète souvent les mêmes dates.
+Les dates non parsables sont comptées (et non plus ignorées en silence).
+"""
+
+import calendar
+from datetime import datetime, timezone
+from email.utils import mktime_tz, parsedate_tz
+from functools import lru_cache
+
+
+def _from_struct(parsed):
+    """struct_time UTC (feedparser) → epoch, None si invalide"""
+    try:
+        return calendar.timegm(parsed)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _from_datetime(dt):
+    """datetime (naïf = UTC) → epoch"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+@lru_cache(maxsize=16384)
+def parse_date_string(value):
+    """
+    Parser une date texte en epoch UTC (secondes)
+    
+    Returns:
+        int, ou None si la chaîne n'est pas une date reconnue
+    """
+    value = value.strip()
+    if not value:
+        return None
+    
+    try:
+        # RFC 822 : commence par un jour ("Tue,") ou un quantième ("13 Jan")
+        if not value[:4].isdigit():
+            parsed = parsedate_tz(value)
+            if parsed is not None:
+                # Sans fuseau : UTC (mktime_tz supposerait l'heure locale)
+                return mktime_tz(parsed if parsed[9] is not None else parsed[:9] + (0,))
+        
+        # ISO 8601 ('Z' accepté par fromisoformat depuis Python 3.11)
+        return _from_datetime(datetime.fromisoformat(value))
+    except (ValueError, TypeError, OverflowError):
+        pass
+    
+    try:
+        from dateutil import parser as date_parser
+        return _from_datetime(date_parser.parse(value))
+    except (ImportError, ValueError, OverflowError):
+        return None
+
+
+class DateNormalizer:
+    """
+    Convertit les dates d'articles en epoch UTC et compte les rejets
+    
+    Ex:
+        normalizer = DateNormalizer()
+        ts = normalizer.normalize(entry.get('published'), entry.get('published_parsed'))
+        normalizer.rejected  # dates présentes mais non parsables
+    """
+    
+    __slots__ = ('parsed', 'missing', 'rejected', 'rejected_samples')
+    
+    def __init__(self):
+        self.parsed = 0
+        self.missing = 0
+        self.rejected = 0
+        self.rejected_samples = []
+    
+    def normalize(self, value, parsed_struct=None):
+        """
+        Args:
+            value: Date texte du flux ('' / None si absente)
+            parsed_struct: struct_time UTC fourni par feedparser (prioritaire)
+        
+        Returns:
+            Epoch UTC en secondes, ou None
+        """
+        ts = _from_struct(parsed_struct) if parsed_struct is not None else None
+        
+        if ts is None and isinstance(value, str) and value.strip():
+            ts = parse_date_string(value)
+            if ts is None:
+                self.rejected += 1
+                if len(self.rejected_samples) < 5:
+                    self.rejected_samples.append(value)
+                return None
+        
+        if ts is None:
+            self.missing += 1
+        else:
+            self.parsed += 1
+        return ts
+    
+    def report(self):
+        """Afficher les dates rejetées (rien si aucune)"""
+        if self.rejected:
+            samples = ', '.join(repr(s) for s in self.rejected_samples)
+            print(f"⚠️  {self.rejected} unparseable dates (e.g. {samples})")
+
+
+def to_utc_series(timestamps, index=None):
+    """Epochs (None → NaT) → Series pandas datetime64 UTC"""
+    import pandas as pd
+    
+    return pd.Series(pd.to_datetime(list(timestamps), unit='s', utc=True), index=index)
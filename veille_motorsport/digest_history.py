@@ -0,0 +1,217 @@
+"""
+Digest History Module
+Historique des articles déjà publiés dans un digest ("déjà couvert")
+
+Une news résumée la semaine dernière revient souvent cette semaine (mises à
+jour, reprises). Avant la génération des résumés, chaque article est cherché
+dans l'historique des digests précédents :
+    - même article_id (URL canonique, voir url_identity)
+    - même empreinte de titre
+    - texte quasi identique (SimHash, clés de bandes indexées)
+
+Tables SQLite (base du pipeline), toutes les recherches passent par un index
+(clé primaire ou B-tree). Les clés de bandes ne sont gardées que pour les
+HISTORY_WEEKS dernières semaines, et un candidat doit partager au moins
+BAND_MIN_HITS bandes avant d'être comparé : le coût d'une recherche texte
+reste borné par la fenêtre, pas par toute l'archive.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+from .article_deduplicator import BODY_DUPLICATE_DISTANCE
+from .content_fingerprint import band_values, hamming_distance
+from .url_identity import title_fingerprint
+
+DB_PATH = 'data/veille_motorsport.db'
+
+# Digests pris en compte : au-delà, une news qui revient est traitée comme nouvelle
+HISTORY_WEEKS = 8
+
+# Bandes communes exigées avant de comparer une empreinte (voir band_values)
+BAND_MIN_HITS = 2
+
+# Découpage des bandes stockées (PRAGMA user_version) : reconstruites s'il change
+BAND_LAYOUT = BODY_DUPLICATE_DISTANCE * 100 + BAND_MIN_HITS
+
+
+def digest_week(when=None):
+    """Identifiant du digest : semaine ISO 'YYYY-Www'"""
+    year, week, _ = (when or datetime.now()).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+class DigestHistory:
+    """
+    Articles publiés dans les digests précédents
+    
+    Ex:
+        history = DigestHistory()
+        previous = history.lookup(article_id, title, body_fingerprint)  # semaine ou None
+        history.add_published(summarized_rows)
+    """
+    
+    def __init__(self, db_path=DB_PATH, current_week=None):
+        self.db_path = db_path
+        # Le digest en cours (re-run de la même semaine) ne compte pas comme "déjà couvert"
+        self.current_week = current_week or digest_week()
+        self.oldest_week = digest_week(datetime.now() - timedelta(weeks=HISTORY_WEEKS))
+    
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS published_stories (
+                article_id TEXT PRIMARY KEY,
+                title_fingerprint TEXT,
+                body_fingerprint TEXT,
+                title TEXT,
+                link TEXT,
+                digest_week TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_published_title_fp ON published_stories (title_fingerprint);
+            CREATE TABLE IF NOT EXISTS published_bands (
+                band INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                article_id TEXT NOT NULL,
+                PRIMARY KEY (band, value, article_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        if conn.execute("PRAGMA user_version").fetchone()[0] != BAND_LAYOUT:
+            self._rebuild_bands(conn)
+        return conn
+    
+    def _band_rows(self, article_id, body_fingerprint):
+        return [(band, value, article_id)
+                for band, value in band_values(body_fingerprint, BODY_DUPLICATE_DISTANCE, BAND_MIN_HITS)]
+    
+    def _rebuild_bands(self, conn):
+        """Recalculer les clés de bandes (découpage modifié) depuis les empreintes stockées"""
+        conn.execute("DELETE FROM published_bands")
+        bands = []
+        for article_id, body in conn.execute(
+            "SELECT article_id, body_fingerprint FROM published_stories "
+            "WHERE body_fingerprint IS NOT NULL AND digest_week >= ?",
+            (self.oldest_week,)
+        ):
+            bands.extend(self._band_rows(article_id, body))
+        conn.executemany("INSERT OR IGNORE INTO published_bands (band, value, article_id) VALUES (?, ?, ?)", bands)
+        conn.execute(f"PRAGMA user_version = {BAND_LAYOUT}")
+        conn.commit()
+    
+    def _prune_bands(self, conn):
+        """Supprimer les clés de bandes des digests sortis de la fenêtre HISTORY_WEEKS"""
+        conn.execute(
+            "DELETE FROM published_bands WHERE article_id IN "
+            "(SELECT article_id FROM published_stories WHERE digest_week < ?)",
+            (self.oldest_week,)
+        )
+    
+    def _lookup(self, conn, article_id, title, body_fingerprint):
+        """Semaine du digest où l'article a été publié, None sinon"""
+        weeks = (self.current_week, self.oldest_week)
+        
+        if article_id:
+            row = conn.execute(
+                "SELECT digest_week FROM published_stories WHERE article_id = ? AND digest_week != ? AND digest_week >= ?",
+                (article_id, *weeks)
+            ).fetchone()
+            if row:
+                return row[0]
+        
+        fingerprint = title_fingerprint(title)
+        if fingerprint:
+            row = conn.execute(
+                "SELECT digest_week FROM published_stories "
+                "WHERE title_fingerprint = ? AND digest_week != ? AND digest_week >= ? LIMIT 1",
+                (fingerprint, *weeks)
+            ).fetchone()
+            if row:
+                return row[0]
+        
+        if isinstance(body_fingerprint, str) and body_fingerprint:
+            keys = band_values(body_fingerprint, BODY_DUPLICATE_DISTANCE, BAND_MIN_HITS)
+            # Candidats : au moins BAND_MIN_HITS bandes en commun (une requête, index de clé primaire)
+            rows = conn.execute(
+                "SELECT s.body_fingerprint, s.digest_week FROM published_stories s JOIN ("
+                "SELECT article_id FROM published_bands WHERE "
+                + " OR ".join(["(band = ? AND value = ?)"] * len(keys))
+                + " GROUP BY article_id HAVING COUNT(*) >= ?"
+                ") c ON c.article_id = s.article_id WHERE s.digest_week != ? AND s.digest_week >= ?",
+                (*(item for key in keys for item in key), BAND_MIN_HITS, *weeks)
+            )
+            for fingerprint, week in rows:
+                if hamming_distance(fingerprint, body_fingerprint) <= BODY_DUPLICATE_DISTANCE:
+                    return week
+        
+        return None
+    
+    def lookup(self, article_id=None, title='', body_fingerprint=None):
+        """Semaine du digest précédent qui a publié cet article, None si inédit"""
+        conn = self._connect()
+        try:
+            return self._lookup(conn, article_id, title, body_fingerprint)
+        finally:
+            conn.close()
+    
+    def already_covered(self, df):
+        """
+        Semaine de publication précédente pour chaque ligne (None si inédit)
+        
+        Args:
+            df: DataFrame (article_id, title, body_fingerprint si disponibles)
+        
+        Returns:
+            Liste parallèle aux lignes de df
+        """
+        if df.empty:
+            return []
+        
+        article_ids = df['article_id'].tolist() if 'article_id' in df.columns else [None] * len(df)
+        fingerprints = df['body_fingerprint'].tolist() if 'body_fingerprint' in df.columns else [None] * len(df)
+        
+        conn = self._connect()
+        try:
+            return [
+                self._lookup(conn, article_id, title, fingerprint)
+                for article_id, title, fingerprint in zip(article_ids, df['title'].tolist(), fingerprints)
+            ]
+        finally:
+            conn.close()
+    
+    def add_published(self, df):
+        """Enregistrer les articles publiés (résumés) dans le digest courant"""
+        if df.empty or 'article_id' not in df.columns:
+            return
+        
+        stories = []
+        bands = []
+        for row in df.to_dict('records'):
+            article_id = row.get('article_id')
+            if not article_id:
+                continue
+            
+            body = row.get('body_fingerprint')
+            body = body if isinstance(body, str) and body else None
+            stories.append((article_id, title_fingerprint(row.get('title')), body,
+                            row.get('title'), row.get('link'), self.current_week))
+            if body:
+                bands.extend(self._band_rows(article_id, body))
+        
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO published_stories "
+                "(article_id, title_fingerprint, body_fingerprint, title, link, digest_week) VALUES (?, ?, ?, ?, ?, ?)",
+                stories
+            )
+            conn.executemany("INSERT OR IGNORE INTO published_bands (band, value, article_id) VALUES (?, ?, ?)", bands)
+            self._prune_bands(conn)
+            conn.commit()
+        finally:
+            conn.close()
+        
+        print(f"📚 Digest history: {len(stories)} articles recorded for {self.current_week}\n")
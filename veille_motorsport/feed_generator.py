@@ -0,0 +1,342 @@
+"""
+Feed Generator Module
+Publie le digest en flux Atom + JSON Feed (à côté de docs/index.html)
+
+Les lecteurs peuvent interroger un petit document (quelques Ko, cacheable)
+au lieu de retélécharger latest.html pour savoir s'il y a une nouvelle édition.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from xml.sax.saxutils import escape, quoteattr
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+SITE_URL = 'https://NicolasGut.github.io/motorsport-digest/'
+FEED_TITLE = 'Motorsport Digest'
+FEED_DESCRIPTION = 'Revue hebdomadaire motorsport (F1, WEC, GT) - résumés bilingues FR/EN'
+FEED_AUTHOR = 'Nicolas Gut'
+
+ATOM_FILENAME = 'feed.xml'
+JSON_FEED_FILENAME = 'feed.json'
+
+# Namespace pour les champs spécifiques au digest (titres/résumés bilingues, score)
+DIGEST_NS = SITE_URL + 'ns/digest'
+
+
+def _text(value):
+    """Texte d'une cellule DataFrame ('' si vide ou NaN)"""
+    if value is None or value != value:
+        return ''
+    return str(value)
+
+
+def _score(value):
+    """Score entier d'une cellule DataFrame (0 si vide ou NaN)"""
+    if value is None or value != value:
+        return 0
+    return int(value)
+
+
+def _to_datetime(value):
+    """
+    Convertir une date (RFC-822, ISO 8601, datetime, Timestamp) en datetime UTC
+
+    Returns:
+        datetime aware UTC ou None si non parsable
+    """
+
+    if _text(value) == '':
+        return None
+
+    if hasattr(value, 'to_pydatetime'):  # pandas Timestamp
+        value = value.to_pydatetime()
+
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        value = str(value).strip()
+        try:
+            dt = parsedate_to_datetime(value)  # RFC-822 (flux RSS)
+        except (TypeError, ValueError):
+            try:
+                dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return dt.astimezone(timezone.utc)
+
+
+def _rfc3339(dt):
+    """Formater datetime UTC en RFC 3339 (Atom / JSON Feed)"""
+    return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _feed_items(summaries_df):
+    """
+    Normaliser les lignes du digest en items de flux
+
+    Args:
+        summaries_df: DataFrame avec résumés bilingues (sortie summarize_batch_bilingual)
+
+    Returns:
+        Liste de dicts triés par score décroissant
+    """
+
+    if 'score' in summaries_df.columns:
+        summaries_df = summaries_df.sort_values('score', ascending=False)
+
+    items = []
+
+    for _, row in summaries_df.iterrows():
+        url = _text(row.get('url', row.get('link', '')))
+        if not url:
+            continue
+
+        title = _text(row.get('title', ''))
+        items.append({
+            'id': url,
+            'url': url,
+            'title': title,
+            'title_fr': _text(row.get('title_fr', title)) or title,
+            'title_en': _text(row.get('title_en', title)) or title,
+            'summary_fr': _text(row.get('summary_fr', row.get('summary', ''))),
+            'summary_en': _text(row.get('summary_en', '')),
+            'score': _score(row.get('score')),
+            'source': _text(row.get('source', '')),
+            'published': _to_datetime(row.get('published')),
+            'updated': _to_datetime(row.get('summarized_at')) or _to_datetime(row.get('published')),
+        })
+
+    return items
+
+
+def _feed_updated(items):
+    """
+    Date de mise à jour du flux = item le plus récent du digest
+
+    Dérivée des données (et non de l'heure de génération) : tant que le digest
+    ne change pas, le flux reste identique octet pour octet.
+    """
+
+    dates = [item['updated'] for item in items if item['updated']]
+    if dates:
+        return max(dates)
+    return datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def generate_atom_feed(summaries_df, site_url=SITE_URL):
+    """
+    Générer flux Atom du digest
+
+    Args:
+        summaries_df: DataFrame avec résumés bilingues
+        site_url: URL publique du site (GitHub Pages)
+
+    Returns:
+        XML Atom (string)
+    """
+
+    items = _feed_items(summaries_df)
+    feed_url = site_url + ATOM_FILENAME
+    latest_url = site_url + 'latest.html'
+
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        f'<feed xmlns="http://www.w3.org/2005/Atom" xmlns:digest={quoteattr(DIGEST_NS)} xml:lang="fr">',
+        f'  <id>{escape(feed_url)}</id>',
+        f'  <title>{escape(FEED_TITLE)}</title>',
+        f'  <subtitle>{escape(FEED_DESCRIPTION)}</subtitle>',
+        f'  <updated>{_rfc3339(_feed_updated(items))}</updated>',
+        f'  <link rel="self" type="application/atom+xml" href={quoteattr(feed_url)}/>',
+        f'  <link rel="alternate" type="text/html" href={quoteattr(latest_url)}/>',
+        f'  <author><name>{escape(FEED_AUTHOR)}</name></author>',
+    ]
+
+    for item in items:
+        updated = item['updated'] or _feed_updated(items)
+        lines.append('  <entry>')
+        lines.append(f'    <id>{escape(item["id"])}</id>')
+        lines.append(f'    <title>{escape(item["title_fr"])}</title>')
+        lines.append(f'    <link rel="alternate" type="text/html" href={quoteattr(item["url"])}/>')
+        if item['published']:
+            lines.append(f'    <published>{_rfc3339(item["published"])}</published>')
+        lines.append(f'    <updated>{_rfc3339(updated)}</updated>')
+        if item['source']:
+            lines.append(f'    <category term={quoteattr(item["source"])}/>')
+        lines.append(f'    <summary type="text" xml:lang="fr">{escape(item["summary_fr"])}</summary>')
+        lines.append(f'    <digest:title_fr>{escape(item["title_fr"])}</digest:title_fr>')
+        lines.append(f'    <digest:title_en>{escape(item["title_en"])}</digest:title_en>')
+        lines.append(f'    <digest:summary_fr>{escape(item["summary_fr"])}</digest:summary_fr>')
+        lines.append(f'    <digest:summary_en>{escape(item["summary_en"])}</digest:summary_en>')
+        lines.append(f'    <digest:score>{item["score"]}</digest:score>')
+        lines.append(f'    <digest:source>{escape(item["source"])}</digest:source>')
+        lines.append('  </entry>')
+
+    lines.append('</feed>')
+
+    return '\n'.join(lines) + '\n'
+
+
+def generate_json_feed(summaries_df, site_url=SITE_URL):
+    """
+    Générer JSON Feed 1.1 du digest (https://www.jsonfeed.org/version/1.1/)
+
+    Args:
+        summaries_df: DataFrame avec résumés bilingues
+        site_url: URL publique du site (GitHub Pages)
+
+    Returns:
+        JSON (string)
+    """
+
+    items = _feed_items(summaries_df)
+
+    feed = {
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': FEED_TITLE,
+        'description': FEED_DESCRIPTION,
+        'home_page_url': site_url + 'latest.html',
+        'feed_url': site_url + JSON_FEED_FILENAME,
+        'language': 'fr',
+        'authors': [{'name': FEED_AUTHOR}],
+        '_digest': {'updated': _rfc3339(_feed_updated(items))},
+        'items': [],
+    }
+
+    for item in items:
+        entry = {
+            'id': item['id'],
+            'url': item['url'],
+            'title': item['title_fr'],
+            'content_text': item['summary_fr'],
+            'tags': [item['source']] if item['source'] else [],
+            # Extension JSON Feed (préfixe "_") : champs bilingues + score
+            '_digest': {
+                'title_fr': item['title_fr'],
+                'title_en': item['title_en'],
+                'summary_fr': item['summary_fr'],
+                'summary_en': item['summary_en'],
+                'score': item['score'],
+                'source': item['source'],
+            },
+        }
+        if item['published']:
+            entry['date_published'] = _rfc3339(item['published'])
+        if item['updated']:
+            entry['date_modified'] = _rfc3339(item['updated'])
+        feed['items'].append(entry)
+
+    return json.dumps(feed, ensure_ascii=False, indent=2) + '\n'
+
+
+def _write_if_changed(path, content):
+    """
+    Écrire fichier seulement si contenu différent
+
+    Garde mtime/ETag stables côté GitHub Pages quand le digest n'a pas changé.
+
+    Returns:
+        True si fichier écrit
+    """
+
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    return True
+
+
+def save_digest_feeds(summaries_df, output_dir='docs', site_url=SITE_URL):
+    """
+    Publier flux Atom + JSON Feed à côté de docs/index.html
+
+    Args:
+        summaries_df: DataFrame avec résumés bilingues
+        output_dir: Dossier output (default: docs/)
+        site_url: URL publique du site
+
+    Returns:
+        Dict {nom_fichier: True si mis à jour}
+    """
+
+    if summaries_df.empty:
+        print("⚠️  No summaries to publish in feeds")
+        return {}
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = {
+        ATOM_FILENAME: _write_if_changed(
+            os.path.join(output_dir, ATOM_FILENAME),
+            generate_atom_feed(summaries_df, site_url=site_url)
+        ),
+        JSON_FEED_FILENAME: _write_if_changed(
+            os.path.join(output_dir, JSON_FEED_FILENAME),
+            generate_json_feed(summaries_df, site_url=site_url)
+        ),
+    }
+
+    for filename, written in results.items():
+        status = "✅ Saved" if written else "ℹ️  Unchanged"
+        print(f"  {status}: {filename}")
+    print()
+
+    return results
+
+
+# ============================================
+# TEST MODULE
+# ============================================
+
+if __name__ == "__main__":
+    import pandas as pd
+    import tempfile
+    from xml.etree import ElementTree
+
+    print("=" * 60)
+    print("FEED GENERATOR - TEST")
+    print("=" * 60)
+    print()
+
+    test_data = pd.DataFrame({
+        'title': ['Ferrari announces HP partnership', 'McLaren & Toyota <WEC> 2026 plans'],
+        'title_fr': ['Ferrari annonce un partenariat avec HP', 'McLaren & Toyota : plans WEC 2026'],
+        'title_en': ['Ferrari announces HP partnership', 'McLaren & Toyota: WEC 2026 plans'],
+        'url': ['https://example.com/1', 'https://example.com/2?a=1&b=2'],
+        'summary_fr': ['Ferrari annonce un partenariat majeur avec HP.', 'McLaren dévoile sa stratégie.'],
+        'summary_en': ['Ferrari announces major partnership with HP.', 'McLaren reveals its strategy.'],
+        'score': [85, 78],
+        'source': ['Autosport_All', 'The_Race_F1'],
+        'published': ['Mon, 13 Jan 2026 10:00:00 +0000', '2026-01-12T08:30:00Z'],
+        'summarized_at': ['2026-01-18T18:05:00', '2026-01-18T18:06:00'],
+    })
+
+    atom = generate_atom_feed(test_data)
+    ElementTree.fromstring(atom.encode('utf-8'))  # XML bien formé
+    print(f"✅ Atom feed generated ({len(atom)} chars)")
+
+    json_feed = json.loads(generate_json_feed(test_data))
+    print(f"✅ JSON feed generated ({len(json_feed['items'])} items)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = save_digest_feeds(test_data, output_dir=tmp)
+        second = save_digest_feeds(test_data, output_dir=tmp)
+        assert all(first.values()) and not any(second.values())
+        print("✅ Unchanged digest leaves feeds untouched")
+
+    print()
+    print("=" * 60)
+    print("✅ TEST COMPLETE")
+    print("=" * 60)
@@ -0,0 +1,204 @@
+"""
+Feed Schedule Module
+Intervalles de polling par flux, appris de l'historique des arrivées
+
+Autosport publie des dizaines d'articles par jour, Sportscar365 quelques-uns :
+les interroger au même rythme gaspille des requêtes sur l'un ou retarde les
+news de l'autre. Chaque entrée reçue est enregistrée (table feed_arrivals :
+flux, article_id, date de publication) ; le débit d'un flux sur les
+HISTORY_DAYS derniers jours donne l'intervalle qui ramène en moyenne
+TARGET_NEW_PER_POLL nouvelle entrée par poll, borné [POLL_MIN, POLL_MAX] et
+décalé d'un jitter aléatoire (les flux ne se synchronisent pas).
+
+Prochains polls et validateurs HTTP (ETag / Last-Modified) sont persistés
+(table feed_schedule) : un redémarrage ne re-interroge pas tous les flux.
+"""
+
+import os
+import random
+import sqlite3
+import time
+
+DB_PATH = 'data/veille_motorsport.db'
+
+# Bornes de l'intervalle de poll (secondes)
+POLL_MIN_SECONDS = 5 * 60
+POLL_MAX_SECONDS = 6 * 3600
+# Flux sans historique suffisant
+POLL_DEFAULT_SECONDS = 30 * 60
+MIN_ARRIVALS = 3
+
+# Nouvelles entrées visées par poll (latence moyenne ≈ intervalle / 2)
+TARGET_NEW_PER_POLL = 1.0
+# Historique pris en compte pour le débit
+HISTORY_DAYS = 14
+# Intervalle multiplié par un facteur aléatoire dans [1 - JITTER, 1 + JITTER]
+JITTER = 0.1
+
+
+def poll_interval(arrivals, now=None):
+    """
+    Intervalle de poll (secondes, sans jitter) depuis les dates de publication
+    
+    Débit = arrivées / durée couverte (de la plus ancienne arrivée de
+    l'historique à maintenant) ; intervalle = TARGET_NEW_PER_POLL / débit.
+    """
+    now = now or time.time()
+    oldest_allowed = now - HISTORY_DAYS * 86400
+    arrivals = [ts for ts in arrivals if ts is not None and oldest_allowed <= ts <= now]
+    
+    if len(arrivals) < MIN_ARRIVALS:
+        return POLL_DEFAULT_SECONDS
+    
+    span = max(now - min(arrivals), 1.0)
+    interval = TARGET_NEW_PER_POLL * span / len(arrivals)
+    return int(min(max(interval, POLL_MIN_SECONDS), POLL_MAX_SECONDS))
+
+
+class FeedScheduler:
+    """
+    Planification des polls par flux (état persisté en base)
+    
+    Ex:
+        scheduler = FeedScheduler(RSS_FEEDS)
+        for name in scheduler.due():
+            batch = fetch_rss_records({name: RSS_FEEDS[name]}, http_cache=scheduler.http_cache)
+            scheduler.record_poll(name, batch)
+        time.sleep(scheduler.seconds_until_due())
+    """
+    
+    def __init__(self, feeds, db_path=DB_PATH):
+        self.feeds = dict(feeds)
+        self.db_path = db_path
+        self.intervals = {name: POLL_DEFAULT_SECONDS for name in self.feeds}
+        self.next_poll = {name: 0.0 for name in self.feeds}  # Epoch : jamais interrogé = dû
+        self.last_new = {name: 0 for name in self.feeds}
+        self.polls = {name: 0 for name in self.feeds}
+        self.http_cache = {}
+        
+        conn = self._connect()
+        try:
+            for source, interval, next_poll, etag, last_modified in conn.execute(
+                "SELECT source, interval_s, next_poll, etag, last_modified FROM feed_schedule"
+            ):
+                if source not in self.feeds:
+                    continue
+                self.intervals[source] = interval
+                self.next_poll[source] = next_poll
+                if etag or last_modified:
+                    self.http_cache[self.feeds[source]] = {'etag': etag, 'last_modified': last_modified}
+        finally:
+            conn.close()
+    
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS feed_arrivals (
+                source TEXT NOT NULL,
+                article_id TEXT NOT NULL,
+                published_ts INTEGER,
+                PRIMARY KEY (source, article_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_feed_arrivals_ts ON feed_arrivals (source, published_ts);
+            CREATE TABLE IF NOT EXISTS feed_schedule (
+                source TEXT PRIMARY KEY,
+                interval_s INTEGER,
+                next_poll REAL,
+                last_poll REAL,
+                etag TEXT,
+                last_modified TEXT
+            );
+            """
+        )
+        return conn
+    
+    def due(self, now=None):
+        """Flux à interroger maintenant, les plus en retard d'abord"""
+        now = now or time.time()
+        return sorted((name for name in self.feeds if self.next_poll[name] <= now), key=self.next_poll.get)
+    
+    def seconds_until_due(self, now=None):
+        """Attente avant le prochain flux dû"""
+        now = now or time.time()
+        return max(0.0, min(self.next_poll.values(), default=now) - now)
+    
+    def record_arrivals(self, batch):
+        """Enregistrer les entrées reçues (ArticleBatch), par flux"""
+        rows = [
+            (record.source, record.article_id, record.published_ts)
+            for record in batch if record.article_id and record.published_ts is not None
+        ]
+        if not rows:
+            return
+        
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO feed_arrivals (source, article_id, published_ts) VALUES (?, ?, ?)", rows
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def record_poll(self, name, batch, now=None):
+        """
+        Enregistrer un poll : arrivées, nouvel intervalle appris, prochain poll
+        
+        Args:
+            name: Flux interrogé
+            batch: Nouvelles entrées reçues (ArticleBatch, vide si 304)
+        
+        Returns:
+            Intervalle jusqu'au prochain poll (secondes, jitter inclus)
+        """
+        now = now or time.time()
+        self.record_arrivals(batch)
+        
+        conn = self._connect()
+        try:
+            arrivals = [
+                row[0] for row in conn.execute(
+                    "SELECT published_ts FROM feed_arrivals WHERE source = ? AND published_ts >= ?",
+                    (name, int(now - HISTORY_DAYS * 86400))
+                )
+            ]
+            interval = poll_interval(arrivals, now)
+            jittered = int(interval * random.uniform(1 - JITTER, 1 + JITTER))
+            
+            validators = self.http_cache.get(self.feeds[name], {})
+            conn.execute(
+                "INSERT OR REPLACE INTO feed_schedule (source, interval_s, next_poll, last_poll, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (name, interval, now + jittered, now, validators.get('etag'), validators.get('last_modified'))
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
+        self.intervals[name] = interval
+        self.next_poll[name] = now + jittered
+        self.last_new[name] = len(batch)
+        self.polls[name] += 1
+        
+        return jittered
+    
+    def retry_later(self, name, now=None):
+        """Poll en erreur : nouvel essai après l'intervalle courant (non persisté)"""
+        now = now or time.time()
+        self.next_poll[name] = now + self.intervals[name]
+    
+    def status(self, now=None):
+        """État par flux (intervalle appris, prochain poll)"""
+        now = now or time.time()
+        return [
+            {
+                'name': name,
+                'interval_s': self.intervals[name],
+                'next_poll_in_s': max(0, round(self.next_poll[name] - now)),
+                'polls': self.polls[name],
+                'last_new': self.last_new[name],
+            }
+            for name in self.feeds
+        ]
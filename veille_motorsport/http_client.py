@@ -0,0 +1,69 @@
+"""
+HTTP Client Module
+Session HTTP partagée (keep-alive, pool de connexions) + GET conditionnels
+
+Une seule session pour tout le process : les connexions TLS vers un même
+hôte (flux RSS puis articles d'Autosport, par ex.) sont réutilisées au lieu
+d'être rouvertes à chaque requête. Les GET conditionnels (ETag /
+Last-Modified) évitent de retélécharger un flux inchangé : 304, rien à parser.
+"""
+
+TIMEOUT = 15
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+
+_session = None
+
+
+def get_session():
+    """Session requests partagée, créée à la première requête"""
+    global _session
+    
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _session = session
+    
+    return _session
+
+
+def conditional_get(url, validators, headers=None, timeout=TIMEOUT, stream=False):
+    """
+    GET conditionnel (If-None-Match / If-Modified-Since)
+    
+    Args:
+        url: URL demandée
+        validators: Dict {url: {'etag': ..., 'last_modified': ...}}, lu puis
+                    mis à jour avec les en-têtes de la réponse
+        headers: En-têtes additionnels
+        stream: Corps lu à la demande (iter_content), connexion libérée par
+                response.close()
+    
+    Returns:
+        Response, ou None si la ressource n'a pas changé (304)
+    
+    Raises:
+        requests.HTTPError pour les statuts d'erreur
+    """
+    request_headers = dict(headers or {})
+    known = validators.get(url, {})
+    if known.get('etag'):
+        request_headers['If-None-Match'] = known['etag']
+    if known.get('last_modified'):
+        request_headers['If-Modified-Since'] = known['last_modified']
+    
+    response = get_session().get(url, headers=request_headers, timeout=timeout, allow_redirects=True, stream=stream)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    
+    validators[url] = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    return response
@@ -0,0 +1,346 @@
+"""
+Live Service Module
+Mode continu : polling incrémental des flux, digest reconstruit à la demande
+
+Process longue durée (dashboard live) à côté du batch hebdomadaire :
+    - chaque source du registre (sources.py) est interrogée à son rythme,
+      appris de son débit d'articles (feed_schedule : bornes + jitter), GET
+      conditionnel (ETag / 304) ; les sources dues en même temps sont
+      interrogées en parallèle
+    - seules les nouvelles entrées sont traitées : triage et score sur le
+      résumé RSS, puis file d'extraction par priorité et score final sur le
+      texte complet
+    - tout reste chaud en mémoire : articles scorés + empreintes, index
+      d'identité, règles de scoring compilées, session HTTP ; le digest
+      (filtre + dédup) est reconstruit depuis cet état, sans réseau, et
+      gardé tant qu'aucun article ne change
+
+Endpoints HTTP (lecture seule, JSON) :
+    GET /digest.json   meilleurs articles dédupliqués de la fenêtre
+    GET /status.json   flux (intervalle, prochain poll), file d'extraction
+
+Usage:
+    python -m veille_motorsport.live_service --port 8765 --min-score 20
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .article_deduplicator import deduplicate_records
+from .article_extractor import extract_full_article
+from .article_records import ArticleBatch
+from .article_scorer import get_scoring_version, score_article_v2, serialize_explanation, triage_records
+from .feed_schedule import FeedScheduler
+from .sources import default_sources, fetch_sources
+from .url_identity import IdentityIndex
+
+LIVE_PORT = 8765
+LIVE_TOP_N = 20
+
+# Extractions par cycle (entre deux vérifications des flux dus)
+EXTRACT_PER_CYCLE = 5
+EXTRACT_DELAY = 1
+
+
+class LiveDigest:
+    """
+    État live : articles de la fenêtre, scorés au fil de l'eau
+    
+    Ex:
+        service = LiveDigest(min_relevance_score=20)
+        serve(service, port=8765)
+        service.run_forever()
+    """
+    
+    def __init__(self, sources=None, days_back=7, min_relevance_score=20, top_n=LIVE_TOP_N, semantic=False):
+        self.sources = {source.name: source for source in (sources or default_sources())}
+        self.feeds = {name: source.url for name, source in self.sources.items()}
+        # Intervalles appris par flux, prochains polls et validateurs HTTP persistés
+        self.schedule = FeedScheduler(self.feeds)
+        self.days_back = days_back
+        self.min_relevance_score = min_relevance_score
+        self.top_n = top_n
+        self.semantic = semantic
+        
+        self.batch = ArticleBatch()
+        self.pending = []  # Records à extraire, score provisoire décroissant
+        # Index persistant : article_id stables entre runs (même URL canonique ou titre) ;
+        # seuls les articles déjà vus par ce process sont des doublons, ceux d'un run
+        # précédent sont retraités au démarrage pour reconstruire l'état mémoire
+        self.identity = IdentityIndex()
+        self._warm = False
+        
+        # Verrou de l'état (poll / extraction / requêtes HTTP concurrentes) ;
+        # le réseau se fait hors verrou
+        self.lock = threading.Lock()
+        self._digest = None
+        self._digest_version = None
+    
+    def _cutoff(self):
+        return datetime.now(timezone.utc) - timedelta(days=self.days_back)
+    
+    @staticmethod
+    def _score(batch, record):
+        score, explanation = score_article_v2(batch.text(record), record.title or '', record.source, explain=True)
+        record.relevance_score = score
+        record.score_explain = serialize_explanation(explanation)
+        record.scoring_version = get_scoring_version()
+    
+    def _adopt(self, record, source):
+        """Rattacher un record au batch du service (textes copiés dans son TextStore)"""
+        record.summary_id = self.batch.texts.add(source.summary(record))
+        if record.text_id is not None:
+            record.text_id = self.batch.texts.add(source.texts.get(record.text_id))
+        self.batch.records.append(record)
+    
+    def poll(self, names, conditional=True):
+        """
+        Interroger des sources (en parallèle) et intégrer leurs nouvelles entrées
+        
+        Args:
+            names: Sources à interroger
+            conditional: GET conditionnel (False au démarrage : état mémoire vide)
+        
+        Returns:
+            {source: nombre de nouveaux articles retenus au triage}, sources
+            en erreur exclues (nouvel essai après leur intervalle)
+        """
+        http_cache = self.schedule.http_cache
+        if not conditional:
+            http_cache = {url: {} for url in http_cache}  # Validateurs remplacés par la réponse
+        
+        new, failed = fetch_sources(
+            [self.sources[name] for name in names], cutoff=self._cutoff(), identity=self.identity, http_cache=http_cache
+        )
+        self.schedule.http_cache.update(http_cache)
+        
+        for name in names:
+            if name in failed:
+                self.schedule.retry_later(name)
+            else:
+                self.schedule.record_poll(name, new.filter(lambda record: record.source == name))
+        
+        candidates, _ = triage_records(new)
+        
+        # Score sur le résumé RSS en attendant l'extraction : visible tout de suite
+        for record in candidates:
+            self._score(candidates, record)
+        
+        with self.lock:
+            for record in candidates:
+                self._adopt(record, new)
+            self.pending.extend(candidates)
+            self.pending.sort(key=lambda record: record.provisional_score, reverse=True)
+            
+            if len(candidates):
+                self._digest = None
+        
+        counts = {name: 0 for name in names if name not in failed}
+        for record in candidates:
+            counts[record.source] += 1
+        return counts
+    
+    def extract_pending(self, limit=EXTRACT_PER_CYCLE):
+        """Extraire les articles les plus prometteurs de la file puis les re-scorer"""
+        with self.lock:
+            todo, self.pending = self.pending[:limit], self.pending[limit:]
+        
+        for record in todo:
+            article = extract_full_article(record.link)
+            if article and article.get('text'):
+                with self.lock:
+                    self.batch.set_text(record, article['text'])
+                    record.body_fingerprint = article.get('fingerprint')
+                    self._score(self.batch, record)
+                    self._digest = None
+            time.sleep(EXTRACT_DELAY)
+        
+        return len(todo)
+    
+    def expire(self):
+        """Retirer les articles sortis de la fenêtre (TextStore reconstruit)"""
+        cutoff_ts = self._cutoff().timestamp()
+        
+        with self.lock:
+            kept = [r for r in self.batch if r.published_ts is None or r.published_ts >= cutoff_ts]
+            if len(kept) == len(self.batch):
+                return 0
+            
+            expired = len(self.batch) - len(kept)
+            previous, self.batch = self.batch, ArticleBatch()
+            for record in kept:
+                self._adopt(record, previous)
+            kept_ids = {id(record) for record in kept}
+            self.pending = [record for record in self.pending if id(record) in kept_ids]
+            self._digest = None
+        
+        return expired
+    
+    @staticmethod
+    def _item(batch, record):
+        published = record.published_ts
+        return {
+            'article_id': record.article_id,
+            'title': record.title,
+            'link': record.link,
+            'source': record.source,
+            'published': datetime.fromtimestamp(published, timezone.utc).isoformat() if published else None,
+            'relevance_score': record.relevance_score,
+            'extracted': record.text_id is not None,
+            'summary': ' '.join(batch.summary(record).split())[:300],
+            'also_covered_by': json.loads(record.also_covered_by) if record.also_covered_by else [],
+        }
+    
+    def digest(self):
+        """
+        Digest courant depuis l'état en mémoire (sans réseau)
+        
+        Reconstruit seulement si un article a changé ou si les règles de
+        scoring ont été modifiées (articles re-scorés), sinon servi tel quel.
+        """
+        version = get_scoring_version()
+        
+        with self.lock:
+            if self._digest is not None and self._digest_version == version:
+                return self._digest
+            
+            start = time.perf_counter()
+            
+            for record in self.batch:
+                if record.scoring_version != version:
+                    self._score(self.batch, record)
+            
+            kept = self.batch.filter(lambda record: record.relevance_score >= self.min_relevance_score)
+            kept = deduplicate_records(kept, similarity_threshold=0.65, semantic=self.semantic)
+            top = kept.sort(key=lambda record: record.relevance_score, reverse=True).head(self.top_n)
+            
+            self._digest = {
+                'generated_at': datetime.now(timezone.utc).isoformat(),
+                'articles_in_window': len(self.batch),
+                'pending_extraction': len(self.pending),
+                'min_relevance_score': self.min_relevance_score,
+                'scoring_version': version,
+                'build_ms': round((time.perf_counter() - start) * 1000, 1),
+                'articles': [self._item(self.batch, record) for record in top],
+            }
+            self._digest_version = version
+            
+            return self._digest
+    
+    def status(self):
+        """Flux (intervalle, prochain poll) et taille de l'état"""
+        now = time.time()
+        with self.lock:
+            return {
+                'articles_in_window': len(self.batch),
+                'pending_extraction': len(self.pending),
+                'feeds': self.schedule.status(now),
+            }
+    
+    def run_forever(self):
+        """Boucle : flux dus, puis file d'extraction, sinon attente du prochain flux dû"""
+        while True:
+            # Démarrage : tous les flux, sans GET conditionnel (état mémoire à reconstruire)
+            due = self.schedule.due() if self._warm else list(self.feeds)
+            
+            if due:
+                try:
+                    counts = self.poll(due, conditional=self._warm)
+                    for name, new in counts.items():
+                        print(f"🔄 {name}: {new} new, next poll in {self.schedule.intervals[name] // 60} min")
+                    print()
+                except Exception as e:
+                    print(f"❌ Poll failed: {e}")
+                    for name in due:
+                        self.schedule.retry_later(name)
+            self._warm = True
+            
+            if due:
+                self.identity.save()
+                expired = self.expire()
+                if expired:
+                    print(f"🗑️  {expired} articles left the {self.days_back}-day window\n")
+            
+            if self.pending:
+                self.extract_pending()
+                continue
+            
+            time.sleep(max(1.0, self.schedule.seconds_until_due()))
+
+
+def _handler(service):
+    """Handler HTTP lié au service"""
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split('?')[0]
+            if path == '/digest.json':
+                body = service.digest()
+            elif path == '/status.json':
+                body = service.status()
+            else:
+                self.send_error(404)
+                return
+            
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return Handler
+
+
+def serve(service, port=LIVE_PORT, host='127.0.0.1'):
+    """Démarrer le serveur HTTP dans un thread (retourne le serveur)"""
+    server = ThreadingHTTPServer((host, port), _handler(service))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"🌐 Live digest: http://{host}:{port}/digest.json\n")
+    return server
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """Lancer le service continu"""
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Continuous feed polling with an on-demand live digest')
+    parser.add_argument('--host', default='127.0.0.1', help='HTTP bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=LIVE_PORT, help=f'HTTP port (default: {LIVE_PORT})')
+    parser.add_argument('--days', type=int, default=7, help='Window of articles kept in memory (default: 7)')
+    parser.add_argument('--min-score', type=int, default=20, help='Minimum relevance score (default: 20)')
+    parser.add_argument('--top', type=int, default=LIVE_TOP_N, help=f'Articles in the digest (default: {LIVE_TOP_N})')
+    parser.add_argument('--semantic-dedup', action='store_true', help='Also merge paraphrased titles (sentence-transformers)')
+    args = parser.parse_args()
+    
+    service = LiveDigest(
+        days_back=args.days,
+        min_relevance_score=args.min_score,
+        top_n=args.top,
+        semantic=args.semantic_dedup
+    )
+    server = serve(service, port=args.port, host=args.host)
+    
+    try:
+        service.run_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️  Stopping live service")
+    finally:
+        service.identity.save()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
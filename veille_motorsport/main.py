@@ -3,25 +3,32 @@ Main Pipeline - Motorsport Digest
 Orchestre tout le processus de gÃ©nÃ©ration du digest hebdomadaire
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 import sys
 import os
-import importlib
 
 # Importer modules locaux
-from .rss_aggregator import fetch_rss_feeds, filter_recent_articles, save_to_database
-from .article_extractor import extract_batch_articles
-
-# FORCER LE RELOAD du scorer pour Ã©viter cache Python
-import veille_motorsport.article_scorer as article_scorer
-importlib.reload(article_scorer)
-from .article_scorer import rank_articles, get_top_articles
-
-from .article_deduplicator import deduplicate_articles
+from .rss_aggregator import filter_recent_records, save_to_database
+from .article_records import ArticleBatch
+from .article_extractor import extract_prioritized
+from .article_scorer import rank_records, triage_records, score_article_v2, get_scoring_version
+from .article_deduplicator import deduplicate_records
 from .ai_summarizer import estimate_cost
 from .bilingual_summarizer import summarize_batch_bilingual
 from .bilingual_web_generator import generate_bilingual_html
+from .feed_generator import save_digest_feeds
+from .archive_export import export_archive
+from .url_identity import IdentityIndex
+from .digest_history import DigestHistory
+from .feed_schedule import FeedScheduler
+from .sources import default_sources, fetch_sources
+from .run_checkpoints import RunCheckpoint, prune_runs
+from .stage_graph import StageFailed, StageGraph
+
+# Articles collectés réutilisés par les runs suivants pendant cette durée
+# (changer --min-score ne relance ni le fetch ni l'extraction)
+COLLECT_MAX_AGE_HOURS = 6
 
 
 def print_banner():
@@ -33,31 +40,14 @@ def print_banner():
     print()
 
 
-def generate_weekly_digest(
-    days_back=7,
-    max_articles_extract=100,  # AugmentÃ© : 50 â†’ 100
-    max_articles_summarize=20,  # AugmentÃ© : 15 â†’ 20
-    min_relevance_score=20,
-    language='fr'
-):
+def _collect_articles(days_back, max_articles_extract, max_articles_summarize):
     """
-    Pipeline complet gÃ©nÃ©ration digest hebdomadaire
-    
-    Args:
-        days_back: Nombre de jours Ã  rÃ©cupÃ©rer
-        max_articles_extract: Nombre max d'articles Ã  extraire en dÃ©tail
-        max_articles_summarize: Nombre max d'articles Ã  rÃ©sumer (IA)
-        min_relevance_score: Score minimum pour garder article
-        language: Langue des rÃ©sumÃ©s ('fr' ou 'en')
+    Étapes 1-3 : fetch RSS, filtrage des articles récents, extraction
     
     Returns:
-        DataFrame avec rÃ©sumÃ©s gÃ©nÃ©rÃ©s
+        ({'recent': ArticleBatch des articles récents}, compteurs), None si échec
     """
     
-    print_banner()
-    
-    start_time = datetime.now()
-    
     # ============================================
     # Ã‰TAPE 1 : FETCH RSS FEEDS
     # ============================================
@@ -66,18 +56,28 @@ def generate_weekly_digest(
     print("-" * 70)
     
     try:
-        articles_df = fetch_rss_feeds()
+        # Records compacts d'une étape à l'autre (DataFrame seulement aux frontières)
+        # Entrées hors fenêtre écartées dès le fetch (filtre de l'étape 2 = tri)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        # Index d'identité persistant : même article sous plusieurs URLs téléchargé une fois
+        identity = IdentityIndex()
+        # Flux RSS et sources hors RSS du registre, interrogés en parallèle
+        sources = default_sources()
+        articles, _ = fetch_sources(sources, cutoff=cutoff, identity=identity)
+        identity.save()
+        # Débit d'articles par source : intervalles de polling du mode continu
+        FeedScheduler({source.name: source.url for source in sources}).record_arrivals(articles)
         
-        if articles_df.empty:
+        if articles.empty:
             print("âŒ ERROR: No articles fetched!")
             print("   This might be a network/SSL issue in GitHub Actions")
-            return pd.DataFrame()
+            return None
         
     except Exception as e:
         print(f"âŒ ERROR fetching RSS: {e}")
         import traceback
         traceback.print_exc()
-        return pd.DataFrame()
+        return None
     
     # ============================================
     # Ã‰TAPE 2 : FILTER RECENT
@@ -87,16 +87,16 @@ def generate_weekly_digest(
     print("-" * 70)
     
     try:
-        recent_df = filter_recent_articles(articles_df, hours=days_back*24)
+        recent = filter_recent_records(articles, hours=days_back*24)
         
-        if recent_df.empty:
+        if recent.empty:
             print("âš ï¸  WARNING: No recent articles found!")
             print("   Tip: Increase days_back parameter")
-            return pd.DataFrame()
+            return None
         
     except Exception as e:
         print(f"âŒ ERROR filtering: {e}")
-        return pd.DataFrame()
+        return None
     
     # ============================================
     # Ã‰TAPE 3 : EXTRACT FULL CONTENT
@@ -105,42 +105,73 @@ def generate_weekly_digest(
     print("ðŸ“„ Ã‰TAPE 3/6 : Extraction contenu complet")
     print("-" * 70)
     
+    full_articles = []
+    downloads_avoided = 0
+    
     try:
-        # Prendre URLs uniques
-        urls_to_extract = recent_df['link'].drop_duplicates().tolist()
+        # Tri sur titre + résumé RSS : pas de téléchargement des articles hors périmètre,
+        # budget d'extraction dépensé sur les meilleurs scores provisoires
+        candidate_records, rejected_records = triage_records(recent)
         
-        # Limiter nombre d'extractions
-        if len(urls_to_extract) > max_articles_extract:
-            print(f"  â„¹ï¸  Limiting extraction to {max_articles_extract} articles")
-            urls_to_extract = urls_to_extract[:max_articles_extract]
+        # Téléchargements évités = rejetés qui seraient entrés dans le budget (ordre RSS)
+        naive_urls = set(list(dict.fromkeys(record.link for record in recent))[:max_articles_extract])
+        downloads_avoided = len(naive_urls & {record.link for record in rejected_records})
+        print(f"  🧹 Triage: {len(rejected_records)} out-of-scope articles skipped "
+              f"({downloads_avoided} downloads avoided)")
         
-        # Extraire
-        full_articles = extract_batch_articles(urls_to_extract, delay=1)
+        # URLs uniques (meilleurs candidats d'abord) + score provisoire
+        candidates = {}
+        for record in candidate_records:
+            candidates.setdefault(record.link, record.provisional_score)
+        candidates = list(candidates.items())
+        
+        if len(candidates) > max_articles_extract:
+            print(f"  ℹ️  Extraction budget: {max_articles_extract}/{len(candidates)} articles")
+        
+        # Extraire par priorité ; arrêt anticipé quand le top N (résumés) est stable
+        full_articles, extraction_stats = extract_prioritized(
+            candidates,
+            score_fn=lambda article: score_article_v2(article['text'], article['title']),
+            top_n=max_articles_summarize,
+            max_articles=max_articles_extract,
+            delay=1
+        )
+        downloads_avoided += extraction_stats['saved']
         
         if not full_articles:
             print("âš ï¸  WARNING: Could not extract any articles!")
             print("   Falling back to RSS summaries only...")
-            # Utiliser summary RSS comme fallback
-            recent_df['text'] = recent_df['summary']
-            merged_df = recent_df
-        else:
-            # Merger avec metadata RSS
-            full_df = pd.DataFrame(full_articles)
-            merged_df = recent_df.merge(
-                full_df[['url', 'text']], 
-                left_on='link', 
-                right_on='url', 
-                how='left'
-            )
             
-            # Remplir texte manquant avec summary RSS
-            merged_df['text'] = merged_df['text'].fillna(merged_df['summary'])
+        # Texte complet rattaché par id ; sans extraction, le résumé RSS sert de texte
+        # (+ empreinte SimHash calculée à l'extraction, pour la dédup sur le texte)
+        extracted = {article['url']: article for article in full_articles if article.get('text')}
+        for record in recent:
+            article = extracted.get(record.link)
+            if article:
+                recent.set_text(record, article['text'])
+                record.body_fingerprint = article.get('fingerprint')
         
     except Exception as e:
         print(f"âŒ ERROR extracting: {e}")
         print("   Using RSS summaries as fallback...")
-        recent_df['text'] = recent_df['summary']
-        merged_df = recent_df
+    
+    stats = {
+        'fetched': len(articles),
+        'recent': len(recent),
+        'extracted': len(full_articles) if full_articles else 0,
+        'downloads_avoided': downloads_avoided,
+    }
+    
+    return {'recent': recent}, stats
+
+
+def _rank_articles(collect):
+    """
+    Étape 4a : scoring de tous les articles récents
+    
+    Returns:
+        ({'ranked': ArticleBatch trié par score}, compteurs), None si échec
+    """
     
     # ============================================
     # Ã‰TAPE 4 : SCORE & RANK
@@ -151,29 +182,87 @@ def generate_weekly_digest(
     
     try:
         # Scorer tous les articles
-        ranked_df = rank_articles(merged_df)
+        ranked = rank_records(ArticleBatch.coerce(collect['recent']))
+    
+    except Exception as e:
+        print(f"âŒ ERROR scoring: {e}")
+        return None
+    
+    return {'ranked': ranked}, {'scored': len(ranked)}
+
+
+def _select_articles(rank, min_relevance_score, semantic_dedup, archive):
+    """
+    Étape 4b : filtrage par score, dédup, base + archive, articles déjà couverts
+    
+    Returns:
+        ({'filtered', 'digest', 'covered': ArticleBatch}, compteurs), None si échec
+    """
+    
+    try:
+        ranked = ArticleBatch.coerce(rank['ranked'])
         
         # Filtrer par score minimum
-        filtered_df = ranked_df[ranked_df['relevance_score'] >= min_relevance_score].copy()
+        filtered = ranked.filter(lambda record: record.relevance_score >= min_relevance_score)
         
-        print(f"  âœ… Kept {len(filtered_df)} articles with score >= {min_relevance_score}")
+        print(f"  âœ… Kept {len(filtered)} articles with score >= {min_relevance_score}")
         
         # DÃ‰DUPLICATION (mÃªme news de sources diffÃ©rentes)
         # Déduplication avec seuil abaissé pour détecter plus de doublons
-        filtered_df = deduplicate_articles(filtered_df, similarity_threshold=0.65)
+        filtered = deduplicate_records(filtered, similarity_threshold=0.65, semantic=semantic_dedup)
         print()
         
-        if filtered_df.empty:
+        if filtered.empty:
             print("âš ï¸  WARNING: No articles passed relevance filter!")
             print("   Tip: Lower min_relevance_score")
-            return pd.DataFrame()
+            return None
+        
+        # Frontière : DataFrame pour la base et l'historique des digests
+        filtered_df = filtered.to_dataframe()
         
         # Sauvegarder en base
         save_to_database(filtered_df)
         
+        # Archive Parquet pour l'analyse historique : tous les articles scorés,
+        # 'kept' = passés score minimum + déduplication
+        if archive:
+            try:
+                ranked_df = ranked.to_dataframe()
+                export_archive(ranked_df.assign(kept=ranked_df['link'].isin(filtered_df['link'])))
+            except ImportError as e:
+                print(f"⚠️  {e}: skipping archive export\n")
+        
+        # Déjà publiés dans un digest précédent : pas de résumé IA payé deux fois
+        history = DigestHistory()
+        previous_weeks = history.already_covered(filtered_df)
+        digest = ArticleBatch([r for r, week in zip(filtered, previous_weeks) if week is None], filtered.texts)
+        covered = ArticleBatch([r for r, week in zip(filtered, previous_weeks) if week is not None], filtered.texts)
+        
+        if len(covered):
+            print(f"  🔁 {len(covered)} articles already covered in previous digests\n")
+        
+        if digest.empty:
+            print("⚠️  WARNING: All articles were already covered in previous digests!")
+            return None
+    
     except Exception as e:
         print(f"âŒ ERROR scoring: {e}")
-        return pd.DataFrame()
+        return None
+    
+    frames = {'filtered': filtered, 'digest': digest, 'covered': covered}
+    return frames, {'filtered': len(filtered), 'covered': len(covered)}
+
+
+def _summarize_articles(select, max_articles_summarize, previous=None):
+    """
+    Étape 5 : résumés IA bilingues
+    
+    Seuls les articles sans résumé dans le dernier run sont envoyés à l'API
+    (ex: --min-score modifié : les résumés déjà payés sont réutilisés).
+    
+    Returns:
+        ({'summaries': DataFrame}, coût estimé), None si échec
+    """
     
     # ============================================
     # Ã‰TAPE 5 : AI SUMMARIZATION
@@ -183,24 +272,52 @@ def generate_weekly_digest(
     print("-" * 70)
     
     try:
+        digest = ArticleBatch.coerce(select['digest'])
+        top = digest.sort(lambda record: record.relevance_score, reverse=True).head(max_articles_summarize)
+        
+        # Résumés du dernier run réutilisés pour les articles toujours dans le top
+        reused = pd.DataFrame()
+        if previous is not None and len(previous['summaries']):
+            known = previous['summaries'].drop_duplicates('url', keep='last')
+            reused = known[known['url'].isin([record.link for record in top])]
+            reused_urls = set(reused['url'])
+            top = top.filter(lambda record: record.link not in reused_urls)
+            print(f"  ♻️  {len(reused)} summaries reused from the previous run\n")
+        
         # Estimer coÃ»t d'abord
-        cost = estimate_cost(min(max_articles_summarize, len(filtered_df)))
+        cost = estimate_cost(len(top))
         print(f"ðŸ’° Estimated cost: ${cost['total_cost']:.4f}\n")
         
         # GÃ©nÃ©rer rÃ©sumÃ©s BILINGUES (FR + EN)
-        summaries_df = summarize_batch_bilingual(
-            filtered_df,
+        new_summaries = summarize_batch_bilingual(
+            top.to_dataframe(),
             max_articles=max_articles_summarize,
             delay=1
-        )
+        ) if len(top) else pd.DataFrame()
+        
+        # Ordre du digest (trié par score)
+        parts = [df for df in (reused, new_summaries) if len(df)]
+        summaries_df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        if len(summaries_df):
+            order = {record.link: i for i, record in enumerate(digest)}
+            summaries_df = summaries_df.sort_values('url', key=lambda urls: urls.map(order)).reset_index(drop=True)
         
         if summaries_df.empty:
             print("âŒ ERROR: No summaries generated!")
-            return pd.DataFrame()
+            return None
         
     except Exception as e:
         print(f"âŒ ERROR summarizing: {e}")
-        return pd.DataFrame()
+        return None
+    
+    return {'summaries': summaries_df}, cost
+
+
+def _publish_digest(select, summarize, max_articles_summarize, already_covered):
+    """
+    Étape 6 : page HTML bilingue + flux Atom / JSON Feed, puis articles résumés
+    ajoutés à l'historique (seulement une fois publiés ; None si échec)
+    """
     
     # ============================================
     # Ã‰TAPE 6 : GENERATE WEB PAGE
@@ -210,10 +327,18 @@ def generate_weekly_digest(
     print("-" * 70)
     
     try:
+        digest, covered = ArticleBatch.coerce(select['digest']), ArticleBatch.coerce(select['covered'])
+        summaries_df = summarize['summaries']
+        
         # PrÃ©parer articles additionnels (21-40)
-        additional_articles = None
-        if len(filtered_df) > max_articles_summarize:
-            additional_articles = filtered_df.iloc[max_articles_summarize:max_articles_summarize+20]
+        additional = digest.records[max_articles_summarize:max_articles_summarize+20]
+        
+        # 'flag' : articles déjà couverts ajoutés en liens, après les nouveaux
+        if already_covered == 'flag':
+            additional = (additional + covered.records)[:20]
+        
+        # Frontière : DataFrame pour le HTML (seulement les articles affichés en liens)
+        additional_articles = ArticleBatch(additional, digest.texts).to_dataframe() if additional else None
         
         # GÃ©nÃ©rer HTML BILINGUE avec articles additionnels
         generate_bilingual_html(
@@ -222,10 +347,130 @@ def generate_weekly_digest(
             output_path='docs/latest.html'
         )
         
+        # Flux Atom + JSON Feed : petit document cacheable pour les lecteurs
+        save_digest_feeds(summaries_df, output_dir='docs')
+        
+        # Publication réussie : ces articles seront « déjà couverts » aux prochains runs
+        published_urls = set(summaries_df['url'])
+        DigestHistory().add_published(digest.filter(lambda record: record.link in published_urls).to_dataframe())
+        
     except Exception as e:
         print(f"âŒ ERROR generating web page: {e}")
+        return None
+    
+    return {}, {}
+
+
+def _stage_failed(checkpoint, stage):
+    """Run interrompu : étapes terminées conservées, commande de reprise affichée"""
+    completed = checkpoint.completed()
+    print(f"💾 Run {checkpoint.run_id}: stopped at '{stage}' "
+          f"(checkpoints: {', '.join(completed) or 'none'})")
+    print(f"   Resume with: python -m veille_motorsport.main --resume {checkpoint.run_id}")
+    return pd.DataFrame()
+
+
+def _feeds_version():
+    """Sources actives : une source ajoutée invalide les articles collectés"""
+    return [source.config() for source in default_sources()]
+
+
+# Graphe du pipeline : chaque étape déclare ses entrées et ses paramètres
+PIPELINE = StageGraph()
+PIPELINE.add('collect', _collect_articles,
+             params=('days_back', 'max_articles_extract', 'max_articles_summarize'),
+             version=_feeds_version, max_age=timedelta(hours=COLLECT_MAX_AGE_HOURS))
+PIPELINE.add('rank', _rank_articles, inputs=('collect',), version=get_scoring_version)
+# Jamais relue : base SQLite, archive Parquet et historique des digests
+# (état externe) doivent suivre chaque run
+PIPELINE.add('select', _select_articles, inputs=('rank',),
+             params=('min_relevance_score', 'semantic_dedup', 'archive'), cache=False)
+PIPELINE.add('summarize', _summarize_articles, inputs=('select',),
+             params=('max_articles_summarize',), incremental=True)
+PIPELINE.add('publish', _publish_digest, inputs=('select', 'summarize'),
+             params=('max_articles_summarize', 'already_covered'), cache=False)
+
+
+def generate_weekly_digest(
+    days_back=7,
+    max_articles_extract=100,  # AugmentÃ© : 50 â†’ 100
+    max_articles_summarize=20,  # AugmentÃ© : 15 â†’ 20
+    min_relevance_score=20,
+    language='fr',
+    semantic_dedup=False,
+    already_covered='suppress',
+    archive=True,
+    resume=None,
+    run_id=None,
+    use_cache=True
+):
+    """
+    Pipeline complet gÃ©nÃ©ration digest hebdomadaire
+    
+    Args:
+        days_back: Nombre de jours Ã  rÃ©cupÃ©rer
+        max_articles_extract: Nombre max d'articles Ã  extraire en dÃ©tail
+        max_articles_summarize: Nombre max d'articles Ã  rÃ©sumer (IA)
+        min_relevance_score: Score minimum pour garder article
+        language: Langue des rÃ©sumÃ©s ('fr' ou 'en')
+        semantic_dedup: Dédup des paraphrases par embeddings (sentence-transformers)
+        already_covered: Articles déjà publiés dans un digest précédent :
+                         'suppress' (retirés) ou 'flag' (liens sans résumé IA)
+        archive: Ajouter les articles scorés à l'archive Parquet data/archive
+                 (False sur un runner éphémère : l'archive serait perdue)
+        resume: Id d'un run interrompu à reprendre (ou 'latest') : étapes déjà
+                terminées relues depuis leurs checkpoints, mêmes paramètres
+        run_id: Id du nouveau run (défaut: horodatage) ; un run existant
+                de même id est poursuivi
+        use_cache: Réutiliser les étapes des runs précédents aux entrées
+                   inchangées (False : tout recalculer, sauf reprise)
+    
+    Returns:
+        DataFrame avec rÃ©sumÃ©s gÃ©nÃ©rÃ©s
+    """
+    
+    print_banner()
+    
+    start_time = datetime.now()
+    
+    # Paramètres enregistrés avec le run : une reprise repart des mêmes réglages
+    params = {
+        'days_back': days_back,
+        'max_articles_extract': max_articles_extract,
+        'max_articles_summarize': max_articles_summarize,
+        'min_relevance_score': min_relevance_score,
+        'language': language,
+        'semantic_dedup': semantic_dedup,
+        'already_covered': already_covered,
+        'archive': archive,
+    }
+    
+    # Sorties de chaque étape persistées sous data/runs/<run_id>.db
+    try:
+        if resume:
+            checkpoint = RunCheckpoint.resume(resume)
+            params.update(checkpoint.params)
+            print(f"♻️  Resuming run {checkpoint.run_id} "
+                  f"(completed: {', '.join(checkpoint.completed()) or 'none'})\n")
+        else:
+            prune_runs()
+            checkpoint = RunCheckpoint(run_id, params=params)
+            print(f"💾 Run {checkpoint.run_id}\n")
+    except FileNotFoundError as e:
+        print(f"❌ ERROR: {e}")
         return pd.DataFrame()
     
+    # Étapes exécutées dans l'ordre du graphe, celles aux entrées inchangées relues
+    try:
+        results = PIPELINE.run(params, checkpoint, use_cache=use_cache)
+    except StageFailed as e:
+        return _stage_failed(checkpoint, e.stage)
+    
+    collect_stats = results['collect'][1]
+    score_stats = results['rank'][1]
+    filtered, covered = results['select'][0]['filtered'], results['select'][0]['covered']
+    summaries_df, cost = results['summarize'][0]['summaries'], results['summarize'][1]
+    
     # ============================================
     # SUMMARY
     # ============================================
@@ -237,12 +482,15 @@ def generate_weekly_digest(
     print("=" * 70)
     print()
     print(f"ðŸ“Š Summary:")
-    print(f"  â€¢ Total articles fetched: {len(articles_df)}")
-    print(f"  â€¢ Recent articles: {len(recent_df)}")
-    print(f"  â€¢ Articles extracted: {len(full_articles) if full_articles else 0}")
-    print(f"  â€¢ Articles scored: {len(ranked_df)}")
-    print(f"  â€¢ Articles filtered (score >= {min_relevance_score}): {len(filtered_df)}")
+    print(f"  â€¢ Total articles fetched: {collect_stats['fetched']}")
+    print(f"  â€¢ Recent articles: {collect_stats['recent']}")
+    print(f"  â€¢ Articles extracted: {collect_stats['extracted']}")
+    print(f"  • Downloads avoided (triage + adaptive budget): {collect_stats['downloads_avoided']}")
+    print(f"  â€¢ Articles scored: {score_stats['scored']}")
+    print(f"  â€¢ Articles filtered (score >= {params['min_relevance_score']}): {len(filtered)}")
+    print(f"  • Already covered in previous digests: {len(covered)}")
     print(f"  â€¢ Summaries generated: {len(summaries_df)}")
+    print(f"  • Run id: {checkpoint.run_id}")
     print()
     print(f"â±ï¸  Time elapsed: {elapsed.total_seconds():.1f} seconds")
     print(f"ðŸ’° Estimated cost: ${cost['total_cost']:.4f}")
@@ -275,6 +523,7 @@ Examples:
   python veille_motorsport/main.py --max-summaries 20 # 20 summaries
   python veille_motorsport/main.py --lang en          # English summaries
   python veille_motorsport/main.py --min-score 40     # Higher quality filter
+  python veille_motorsport/main.py --resume latest    # Resume the last interrupted run
         """
     )
     
@@ -313,6 +562,37 @@ Examples:
         help='Language for summaries (default: fr)'
     )
     
+    parser.add_argument(
+        '--already-covered',
+        choices=['suppress', 'flag'],
+        default='suppress',
+        help='Articles published in a previous digest: drop them, or list them without AI summary (default: suppress)'
+    )
+    
+    parser.add_argument(
+        '--semantic-dedup',
+        action='store_true',
+        help='Also merge paraphrased titles using local sentence embeddings (needs sentence-transformers)'
+    )
+    
+    parser.add_argument(
+        '--no-archive',
+        action='store_true',
+        help='Do not append scored articles to the Parquet archive (data/archive)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        metavar='RUN_ID',
+        help="Resume an interrupted run from its last completed stage ('latest' = most recent run)"
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Recompute every stage instead of reusing results of previous runs with unchanged inputs'
+    )
+    
     args = parser.parse_args()
     
     # GÃ©nÃ©rer digest
@@ -321,7 +601,12 @@ Examples:
         max_articles_extract=args.max_extract,
         max_articles_summarize=args.max_summaries,
         min_relevance_score=args.min_score,
-        language=args.lang
+        language=args.lang,
+        semantic_dedup=args.semantic_dedup,
+        already_covered=args.already_covered,
+        archive=not args.no_archive,
+        resume=args.resume,
+        use_cache=not args.no_cache
     )
     
     # Exit code
@@ -3,11 +3,42 @@ Manual Editor - Système d'édition manuelle du digest
 Permet d'ajuster le ranking, forcer/retirer articles après génération automatique
 """
 
-import pandas as pd
 import json
 from pathlib import Path
 
 
+def format_score_explanation(score_explain):
+    """
+    Formater une explication de score stockée (JSON de paires [composante, valeur])
+    
+    Ex: "REJECTED sports_rejected | kw: motogp" ou
+        "technical 26 | business 8 | bonus title_sport +10 | kw: drag 8, f1"
+    """
+    if not score_explain or score_explain != score_explain:
+        return "no explanation stored (re-run scoring)"
+    
+    parts = []
+    keywords = []
+    
+    for component, value in json.loads(score_explain):
+        kind, _, name = component.partition(':')
+        if kind == 'kw':
+            keywords.append(f"{name} {value}" if value else name)
+        elif kind == 'reject':
+            parts.insert(0, f"REJECTED {name}")
+        elif kind == 'tier':
+            parts.append(f"{name} {value}")
+        elif kind == 'cap':
+            parts.append(f"cap {name} -{value}")
+        elif kind == 'bonus':
+            parts.append(f"bonus {name} +{value}")
+    
+    if keywords:
+        parts.append("kw: " + ", ".join(keywords))
+    
+    return " | ".join(parts)
+
+
 class DigestEditor:
     """
     Éditeur manuel de digest
@@ -52,15 +83,16 @@ class DigestEditor:
             json.dump(self.adjustments, f, indent=2)
         print(f"✅ Adjustments saved to {self.adjustments_file}")
     
-    def show_top_articles(self, n=40):
+    def show_top_articles(self, n=40, explain=False):
         """
         Afficher top N articles avec scores
         
         Args:
             n: Nombre d'articles à afficher
+            explain: Afficher le détail du score stocké (score_explain), sans re-scorer
         """
         import sqlite3
-        from pathlib import Path
+        import pandas as pd
         
         # Vérifier que la base existe
         if not Path(self.db_path).exists():
@@ -83,8 +115,15 @@ class DigestEditor:
             conn.close()
             return pd.DataFrame()
         
+        # Explications de score : colonne absente des bases plus anciennes
+        cursor.execute("PRAGMA table_info(articles)")
+        has_explain = any(column[1] == 'score_explain' for column in cursor.fetchall())
+        explain_column = ", score_explain" if explain and has_explain else ""
+        if explain and not has_explain:
+            print("ℹ️  No score breakdown stored yet: re-run the pipeline to fill score_explain")
+        
         query = f"""
-            SELECT title, link, relevance_score, source, published
+            SELECT title, link, relevance_score, source, published{explain_column}
             FROM articles
             ORDER BY relevance_score DESC
             LIMIT {n}
@@ -113,6 +152,8 @@ class DigestEditor:
             print(f"    {row['title']}")
             print(f"    {url}")
             print(f"    Source: {row['source']}")
+            if explain_column:
+                print(f"    🔎 {format_score_explanation(row['score_explain'])}")
             if note:
                 print(f"    📝 Note: {note}")
         
@@ -182,7 +223,7 @@ class DigestEditor:
             DataFrame articles avec scores ajustés et articles bloqués retirés
         """
         import sqlite3
-        from pathlib import Path
+        import pandas as pd
         
         # Vérifier que la base existe
         if not Path(self.db_path).exists():
@@ -259,6 +300,7 @@ def interactive_editor():
     while True:
         print("\nCommands:")
         print("  1. Show top 40 articles")
+        print("  1e. Show top 40 articles with score breakdown")
         print("  2. Force article score")
         print("  3. Block article (hors sujet)")
         print("  4. Unblock article")
@@ -268,9 +310,9 @@ def interactive_editor():
         
         choice = input("\nChoice: ").strip()
         
-        if choice == '1':
+        if choice in ('1', '1e'):
             n = input("How many articles? [40]: ").strip() or '40'
-            editor.show_top_articles(int(n))
+            editor.show_top_articles(int(n), explain=(choice == '1e'))
         
         elif choice == '2':
             url = input("Article URL: ").strip()
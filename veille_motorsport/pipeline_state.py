@@ -0,0 +1,155 @@
+"""
+Pipeline State Module
+Export / import de l'état inter-runs de la base (fichier versionné dans git)
+
+Sur GitHub Actions, data/veille_motorsport.db est perdue à la fin de chaque
+run (et un cache actions/cache non relu pendant 7 jours est supprimé, soit
+exactement l'écart entre deux digests). L'état utile d'une semaine à l'autre
+est donc exporté dans state/pipeline_state.jsonl, commité avec docs/ :
+    - published_stories : articles déjà publiés (HISTORY_WEEKS dernières semaines)
+    - url_identity      : ids stables des articles (même fenêtre)
+    - feed_arrivals / feed_schedule : intervalles de polling appris
+    - scraper_strategies : sélecteurs qui marchent par site
+
+Les clés de bandes SimHash (published_bands) ne sont pas exportées :
+DigestHistory les reconstruit depuis published_stories.
+
+Format JSON Lines (diffs lisibles) : une ligne d'en-tête par table
+{"table", "schema", "columns"} puis une ligne [valeurs] par ligne de la table.
+
+Usage:
+    python -m veille_motorsport.pipeline_state import   # avant le run
+    python -m veille_motorsport.pipeline_state export   # après un digest publié
+"""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from .digest_history import HISTORY_WEEKS, digest_week
+from .feed_schedule import HISTORY_DAYS
+
+DB_PATH = 'data/veille_motorsport.db'
+STATE_PATH = 'state/pipeline_state.jsonl'
+
+
+def _state_tables():
+    """{table: (filtre WHERE, paramètres)} : lignes exportées, fenêtres de rétention comprises"""
+    oldest = datetime.now() - timedelta(weeks=HISTORY_WEEKS)
+    return {
+        'published_stories': ("digest_week >= ?", (digest_week(oldest),)),
+        'url_identity': ("last_seen >= ?", (oldest.isoformat(),)),
+        'feed_arrivals': ("published_ts >= ?", (int(time.time() - HISTORY_DAYS * 86400),)),
+        'feed_schedule': ("1", ()),
+        'scraper_strategies': ("1", ()),
+    }
+
+
+def export_state(db_path=DB_PATH, state_path=STATE_PATH):
+    """
+    Écrire l'état inter-runs de la base dans le fichier versionné
+    
+    Returns:
+        {table: lignes exportées}
+    """
+    if not os.path.exists(db_path):
+        print(f"⚠️  No database to export: {db_path}")
+        return {}
+    
+    counts = {}
+    lines = []
+    conn = sqlite3.connect(db_path)
+    try:
+        schemas = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+        for table, (where, params) in _state_tables().items():
+            if table not in schemas:
+                continue
+            cursor = conn.execute(f"SELECT * FROM {table} WHERE {where} ORDER BY 1, 2", params)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+            lines.append(json.dumps({'table': table, 'schema': schemas[table], 'columns': columns},
+                                    ensure_ascii=False))
+            lines.extend(json.dumps(list(row), ensure_ascii=False) for row in rows)
+            counts[table] = len(rows)
+    finally:
+        conn.close()
+    
+    os.makedirs(os.path.dirname(state_path) or '.', exist_ok=True)
+    tmp_path = f'{state_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(tmp_path, state_path)
+    
+    print(f"💾 Pipeline state exported to {state_path} "
+          f"({', '.join(f'{table}: {n}' for table, n in counts.items())})\n")
+    
+    return counts
+
+
+def import_state(db_path=DB_PATH, state_path=STATE_PATH):
+    """
+    Charger le fichier versionné dans la base (tables créées si absentes,
+    lignes existantes de même clé remplacées)
+    
+    Returns:
+        {table: lignes importées}
+    """
+    if not os.path.exists(state_path):
+        print(f"ℹ️  No pipeline state to import: {state_path}")
+        return {}
+    
+    counts = {}
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        table = insert_sql = None
+        with open(state_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    table = item['table']
+                    conn.execute(item['schema'].replace('CREATE TABLE', 'CREATE TABLE IF NOT EXISTS', 1))
+                    columns = item['columns']
+                    insert_sql = (f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                                  f"VALUES ({', '.join('?' * len(columns))})")
+                    counts[table] = 0
+                else:
+                    conn.execute(insert_sql, item)
+                    counts[table] += 1
+        conn.commit()
+    finally:
+        conn.close()
+    
+    print(f"♻️  Pipeline state imported from {state_path} "
+          f"({', '.join(f'{table}: {n}' for table, n in counts.items())})\n")
+    
+    return counts
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """Point d'entrée CLI"""
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Export/import the cross-run pipeline state')
+    parser.add_argument('action', choices=['export', 'import'])
+    parser.add_argument('--db', default=DB_PATH, help=f'SQLite database (default: {DB_PATH})')
+    parser.add_argument('--state', default=STATE_PATH, help=f'State file (default: {STATE_PATH})')
+    args = parser.parse_args()
+    
+    if args.action == 'export':
+        export_state(args.db, args.state)
+    else:
+        import_state(args.db, args.state)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,15 @@ RSS Aggregator Module
 Récupère et agrège les flux RSS des sources motorsport
 """
 
-import feedparser
-import pandas as pd
 from datetime import datetime, timedelta, timezone
 import sqlite3
 import os
 
+from .article_records import ArticleBatch
+from .date_normalizer import DateNormalizer, to_utc_series
+from .http_client import conditional_get
+from .url_identity import IdentityIndex
+
 # ============================================
 # FIX SSL pour macOS (développement local)
 # ============================================
@@ -47,27 +50,49 @@ RSS_FEEDS = {
     # FormulaE_Official RSS a une erreur de syntaxe
     # → Couvert par Motorsport_All + The_Race
     #
-    # Pour plus de sources, voir web_scraper.py (F1 Technical)
+    # Sources sans RSS (pages HTML, API JSON) : voir sources.py (EXTRA_SOURCES)
     # ============================================
 }
 
+# Entrées déjà vues dans l'ordre (plus récent d'abord) avant d'arrêter
+# la lecture d'un flux à la première entrée hors fenêtre
+SORTED_FEED_MIN_ENTRIES = 3
+
 
-def fetch_rss_feeds(feeds_dict=None, include_scraped=True):
+def fetch_rss_records(feeds_dict=None, cutoff=None, identity=None, http_cache=None):
     """
-    Récupérer tous les flux RSS + sources scrapées
+    Récupérer tous les flux RSS en ArticleBatch (sans DataFrame)
     
     Args:
         feeds_dict: Dictionnaire optionnel de feeds (utilise RSS_FEEDS par défaut)
-        include_scraped: Inclure sources scrapées (WEC, F1Tech)
+        cutoff: datetime UTC optionnel ; les entrées plus anciennes (ou sans date
+                valide) ne sont pas matérialisées ; un flux trié du plus récent
+                au plus ancien n'est pas lu au-delà de la première entrée trop vieille
+        identity: IdentityIndex persistant (défaut: index en mémoire pour ce run) ;
+                  chaque record reçoit un article_id stable, et un article déjà
+                  reçu sous une autre URL (tracking, AMP, autre source) est écarté
+        http_cache: Dict de validateurs HTTP (ETag / Last-Modified) par URL de flux,
+                    conservé entre deux appels : GET conditionnel via la session
+                    partagée, un flux inchangé (304) n'est ni téléchargé ni parsé
     
     Returns:
-        DataFrame avec tous les articles
+        ArticleBatch avec tous les articles
     """
     
+    import feedparser
+    
     if feeds_dict is None:
         feeds_dict = RSS_FEEDS
     
-    articles = []
+    cutoff_ts = cutoff.timestamp() if cutoff is not None else None
+    
+    if identity is None:
+        identity = IdentityIndex(db_path=None)
+    
+    batch = ArticleBatch()
+    dates = DateNormalizer()
+    skipped = 0
+    duplicates = 0
     
     print(f"📡 Fetching {len(feeds_dict)} RSS feeds...\n")
     
@@ -75,36 +100,157 @@ def fetch_rss_feeds(feeds_dict=None, include_scraped=True):
         print(f"  → {source_name}...", end=" ")
         
         try:
-            feed = feedparser.parse(rss_url)
+            if http_cache is None:
+                feed = feedparser.parse(rss_url)
+            else:
+                response = conditional_get(rss_url, http_cache)
+                if response is None:
+                    print("✅ not modified")
+                    continue
+                feed = feedparser.parse(response.content)
             
             if feed.bozo:  # Erreur de parsing
                 print(f"⚠️  Warning: {feed.bozo_exception}")
                 continue
             
+            # Un horodatage par flux, partagé par ses articles
+            fetched_at = datetime.now().isoformat()
+            
             count = 0
-            for entry in feed.entries:
-                article = {
-                    'source': source_name,
-                    'title': entry.get('title', ''),
-                    'link': entry.get('link', ''),
-                    'published': entry.get('published', entry.get('updated', '')),
-                    'summary': entry.get('summary', entry.get('description', '')),
-                    'fetched_at': datetime.now().isoformat()
-                }
-                articles.append(article)
+            feed_skipped = 0
+            previous_ts = None
+            sorted_desc = True
+            stopped_early = False
+            
+            for position, entry in enumerate(feed.entries):
+                published = entry.get('published', entry.get('updated', ''))
+                
+                # Date normalisée dès l'ingestion (struct feedparser si disponible)
+                published_ts = dates.normalize(
+                    published,
+                    entry.get('published_parsed') or entry.get('updated_parsed')
+                )
+                
+                if cutoff_ts is not None:
+                    if published_ts is None:
+                        feed_skipped += 1
+                        continue
+                    
+                    if previous_ts is not None and published_ts > previous_ts:
+                        sorted_desc = False
+                    previous_ts = published_ts
+                    
+                    if published_ts < cutoff_ts:
+                        # Flux trié sur assez d'entrées : le reste est plus ancien
+                        if sorted_desc and position >= SORTED_FEED_MIN_ENTRIES:
+                            feed_skipped += len(feed.entries) - position
+                            stopped_early = True
+                            break
+                        feed_skipped += 1
+                        continue
+                
+                # Même article sous une autre URL : ni record, ni téléchargement
+                article_id, duplicate = identity.resolve(entry.get('link', ''), entry.get('title', ''), source_name)
+                if duplicate:
+                    duplicates += 1
+                    continue
+                
+                record = batch.add(
+                    source_name,
+                    entry.get('title', ''),
+                    entry.get('link', ''),
+                    published,
+                    entry.get('summary', entry.get('description', '')),
+                    fetched_at,
+                )
+                record.published_ts = published_ts
+                record.article_id = article_id
                 count += 1
             
-            print(f"✅ {count} articles")
+            skipped += feed_skipped
+            if feed_skipped:
+                print(f"✅ {count} articles ({feed_skipped} out of window"
+                      f"{', stopped early' if stopped_early else ''})")
+            else:
+                print(f"✅ {count} articles")
                 
         except Exception as e:
             print(f"❌ Error: {e}")
     
-    print(f"\n✅ RSS Total: {len(articles)} articles fetched")
+    print(f"\n✅ RSS Total: {len(batch)} articles fetched")
+    if skipped:
+        print(f"  • {skipped} entries older than cutoff (or undated) not loaded")
+    if duplicates:
+        print(f"  • {duplicates} duplicate URLs skipped (same canonical URL or title)")
+    dates.report()
+    
+    # Sources hors RSS et fetch parallèle : sources.fetch_sources
+    
+    return batch
+
+
+def fetch_rss_feeds(feeds_dict=None, include_scraped=True, cutoff=None, identity=None):
+    """
+    Récupérer tous les flux RSS + sources scrapées
+    
+    Args:
+        feeds_dict: Dictionnaire optionnel de feeds (utilise RSS_FEEDS par défaut)
+        include_scraped: Inclure sources scrapées (WEC, F1Tech)
+        cutoff: datetime UTC optionnel, entrées plus anciennes ignorées au fetch
+        identity: IdentityIndex optionnel (voir fetch_rss_records)
+    
+    Returns:
+        DataFrame avec tous les articles (published_dt : datetime UTC, NaT si date invalide)
+    """
+    return fetch_rss_records(feeds_dict, cutoff=cutoff, identity=identity).to_dataframe(
+        columns=['article_id', 'source', 'title', 'link', 'published', 'published_dt', 'summary', 'fetched_at']
+    )
+
+
+def _published_timestamps(values, dates):
+    """Dates texte → epochs UTC (None si absente ou invalide)"""
+    return [dates.normalize(value) for value in values]
+
+
+def filter_recent_records(batch, hours=168):
+    """
+    Filtrer un ArticleBatch sur les articles récents (sans copier les textes)
+    
+    Args:
+        batch: ArticleBatch
+        hours: Nombre d'heures à garder
+    
+    Returns:
+        ArticleBatch filtré, trié du plus récent au plus ancien
+    """
     
-    # Note: Web scraping désactivé (contenu déjà couvert par RSS)
-    # Si besoin : réactiver web_scraper.py pour F1 Technical
+    if batch.empty:
+        print("⚠️  No articles to filter")
+        return batch
     
-    return pd.DataFrame(articles)
+    print(f"🔍 Filtering articles from last {hours} hours ({hours//24} days)...")
+    
+    # Dates déjà normalisées au fetch ; sinon (batch construit ailleurs) parsées ici
+    dates = DateNormalizer()
+    for record in batch:
+        if record.published_ts is None:
+            record.published_ts = dates.normalize(record.published)
+    dates.report()
+    
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).timestamp()
+    
+    # Garder articles avec date valide et récente
+    recent = [
+        record for record in batch
+        if record.published_ts is not None and record.published_ts >= cutoff
+    ]
+    
+    # Trier par date (plus récent en premier)
+    recent.sort(key=lambda record: record.published_ts, reverse=True)
+    
+    print(f"✅ {len(recent)} recent articles (from {len(batch)} total)\n")
+    
+    return ArticleBatch(recent, batch.texts)
 
 
 def filter_recent_articles(df, hours=168):
@@ -125,15 +271,17 @@ def filter_recent_articles(df, hours=168):
     
     print(f"🔍 Filtering articles from last {hours} hours ({hours//24} days)...")
     
-    # Parser dates (formats variés selon sources) - AVEC UTC
-    df['published_dt'] = pd.to_datetime(df['published'], errors='coerce', utc=True)
-    
-    # Garder articles avec date valide
-    df_with_date = df[df['published_dt'].notna()].copy()
+    # Dates UTC : colonne de l'ingestion si présente, sinon parsing mémoïsé
+    if 'published_dt' in df.columns:
+        published_dt = df['published_dt']
+    else:
+        dates = DateNormalizer()
+        published_dt = to_utc_series(_published_timestamps(df['published'].tolist(), dates), index=df.index)
+        dates.report()
     
-    # Filtrer par date - AVEC UTC
+    # Garder articles avec date valide, récente (un seul masque, une seule copie)
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    recent = df_with_date[df_with_date['published_dt'] >= cutoff].copy()
+    recent = df[published_dt >= cutoff].assign(published_dt=published_dt)
     
     # Trier par date (plus récent en premier)
     recent = recent.sort_values('published_dt', ascending=False)
@@ -163,6 +311,10 @@ def save_to_database(df, db_path='data/veille_motorsport.db'):
     
     conn = sqlite3.connect(db_path)
     
+    # Un article = un article_id (URL canonique), même reçu sous plusieurs URLs
+    if 'article_id' in df.columns:
+        df = df[df['article_id'].isna() | ~df.duplicated('article_id')]
+    
     try:
         # Stratégie : replace au lieu d'append pour mettre à jour
         df.to_sql('articles', conn, if_exists='replace', index=False)
@@ -189,6 +341,8 @@ def get_articles_from_db(db_path='data/veille_motorsport.db', days=7):
         DataFrame avec articles
     """
     
+    import pandas as pd
+    
     if not os.path.exists(db_path):
         print(f"⚠️  Database not found: {db_path}")
         return pd.DataFrame()
@@ -0,0 +1,241 @@
+"""
+Run Checkpoints Module
+Sorties de chaque étape du pipeline persistées par run, pour reprendre un run
+
+Un run = un fichier SQLite data/runs/<run_id>.db :
+    - table _run     : paramètres du run (JSON)
+    - table _stages  : étapes terminées (+ compteurs JSON, clé d'entrées,
+                       run d'origine des sorties si relues d'un run précédent)
+    - <étape>__<nom> : DataFrames produits par l'étape
+
+Une étape n'est marquée terminée qu'après l'écriture de toutes ses tables :
+un run interrompu reprend à la première étape non terminée.
+
+La clé d'entrées (stage_graph) permet aussi de relire une étape d'un run
+précédent quand ses entrées n'ont pas changé (find_stage).
+
+Usage:
+    python -m veille_motorsport.main --resume 20260119-070012
+    python -m veille_motorsport.main --resume latest
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+RUNS_DIR = 'data/runs'
+
+# Runs conservés (les plus récents), au-delà supprimés à la création d'un run
+RUNS_KEEP = 20
+
+
+def new_run_id():
+    """Identifiant de run horodaté (tri chronologique = tri alphabétique)"""
+    return datetime.now().strftime('%Y%m%d-%H%M%S')
+
+
+def _run_ids(runs_dir=RUNS_DIR):
+    """Ids des runs, du plus ancien au plus récent"""
+    if not os.path.isdir(runs_dir):
+        return []
+    return sorted(name[:-3] for name in os.listdir(runs_dir) if name.endswith('.db'))
+
+
+def latest_run_id(runs_dir=RUNS_DIR):
+    """Run le plus récent, None si aucun"""
+    runs = _run_ids(runs_dir)
+    return runs[-1] if runs else None
+
+
+def find_stage(stage, key=None, max_age=None, exclude=None, runs_dir=RUNS_DIR):
+    """
+    Run le plus récent ayant terminé une étape
+    
+    Args:
+        stage: Nom de l'étape
+        key: Clé d'entrées exigée (None = dernier résultat, quelles que soient les entrées)
+        max_age: timedelta, résultats plus anciens ignorés
+        exclude: Run à ignorer (le run en cours)
+    
+    Returns:
+        RunCheckpoint, ou None
+    """
+    oldest = (datetime.now() - max_age).isoformat() if max_age else ''
+    
+    for run_id in reversed(_run_ids(runs_dir)):
+        if run_id == exclude:
+            continue
+        checkpoint = RunCheckpoint(run_id, runs_dir=runs_dir)
+        completed_at = checkpoint.completed_at(stage)
+        if completed_at and completed_at >= oldest and (key is None or checkpoint.stage_key(stage) == key):
+            return checkpoint
+    
+    return None
+
+
+def prune_runs(keep=RUNS_KEEP, runs_dir=RUNS_DIR):
+    """Supprimer les runs au-delà des `keep` plus récents"""
+    for run_id in _run_ids(runs_dir)[:-keep]:
+        os.remove(os.path.join(runs_dir, f'{run_id}.db'))
+
+
+class RunCheckpoint:
+    """
+    Checkpoints d'un run
+    
+    Ex:
+        checkpoint = RunCheckpoint(params={'days_back': 7})
+        if not checkpoint.has('collect'):
+            checkpoint.save('collect', {'recent': recent_df}, {'fetched': 312})
+        frames, stats = checkpoint.load('collect')
+    """
+    
+    def __init__(self, run_id=None, params=None, runs_dir=RUNS_DIR):
+        self.run_id = run_id or new_run_id()
+        self.runs_dir = runs_dir
+        self.path = os.path.join(runs_dir, f'{self.run_id}.db')
+        
+        os.makedirs(runs_dir, exist_ok=True)
+        conn = self._connect()
+        try:
+            if params is not None:
+                conn.execute("INSERT OR IGNORE INTO _run (id, params) VALUES (1, ?)", (json.dumps(params),))
+                conn.commit()
+        finally:
+            conn.close()
+    
+    @classmethod
+    def resume(cls, run_id, runs_dir=RUNS_DIR):
+        """Rouvrir un run existant ('latest' = le plus récent)"""
+        if run_id == 'latest':
+            run_id = latest_run_id(runs_dir)
+        if not run_id or not os.path.exists(os.path.join(runs_dir, f'{run_id}.db')):
+            raise FileNotFoundError(f"No checkpoints for run '{run_id}' in {runs_dir}")
+        return cls(run_id, runs_dir=runs_dir)
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS _run (id INTEGER PRIMARY KEY, params TEXT);
+            CREATE TABLE IF NOT EXISTS _stages (
+                name TEXT PRIMARY KEY,
+                completed_at TEXT,
+                stats TEXT,
+                key TEXT,
+                origin TEXT
+            );
+            """
+        )
+        # Runs créés avant les clés d'entrées / l'origine des sorties
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(_stages)")}
+        for column in ('key', 'origin'):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE _stages ADD COLUMN {column} TEXT")
+        return conn
+    
+    @property
+    def params(self):
+        """Paramètres enregistrés au démarrage du run ({} si aucun)"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT params FROM _run WHERE id = 1").fetchone()
+            return json.loads(row[0]) if row else {}
+        finally:
+            conn.close()
+    
+    def completed(self):
+        """Étapes terminées, dans l'ordre"""
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute("SELECT name FROM _stages ORDER BY completed_at")]
+        finally:
+            conn.close()
+    
+    def has(self, stage):
+        return stage in self.completed()
+    
+    def _stage_row(self, stage):
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT completed_at, key, origin FROM _stages WHERE name = ?", (stage,)).fetchone()
+        finally:
+            conn.close()
+    
+    def completed_at(self, stage):
+        """Horodatage ISO de fin d'une étape, None si pas terminée"""
+        row = self._stage_row(stage)
+        return row[0] if row else None
+    
+    def stage_key(self, stage):
+        """Clé d'entrées enregistrée pour une étape (None si pas terminée ou sans clé)"""
+        row = self._stage_row(stage)
+        return row[1] if row else None
+    
+    def stage_origin(self, stage):
+        """Run qui a calculé les sorties d'une étape (ce run si non relues d'ailleurs)"""
+        row = self._stage_row(stage)
+        return (row[2] or self.run_id) if row else None
+    
+    def save(self, stage, frames=None, stats=None, key=None, origin=None):
+        """
+        Persister les sorties d'une étape puis la marquer terminée
+        
+        Args:
+            stage: Nom de l'étape
+            frames: {nom: DataFrame ou ArticleBatch (converti, relu en DataFrame)}
+            stats: Dict JSON-sérialisable (compteurs, coût...)
+            key: Clé d'entrées de l'étape (stage_graph)
+            origin: Run qui a calculé ces sorties (défaut: ce run)
+        """
+        frames = {name: df.to_dataframe() if hasattr(df, 'to_dataframe') else df
+                  for name, df in (frames or {}).items()}
+        stats = dict(stats or {})
+        
+        # Colonnes datetime (UTC) : retypées au chargement
+        stats['_datetime_columns'] = {
+            name: [c for c in df.columns if str(df[c].dtype).startswith('datetime64')]
+            for name, df in frames.items()
+        }
+        
+        conn = self._connect()
+        try:
+            for name, df in frames.items():
+                df.to_sql(f'{stage}__{name}', conn, if_exists='replace', index=False)
+            conn.execute(
+                "INSERT OR REPLACE INTO _stages (name, completed_at, stats, key, origin) VALUES (?, ?, ?, ?, ?)",
+                (stage, datetime.now().isoformat(), json.dumps(stats, default=str), key, origin or self.run_id)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def load(self, stage):
+        """
+        Sorties d'une étape terminée
+        
+        Returns:
+            ({nom: DataFrame}, stats)
+        """
+        import pandas as pd
+        
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT stats FROM _stages WHERE name = ?", (stage,)).fetchone()
+            if row is None:
+                raise KeyError(f"Stage '{stage}' not completed in run {self.run_id}")
+            
+            stats = json.loads(row[0])
+            datetime_columns = stats.pop('_datetime_columns', {})
+            
+            frames = {}
+            for name, columns in datetime_columns.items():
+                df = pd.read_sql_query(f'SELECT * FROM "{stage}__{name}"', conn)
+                for column in columns:
+                    df[column] = pd.to_datetime(df[column], utc=True, errors='coerce')
+                frames[name] = df
+        finally:
+            conn.close()
+        
+        return frames, stats
@@ -0,0 +1,299 @@
+"""
+Semantic Dedup Module
+Doublons par similarité sémantique (embeddings locaux, CPU, hors ligne)
+
+La similarité de chaînes rate les paraphrases ("McLaren signs Jensen" vs
+"McLaren names first Hypercar driver"). Ici titre + début du texte sont
+encodés par un petit modèle sentence-transformers (all-MiniLM-L6-v2, 384
+dimensions, ~80 Mo, tourne sur CPU) ; les voisins proches viennent d'un
+index en mémoire : produit scalaire NumPy (force brute) sous 10k articles,
+HNSW (hnswlib) au-delà.
+
+Optionnel : pip install sentence-transformers (+ hnswlib pour > 10k articles).
+Le modèle doit être présent dans le cache local (un premier téléchargement,
+puis HF_HUB_OFFLINE=1). Les embeddings sont mis en cache par article
+(table article_embeddings de la base), avec le hash du texte encodé : un
+article n'est ré-encodé que si ce texte change (résumé RSS puis texte complet).
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+DB_PATH = 'data/veille_motorsport.db'
+EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+# Cosinus minimal entre deux articles de la même news
+SEMANTIC_THRESHOLD = 0.80
+# Voisins examinés par article
+NEIGHBOURS = 10
+# Au-delà : index HNSW plutôt que force brute
+BRUTE_FORCE_MAX = 10000
+# Caractères du texte ajoutés au titre
+LEAD_CHARS = 300
+
+_model = None
+
+
+def _import_sentence_transformers():
+    """Importer sentence-transformers (ImportError explicite si absent)"""
+    try:
+        import sentence_transformers
+    except ImportError as e:
+        raise ImportError(
+            "sentence-transformers is required for semantic dedup (pip install sentence-transformers)"
+        ) from e
+    return sentence_transformers
+
+
+def _load_model():
+    """Charger le modèle d'embedding à la demande (une seule fois)"""
+    global _model
+    
+    if _model is None:
+        _model = _import_sentence_transformers().SentenceTransformer(EMBEDDING_MODEL, device='cpu')
+    
+    return _model
+
+
+def article_input(title, text):
+    """Texte encodé : titre + début de l'article"""
+    lead = ' '.join((text or '')[:LEAD_CHARS].split())
+    return f"{title or ''}. {lead}".strip()
+
+
+def input_hash(text):
+    """Hash court du texte encodé (invalide l'embedding en cache s'il change)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class EmbeddingCache:
+    """Embeddings float32 normalisés par (article_id, modèle) + hash du texte encodé, table SQLite"""
+    
+    def __init__(self, db_path=DB_PATH, model_name=EMBEDDING_MODEL):
+        self.db_path = db_path
+        self.model_name = model_name
+    
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS article_embeddings (
+                article_id TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (article_id, model)
+            )
+            """
+        )
+        # Tables plus anciennes : sans hash, chaque embedding sera ré-encodé une fois
+        columns = {column[1] for column in conn.execute("PRAGMA table_info(article_embeddings)")}
+        if 'input_hash' not in columns:
+            conn.execute("ALTER TABLE article_embeddings ADD COLUMN input_hash TEXT")
+        return conn
+    
+    def get_many(self, hashes):
+        """
+        {clé: vecteur} pour les clés déjà encodées avec le même texte
+        
+        Args:
+            hashes: {clé: input_hash du texte à encoder}
+        """
+        import numpy as np
+        
+        if not hashes or not self.db_path:
+            return {}
+        
+        conn = self._connect()
+        try:
+            found = {}
+            keys = list(hashes)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT article_id, input_hash, vector FROM article_embeddings "
+                    f"WHERE model = ? AND article_id IN ({','.join('?' * len(chunk))})",
+                    [self.model_name] + chunk
+                )
+                for key, stored_hash, blob in rows:
+                    if stored_hash == hashes[key]:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+            return found
+        finally:
+            conn.close()
+    
+    def put_many(self, vectors, hashes):
+        """Enregistrer {clé: vecteur} avec le hash du texte encodé ({clé: input_hash})"""
+        if not vectors or not self.db_path:
+            return
+        
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO article_embeddings (article_id, model, input_hash, vector) VALUES (?, ?, ?, ?)",
+                [(key, self.model_name, hashes[key], vector.astype('float32').tobytes())
+                 for key, vector in vectors.items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def embed_articles(keys, inputs, cache=None):
+    """
+    Embeddings normalisés (matrice n × d), cache consulté puis complété
+    
+    Args:
+        keys: Identifiants stables (article_id), un par article
+        inputs: Textes à encoder (article_input), parallèles à keys
+        cache: EmbeddingCache optionnel
+    
+    Returns:
+        (matrice float32, nombre d'articles encodés ce run)
+    """
+    import numpy as np
+    
+    hashes = {key: input_hash(text) for key, text in zip(keys, inputs)}
+    cached = cache.get_many(hashes) if cache is not None else {}
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    
+    if missing:
+        vectors = _load_model().encode(
+            [inputs[i] for i in missing],
+            batch_size=64,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+        computed = {keys[i]: vector for i, vector in zip(missing, vectors)}
+        if cache is not None:
+            cache.put_many(computed, hashes)
+        cached.update(computed)
+    
+    return np.vstack([cached[key] for key in keys]).astype('float32'), len(missing)
+
+
+def _neighbours(embeddings, k):
+    """
+    k plus proches voisins de chaque article (indices, cosinus)
+    
+    Force brute (un produit matriciel) sous BRUTE_FORCE_MAX articles,
+    HNSW au-delà si hnswlib est installé (sinon force brute par blocs).
+    """
+    import numpy as np
+    
+    n = len(embeddings)
+    k = min(k + 1, n)
+    
+    if n > BRUTE_FORCE_MAX:
+        try:
+            import hnswlib
+        except ImportError:
+            hnswlib = None
+            print("⚠️  hnswlib not installed, using brute force (pip install hnswlib)")
+        
+        if hnswlib is not None:
+            index = hnswlib.Index(space='ip', dim=embeddings.shape[1])
+            index.init_index(max_elements=n, ef_construction=200, M=16)
+            index.add_items(embeddings, np.arange(n))
+            index.set_ef(max(50, k))
+            labels, distances = index.knn_query(embeddings, k=k)
+            return labels, 1.0 - distances
+    
+    labels = np.empty((n, k), dtype=np.int64)
+    similarities = np.empty((n, k), dtype=np.float32)
+    for start in range(0, n, 2048):
+        block = embeddings[start:start + 2048] @ embeddings.T
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        labels[start:start + len(block)] = top
+        similarities[start:start + len(block)] = np.take_along_axis(block, top, axis=1)
+    return labels, similarities
+
+
+def semantic_pairs(keys, titles, texts, threshold=SEMANTIC_THRESHOLD, cache=None):
+    """
+    Paires (i, j), i < j, d'articles sémantiquement identiques
+    
+    Args:
+        keys: Identifiants stables pour le cache (article_id ou link)
+        titles, texts: Listes parallèles
+        threshold: Cosinus minimal
+        cache: EmbeddingCache optionnel
+    
+    Returns:
+        (set de paires, stats de latence)
+    """
+    
+    # Backend absent : échouer avant de toucher au cache
+    _import_sentence_transformers()
+    
+    n = len(keys)
+    if n < 2:
+        return set(), {'articles': n, 'encoded': 0, 'embed_ms_per_1k': 0.0, 'index_ms_per_1k': 0.0}
+    
+    start = time.perf_counter()
+    embeddings, encoded = embed_articles(keys, [article_input(t, x) for t, x in zip(titles, texts)], cache)
+    embedded = time.perf_counter()
+    
+    labels, similarities = _neighbours(embeddings, NEIGHBOURS)
+    
+    pairs = set()
+    for i, (row_labels, row_similarities) in enumerate(zip(labels.tolist(), similarities.tolist())):
+        for j, similarity in zip(row_labels, row_similarities):
+            if j != i and similarity >= threshold:
+                pairs.add((min(i, j), max(i, j)))
+    
+    done = time.perf_counter()
+    stats = {
+        'articles': n,
+        'encoded': encoded,
+        'embed_ms_per_1k': (embedded - start) * 1e6 / n,
+        'index_ms_per_1k': (done - embedded) * 1e6 / n,
+    }
+    
+    print(f"  🧠 Semantic: {n} articles ({encoded} encoded, {n - encoded} cached), "
+          f"{len(pairs)} pairs >= {threshold} | "
+          f"embed {stats['embed_ms_per_1k']:.0f} ms/1k, index {stats['index_ms_per_1k']:.0f} ms/1k")
+    
+    return pairs, stats
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main():
+    """Mesurer la latence (ms / 1k articles) sur les articles de la base"""
+    
+    import argparse
+    
+    import pandas as pd
+    
+    parser = argparse.ArgumentParser(description='Semantic duplicate pairs and latency on stored articles')
+    parser.add_argument('--db', default=DB_PATH, help=f'SQLite database (default: {DB_PATH})')
+    parser.add_argument('--limit', type=int, default=1000, help='Articles to embed (default: 1000)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached embeddings (cold latency)')
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.db):
+        print(f"❌ Database not found: {args.db}")
+        return
+    
+    conn = sqlite3.connect(args.db)
+    df = pd.read_sql_query(f"SELECT * FROM articles LIMIT {int(args.limit)}", conn)
+    conn.close()
+    
+    keys = (df['article_id'] if 'article_id' in df.columns else df['link']).astype(str).tolist()
+    texts = df['text'].fillna('').tolist() if 'text' in df.columns else [''] * len(df)
+    cache = None if args.no_cache else EmbeddingCache(args.db)
+    
+    pairs, _ = semantic_pairs(keys, df['title'].tolist(), texts, cache=cache)
+    
+    for i, j in sorted(pairs)[:20]:
+        print(f"  • {df['title'][i][:60]}  ≈  {df['title'][j][:60]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,556 @@
+"""
+Sources Module
+Registre de sources d'articles derrière une interface asynchrone commune
+
+Chaque type de source (flux RSS, sitemap news, page listing HTML, API JSON)
+implémente `async fetch(client)` : un générateur asynchrone d'entrées
+normalisées (dict title / link / published / published_parsed / summary).
+Ajouter un type = une sous-classe de Source enregistrée par
+@register_source('type'), construite depuis un dict de configuration
+(build_source).
+
+fetch_sources interroge toutes les sources en parallèle (asyncio) à travers un
+SourceClient partagé :
+    - politesse commune : requêtes simultanées bornées, délai minimal entre
+      deux requêtes vers un même hôte (plus de sleep fixe entre deux sites)
+    - cache commun : session HTTP partagée (keep-alive), GET conditionnels
+      si des validateurs sont fournis (mode continu)
+Le temps total est celui de la source la plus lente, pas leur somme : ajouter
+une source n'allonge pas le fetch.
+
+Ex:
+    batch, failed = fetch_sources(default_sources(), cutoff=cutoff, identity=identity)
+"""
+
+import asyncio
+import html
+import json
+import re
+import time
+import zlib
+from datetime import datetime
+from urllib.parse import unquote, urlsplit
+
+from .article_records import ArticleBatch
+from .date_normalizer import DateNormalizer
+from .http_client import conditional_get
+from .rss_aggregator import RSS_FEEDS, SORTED_FEED_MIN_ENTRIES
+from .url_identity import IdentityIndex
+
+# Requêtes simultanées, toutes sources confondues (sous la taille du pool HTTP)
+MAX_CONCURRENT_REQUESTS = 8
+# Délai minimal entre deux requêtes vers un même hôte (secondes)
+HOST_DELAY = 1.0
+# Taille des blocs lus en streaming (sitemaps)
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Sources hors RSS (désactivées : contenu déjà couvert par les flux RSS)
+EXTRA_SOURCES = [
+    {'name': 'FIA_WEC', 'type': 'html', 'url': 'https://www.fiawec.com/fr/page/news/30',
+     'parser': 'fiawec', 'enabled': False},
+    {'name': 'F1_Technical', 'type': 'html', 'url': 'https://www.f1technical.net/news/',
+     'parser': 'f1technical', 'enabled': False},
+]
+
+SOURCE_TYPES = {}
+
+
+def register_source(kind):
+    """Décorateur : enregistrer une classe de source sous un type de configuration"""
+    
+    def decorator(cls):
+        cls.kind = kind
+        SOURCE_TYPES[kind] = cls
+        return cls
+    
+    return decorator
+
+
+class SourceClient:
+    """
+    Accès HTTP partagé par les sources d'un même fetch
+    
+    Les requêtes passent par la session partagée (http_client) dans des
+    threads ; l'event loop ne fait qu'ordonnancer.
+    """
+    
+    def __init__(self, http_cache=None, max_concurrent=MAX_CONCURRENT_REQUESTS, host_delay=HOST_DELAY):
+        self.http_cache = http_cache  # Validateurs par URL (None : GET simples)
+        self.host_delay = host_delay
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._host_locks = {}
+        self._last_request = {}  # Hôte -> instant (monotonic) de la dernière requête
+        self.not_modified = set()
+        self.requests = 0
+        self.bytes = 0
+    
+    async def _wait_for_host(self, host):
+        """Espacer les requêtes vers un même hôte d'au moins host_delay"""
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._last_request.get(host, 0.0) + self.host_delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request[host] = time.monotonic()
+    
+    async def _request(self, url, headers, stream=False):
+        validators = self.http_cache if self.http_cache is not None else {}
+        response = await asyncio.to_thread(conditional_get, url, validators, headers, stream=stream)
+        
+        self.requests += 1
+        if response is None:
+            self.not_modified.add(url)
+        return response
+    
+    async def get(self, url, headers=None):
+        """
+        Contenu d'une URL
+        
+        Returns:
+            bytes, ou None si inchangé depuis le dernier fetch (304)
+        """
+        await self._wait_for_host(urlsplit(url).netloc)
+        async with self._slots:
+            response = await self._request(url, headers)
+        
+        if response is None:
+            return None
+        self.bytes += len(response.content)
+        return response.content
+    
+    async def stream(self, url, headers=None):
+        """
+        Contenu d'une URL par blocs (générateur asynchrone, rien si 304)
+        
+        Le téléchargement s'arrête quand le consommateur s'arrête : les
+        octets après la dernière entrée utile ne sont pas transférés.
+        """
+        await self._wait_for_host(urlsplit(url).netloc)
+        async with self._slots:
+            response = await self._request(url, headers, stream=True)
+            if response is None:
+                return
+            
+            chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                    if chunk is None:
+                        break
+                    self.bytes += len(chunk)
+                    yield chunk
+            finally:
+                response.close()
+
+
+class Source:
+    """Source d'articles : une sous-classe par type, un fetch() asynchrone"""
+    
+    kind = None
+    
+    def __init__(self, name, url, enabled=True, headers=None):
+        self.name = name
+        self.url = url
+        self.enabled = enabled
+        self.headers = headers
+    
+    async def fetch(self, client):
+        """Entrées normalisées de la source (générateur asynchrone)"""
+        raise NotImplementedError
+        yield
+    
+    def config(self):
+        """Configuration (reconstructible par build_source)"""
+        return {'name': self.name, 'type': self.kind, 'url': self.url, 'enabled': self.enabled}
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r}, {self.url!r})"
+
+
+@register_source('rss')
+class RSSSource(Source):
+    """Flux RSS / Atom (feedparser)"""
+    
+    async def fetch(self, client):
+        import feedparser
+        
+        content = await client.get(self.url, self.headers)
+        if content is None:
+            return
+        
+        feed = await asyncio.to_thread(feedparser.parse, content)
+        if feed.bozo:  # Erreur de parsing
+            raise ValueError(f"invalid feed ({feed.bozo_exception})")
+        
+        for entry in feed.entries:
+            yield {
+                'title': entry.get('title', ''),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', entry.get('updated', '')),
+                'published_parsed': entry.get('published_parsed') or entry.get('updated_parsed'),
+                'summary': entry.get('summary', entry.get('description', '')),
+            }
+
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+NEWS_NS = '{http://www.google.com/schemas/sitemap-news/0.9}'
+
+
+def _title_from_url(url):
+    """Titre de repli depuis le slug de l'URL ('/news/le-mans-test-day' → 'Le mans test day')"""
+    segments = [segment for segment in urlsplit(url).path.split('/') if segment]
+    if not segments:
+        return ''
+    slug = re.sub(r'\.\w+$', '', unquote(segments[-1]))
+    words = re.sub(r'[-_]+', ' ', slug).strip()
+    return words[:1].upper() + words[1:]
+
+
+@register_source('sitemap')
+class SitemapSource(Source):
+    """
+    Sitemap XML, news-sitemap de préférence (titre + date de publication)
+    
+    Bien plus léger qu'une page listing : ni HTML, ni cascade de sélecteurs,
+    dates structurées. Lu en streaming et parsé au fil des blocs (lxml,
+    XMLPullParser : iterparse alimenté par le réseau), chaque <url> libéré
+    après lecture : mémoire constante, et une lecture arrêtée à la fenêtre
+    (sitemap trié) arrête aussi le téléchargement. GET conditionnel : un
+    sitemap inchangé (304) n'est pas retéléchargé.
+    
+    Un index de sitemaps (<sitemapindex>) est suivi vers ses max_sitemaps
+    sitemaps les plus récents (lastmod). Sitemaps .xml.gz décompressés à la
+    volée.
+    """
+    
+    def __init__(self, name, url, max_sitemaps=2, **options):
+        super().__init__(name, url, **options)
+        self.max_sitemaps = max_sitemaps
+    
+    @staticmethod
+    def _entry(element):
+        loc = element.findtext(SITEMAP_NS + 'loc', '').strip()
+        news = element.find(NEWS_NS + 'news')
+        title = published = keywords = ''
+        if news is not None:
+            title = news.findtext(NEWS_NS + 'title', '').strip()
+            published = news.findtext(NEWS_NS + 'publication_date', '').strip()
+            keywords = news.findtext(NEWS_NS + 'keywords', '').strip()
+        return {
+            'title': title or _title_from_url(loc),
+            'link': loc,
+            'published': published or element.findtext(SITEMAP_NS + 'lastmod', '').strip(),
+            'published_parsed': None,
+            'summary': keywords,  # Mots-clés news : seul texte disponible pour le triage
+        }
+    
+    @classmethod
+    def _read_events(cls, parser, children):
+        """Entrées des <url> complets reçus jusqu'ici (<sitemap> d'un index → children)"""
+        for _, element in parser.read_events():
+            if element.tag == SITEMAP_NS + 'url':
+                entry = cls._entry(element)
+            else:
+                entry = None
+                children.append((
+                    element.findtext(SITEMAP_NS + 'lastmod', '').strip(),
+                    element.findtext(SITEMAP_NS + 'loc', '').strip(),
+                ))
+            
+            # Élément lu : libéré avec ses frères précédents (mémoire constante)
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            
+            if entry is not None:
+                yield entry
+    
+    async def _entries(self, client, url, children):
+        """
+        Entrées d'un sitemap, parsé au fil des blocs reçus
+        
+        Args:
+            children: Liste complétée par les (lastmod, url) d'un index
+        """
+        from lxml import etree
+        
+        parser = etree.XMLPullParser(events=('end',), tag=(SITEMAP_NS + 'url', SITEMAP_NS + 'sitemap'))
+        gzip = zlib.decompressobj(16 + zlib.MAX_WBITS) if url.endswith('.gz') else None
+        
+        chunks = client.stream(url, self.headers)
+        try:
+            received = False
+            async for chunk in chunks:
+                received = True
+                parser.feed(gzip.decompress(chunk) if gzip else chunk)
+                for entry in self._read_events(parser, children):
+                    yield entry
+            
+            if not received:  # 304
+                return
+            if gzip:
+                parser.feed(gzip.flush())
+            parser.close()
+            for entry in self._read_events(parser, children):
+                yield entry
+        finally:
+            # Lecture interrompue (fenêtre atteinte) : téléchargement arrêté
+            await chunks.aclose()
+    
+    async def fetch(self, client):
+        pending = [self.url]
+        
+        while pending:
+            url = pending.pop(0)
+            children = []
+            
+            entries = self._entries(client, url, children)
+            try:
+                async for entry in entries:
+                    yield entry
+            finally:
+                await entries.aclose()
+            
+            # Index : sitemaps enfants les plus récents
+            if url == self.url:
+                pending = [loc for _, loc in sorted(children, reverse=True)[:self.max_sitemaps] if loc]
+    
+    def config(self):
+        return dict(super().config(), max_sitemaps=self.max_sitemaps)
+
+
+@register_source('html')
+class HTMLListingSource(Source):
+    """Page listing HTML, parsée par un parser de web_scraper.LISTING_PARSERS"""
+    
+    def __init__(self, name, url, parser, max_articles=20, **options):
+        super().__init__(name, url, **options)
+        self.parser = parser
+        self.max_articles = max_articles
+    
+    async def fetch(self, client):
+        from .web_scraper import LISTING_PARSERS, get_headers
+        
+        content = await client.get(self.url, self.headers or get_headers())
+        if content is None:
+            return
+        
+        articles = await asyncio.to_thread(LISTING_PARSERS[self.parser], content, self.max_articles)
+        for article in articles:
+            yield dict(article, published_parsed=None)
+    
+    def config(self):
+        return dict(super().config(), parser=self.parser, max_articles=self.max_articles)
+
+
+def _lookup(data, path):
+    """Valeur d'un chemin pointé ('title.rendered') dans un JSON, None si absent"""
+    for key in filter(None, path.split('.')):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+@register_source('json')
+class JSONAPISource(Source):
+    """
+    API JSON : liste d'objets, champs lus par chemins pointés
+    
+    Défaut : API REST WordPress (/wp-json/wp/v2/posts), exposée par
+    beaucoup de sites sans flux RSS complet.
+    """
+    
+    FIELDS = {
+        'title': 'title.rendered',
+        'link': 'link',
+        'published': 'date_gmt',
+        'summary': 'excerpt.rendered',
+    }
+    
+    def __init__(self, name, url, items='', fields=None, **options):
+        super().__init__(name, url, **options)
+        self.items = items  # Chemin de la liste d'objets ('' : racine)
+        self.fields = dict(self.FIELDS, **(fields or {}))
+    
+    async def fetch(self, client):
+        content = await client.get(self.url, self.headers)
+        if content is None:
+            return
+        
+        for item in _lookup(json.loads(content), self.items) or []:
+            values = {field: _lookup(item, path) for field, path in self.fields.items()}
+            yield {
+                'title': html.unescape(str(values['title'] or '')),
+                'link': str(values['link'] or ''),
+                'published': str(values['published'] or ''),
+                'published_parsed': None,
+                'summary': str(values['summary'] or ''),
+            }
+    
+    def config(self):
+        return dict(super().config(), items=self.items, fields=self.fields)
+
+
+def build_source(config):
+    """
+    Source depuis sa configuration
+    
+    Args:
+        config: Dict avec 'type' (voir SOURCE_TYPES), 'name', 'url' et les
+                options du type (ex: 'parser' pour 'html')
+    """
+    options = dict(config)
+    kind = options.pop('type', 'rss')
+    if kind not in SOURCE_TYPES:
+        raise ValueError(f"Unknown source type '{kind}' (known: {', '.join(sorted(SOURCE_TYPES))})")
+    return SOURCE_TYPES[kind](**options)
+
+
+def default_sources(feeds=None, extra=None):
+    """Sources actives : flux RSS (RSS_FEEDS) puis sources hors RSS (EXTRA_SOURCES)"""
+    sources = [RSSSource(name, url) for name, url in (feeds if feeds is not None else RSS_FEEDS).items()]
+    sources += [build_source(config) for config in (extra if extra is not None else EXTRA_SOURCES)]
+    return [source for source in sources if source.enabled]
+
+
+async def _collect(source, client, cutoff_ts, dates):
+    """
+    Lire une source (filtre de fenêtre appliqué au fil des entrées)
+    
+    Returns:
+        Dict : entrées retenues (entry, published_ts), compteurs, erreur éventuelle
+    """
+    result = {'entries': [], 'skipped': 0, 'stopped_early': False, 'error': None}
+    start = time.perf_counter()
+    previous_ts = None
+    sorted_desc = True
+    
+    stream = source.fetch(client)
+    try:
+        position = 0
+        async for entry in stream:
+            position += 1
+            # Date normalisée dès l'ingestion (struct feedparser si disponible)
+            published_ts = dates.normalize(entry['published'], entry.get('published_parsed'))
+            
+            if cutoff_ts is not None:
+                if published_ts is None:
+                    result['skipped'] += 1
+                    continue
+                
+                if previous_ts is not None and published_ts > previous_ts:
+                    sorted_desc = False
+                previous_ts = published_ts
+                
+                if published_ts < cutoff_ts:
+                    # Source triée sur assez d'entrées : le reste est plus ancien
+                    if sorted_desc and position > SORTED_FEED_MIN_ENTRIES:
+                        result['skipped'] += 1
+                        result['stopped_early'] = True
+                        break
+                    result['skipped'] += 1
+                    continue
+            
+            result['entries'].append((entry, published_ts))
+    except Exception as e:
+        result['error'] = e
+    finally:
+        await stream.aclose()
+    
+    result['fetched_at'] = datetime.now().isoformat()
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+async def _collect_all(sources, cutoff_ts, http_cache, dates):
+    client = SourceClient(http_cache)
+    results = await asyncio.gather(*(_collect(source, client, cutoff_ts, dates) for source in sources))
+    return results, client
+
+
+def fetch_sources(sources=None, cutoff=None, identity=None, http_cache=None):
+    """
+    Interroger des sources en parallèle et construire un ArticleBatch
+    
+    Args:
+        sources: Liste de Source (défaut: default_sources())
+        cutoff: datetime UTC optionnel ; entrées plus anciennes (ou sans date
+                valide) ignorées, lecture d'une source triée arrêtée à la
+                première entrée trop vieille
+        identity: IdentityIndex (défaut: index en mémoire) ; un article déjà
+                  reçu sous une autre URL ou d'une autre source est écarté
+        http_cache: Validateurs HTTP par URL (GET conditionnels, mis à jour)
+    
+    Returns:
+        (ArticleBatch, noms des sources en erreur)
+    """
+    
+    if sources is None:
+        sources = default_sources()
+    if identity is None:
+        identity = IdentityIndex(db_path=None)
+    
+    cutoff_ts = cutoff.timestamp() if cutoff is not None else None
+    dates = DateNormalizer()
+    
+    print(f"📡 Fetching {len(sources)} sources concurrently...\n")
+    
+    start = time.perf_counter()
+    results, client = asyncio.run(_collect_all(sources, cutoff_ts, http_cache, dates))
+    elapsed = time.perf_counter() - start
+    
+    batch = ArticleBatch()
+    failed = []
+    skipped = 0
+    duplicates = 0
+    
+    # Identités résolues dans l'ordre des sources : même article, même source retenue
+    for source, result in zip(sources, results):
+        label = f"  → {source.name} ({source.kind}, {result['seconds']:.1f}s)..."
+        
+        if result['error'] is not None:
+            failed.append(source.name)
+            print(f"{label} ❌ Error: {result['error']}")
+            continue
+        if source.url in client.not_modified:
+            print(f"{label} ✅ not modified")
+            continue
+        
+        count = 0
+        for entry, published_ts in result['entries']:
+            # Même article sous une autre URL : ni record, ni téléchargement
+            article_id, duplicate = identity.resolve(entry['link'], entry['title'], source.name)
+            if duplicate:
+                duplicates += 1
+                continue
+            
+            record = batch.add(
+                source.name,
+                entry['title'],
+                entry['link'],
+                entry['published'],
+                entry['summary'],
+                result['fetched_at'],
+            )
+            record.published_ts = published_ts
+            record.article_id = article_id
+            count += 1
+        
+        skipped += result['skipped']
+        if result['skipped'] or result['stopped_early']:
+            print(f"{label} ✅ {count} articles ({result['skipped']} out of window"
+                  f"{', stopped early' if result['stopped_early'] else ''})")
+        else:
+            print(f"{label} ✅ {count} articles")
+    
+    sequential = sum(result['seconds'] for result in results)
+    print(f"\n✅ Sources Total: {len(batch)} articles fetched in {elapsed:.1f}s "
+          f"({sequential:.1f}s one after another, {client.bytes // 1024} KB downloaded)")
+    if skipped:
+        print(f"  • {skipped} entries older than cutoff (or undated) not loaded")
+    if duplicates:
+        print(f"  • {duplicates} duplicate URLs skipped (same canonical URL or title)")
+    dates.report()
+    
+    return batch, failed
@@ -0,0 +1,188 @@
+"""
+Stage Graph Module
+Exécuteur de graphe d'étapes, résultats mémoïsés par hash des entrées
+
+Chaque étape déclare ses entrées (étapes amont) et les paramètres du run
+qu'elle utilise. Sa clé = hash(nom, paramètres, version, clés des entrées,
+run d'origine des sorties des entrées) : une étape dont la clé n'a pas changé
+n'est pas ré-exécutée, son résultat est relu depuis les checkpoints du run en
+cours (reprise) ou d'un run précédent.
+
+L'origine rend la clé dépendante des données reçues : quand 'collect' est
+ré-exécutée (max_age dépassé), ses sorties viennent du run en cours et toutes
+les étapes en aval sont recalculées, au lieu de relire le classement d'une
+semaine précédente calculé avec la même clé.
+
+Changer --min-score ne change que la clé de 'select' et des étapes en aval :
+fetch, extraction et scoring sont relus, seuls filtrage, dédup, résumés des
+nouveaux articles et HTML sont refaits.
+
+Une étape est une fonction appelée avec les sorties de ses entrées (dicts de
+DataFrames ou d'ArticleBatch, DataFrames quand relues d'un checkpoint) et ses
+paramètres, qui retourne (frames, stats) ou None si échec.
+
+Ex:
+    graph = StageGraph()
+    graph.add('collect', collect, params=('days_back',), max_age=timedelta(hours=6))
+    graph.add('rank', rank, inputs=('collect',), version=get_scoring_version)
+    results = graph.run(params, RunCheckpoint(params=params))
+"""
+
+import hashlib
+import json
+
+from .run_checkpoints import find_stage
+
+
+class StageFailed(Exception):
+    """Une étape a échoué (retourné None)"""
+    
+    def __init__(self, stage):
+        super().__init__(f"Stage '{stage}' failed")
+        self.stage = stage
+
+
+class Stage:
+    """Déclaration d'une étape du graphe"""
+    
+    __slots__ = ('name', 'fn', 'inputs', 'params', 'version', 'max_age', 'cache', 'incremental')
+    
+    def __init__(self, name, fn, inputs=(), params=(), version=None, max_age=None, cache=True, incremental=False):
+        self.name = name
+        self.fn = fn
+        self.inputs = tuple(inputs)
+        self.params = tuple(params)
+        self.version = version  # Callable : version du code / des règles (incluse dans la clé)
+        self.max_age = max_age  # timedelta : résultat d'un run précédent réutilisé seulement s'il est plus récent
+        self.cache = cache  # False : toujours exécutée (sorties fichiers, peu coûteuse)
+        self.incremental = incremental  # Reçoit son dernier résultat (argument previous)
+
+
+class StageGraph:
+    """Étapes + dépendances, exécutées dans l'ordre topologique"""
+    
+    def __init__(self):
+        self.stages = {}
+    
+    def add(self, name, fn, **options):
+        """Déclarer une étape (options : voir Stage)"""
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' already declared")
+        self.stages[name] = Stage(name, fn, **options)
+        return self.stages[name]
+    
+    def order(self):
+        """Étapes triées : chaque étape après ses entrées (ordre de déclaration sinon)"""
+        ordered = []
+        visiting = set()
+        done = set()
+        
+        def visit(stage):
+            if stage.name in done:
+                return
+            if stage.name in visiting:
+                raise ValueError(f"Cycle in stage graph at '{stage.name}'")
+            visiting.add(stage.name)
+            for name in stage.inputs:
+                if name not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{name}'")
+                visit(self.stages[name])
+            visiting.discard(stage.name)
+            done.add(stage.name)
+            ordered.append(stage)
+        
+        for stage in self.stages.values():
+            visit(stage)
+        
+        return ordered
+    
+    @staticmethod
+    def stage_key(stage, params, input_keys, input_origins=None):
+        """
+        Hash des entrées d'une étape (clés amont = hash en chaîne)
+        
+        Args:
+            input_keys: {étape amont: clé}
+            input_origins: {étape amont: run qui a calculé ses sorties}
+        """
+        input_origins = input_origins or {}
+        payload = {
+            'stage': stage.name,
+            'params': {name: params.get(name) for name in stage.params},
+            'version': stage.version() if stage.version else None,
+            'inputs': {name: [input_keys[name], input_origins.get(name)] for name in stage.inputs},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    
+    def _restore(self, stage, key, checkpoint, use_cache):
+        """
+        Exécution précédente de mêmes entrées
+        
+        Returns:
+            ((frames, stats), run d'origine des sorties), None sinon
+        """
+        if not stage.cache:
+            return None
+        
+        # Reprise du run en cours
+        if checkpoint.stage_key(stage.name) == key:
+            print(f"💾 {stage.name}: restored from checkpoint")
+            return checkpoint.load(stage.name), checkpoint.stage_origin(stage.name)
+        
+        if not use_cache:
+            return None
+        
+        # Run précédent, mêmes entrées : copié dans le run en cours (reprise possible)
+        source = find_stage(stage.name, key, stage.max_age, exclude=checkpoint.run_id,
+                            runs_dir=checkpoint.runs_dir)
+        if source is None:
+            return None
+        frames, stats = source.load(stage.name)
+        origin = source.stage_origin(stage.name)
+        checkpoint.save(stage.name, frames, stats, key=key, origin=origin)
+        print(f"💾 {stage.name}: unchanged inputs, reused from run {source.run_id}")
+        return (frames, stats), origin
+    
+    def run(self, params, checkpoint, use_cache=True):
+        """
+        Exécuter le graphe
+        
+        Args:
+            params: Paramètres du run (dict)
+            checkpoint: RunCheckpoint du run
+            use_cache: False = ignorer les runs précédents (reprise du run en cours conservée)
+        
+        Returns:
+            {étape: (frames, stats)}
+        
+        Raises:
+            StageFailed: une étape a retourné None (étapes précédentes checkpointées)
+        """
+        results = {}
+        keys = {}
+        origins = {}  # Run qui a calculé les sorties de chaque étape
+        
+        for stage in self.order():
+            key = keys[stage.name] = self.stage_key(stage, params, keys, origins)
+            
+            restored = self._restore(stage, key, checkpoint, use_cache)
+            if restored is not None:
+                results[stage.name], origins[stage.name] = restored
+                continue
+            
+            kwargs = {name: results[name][0] for name in stage.inputs}
+            kwargs.update({name: params.get(name) for name in stage.params})
+            if stage.incremental:
+                previous = find_stage(stage.name, runs_dir=checkpoint.runs_dir)
+                kwargs['previous'] = previous.load(stage.name)[0] if previous else None
+            
+            output = stage.fn(**kwargs)
+            if output is None:
+                raise StageFailed(stage.name)
+            
+            frames, stats = output
+            checkpoint.save(stage.name, frames, stats, key=key)
+            results[stage.name] = (frames, stats)
+            origins[stage.name] = checkpoint.run_id
+        
+        return results
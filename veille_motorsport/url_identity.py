@@ -0,0 +1,204 @@
+"""
+URL Identity Module
+URL canonique + index d'identité persistant (URL canonique → article_id)
+
+Un même article arrive sous plusieurs URLs : paramètres de tracking,
+version AMP, http/https, www, slash final. canonical_url() les ramène à une
+seule forme. L'IdentityIndex (table SQLite `url_identity`, dans la base du
+pipeline) attribue un article_id stable à chaque URL canonique, et reconnaît
+aussi un article déjà vu sous une autre URL via l'empreinte de son titre
+(syndication Autosport / Motorsport.com, URL modifiée après publication).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DB_PATH = 'data/veille_motorsport.db'
+
+# Paramètres de query sans effet sur le contenu
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'ref', 'ref_src', 'cmpid', 'xtor', 'at_medium', 'at_campaign', 'ito', 'icid',
+    'amp', 'outputtype',
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'pk_')
+
+# Sous-domaines équivalents au domaine principal
+HOST_PREFIXES = ('www.', 'amp.', 'm.')
+
+# Titre trop court pour identifier un article à lui seul
+MIN_FINGERPRINT_WORDS = 4
+
+# Empreintes persistées comparées seulement si vues récemment
+# (titres récurrents type "F1 live: qualifying" d'un week-end à l'autre)
+FINGERPRINT_WINDOW_DAYS = 14
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def canonical_url(url):
+    """
+    Forme canonique d'une URL d'article
+    
+    https, hôte en minuscules sans www./amp./m., sans fragment, sans
+    paramètres de tracking (query triée), sans suffixe AMP ni slash final.
+    
+    Ex:
+        canonical_url('http://www.autosport.com/f1/news/foo/amp/?utm_source=rss')
+        → 'https://autosport.com/f1/news/foo'
+    """
+    if not url or not isinstance(url, str):
+        return ''
+    
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+    
+    host = parts.hostname or ''
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f'{host}:{parts.port}'
+    
+    path = re.sub(r'/{2,}', '/', parts.path)
+    path = re.sub(r'(/amp)+/?$|\.amp$', '', path)
+    if path.startswith('/amp/'):
+        path = path[len('/amp'):]
+    path = path.rstrip('/')
+    
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def title_fingerprint(title):
+    """Empreinte d'un titre (mots normalisés), None si trop court pour être fiable"""
+    words = _WORD_RE.findall((title or '').lower())
+    if len(words) < MIN_FINGERPRINT_WORDS:
+        return None
+    return hashlib.sha1(' '.join(words).encode('utf-8')).hexdigest()[:16]
+
+
+def article_id_for(canonical):
+    """article_id stable dérivé de l'URL canonique"""
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+class IdentityIndex:
+    """
+    Index persistant URL canonique → article_id (+ empreinte de titre)
+    
+    Chargé en mémoire à l'ouverture, écrit par save() (upsert des entrées
+    vues pendant le run). db_path=None : index en mémoire pour un seul run.
+    
+    Ex:
+        index = IdentityIndex()
+        article_id, duplicate = index.resolve(link, title, source)
+        index.save()
+    """
+    
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self._by_url = {}
+        self._by_fingerprint = {}
+        self._seen_this_run = set()
+        self._pending = {}
+        
+        if db_path and os.path.exists(db_path):
+            recent = (datetime.now() - timedelta(days=FINGERPRINT_WINDOW_DAYS)).isoformat()
+            conn = sqlite3.connect(db_path)
+            try:
+                self._ensure_table(conn)
+                for canonical, article_id, fingerprint, last_seen in conn.execute(
+                    "SELECT canonical_url, article_id, fingerprint, last_seen FROM url_identity"
+                ):
+                    self._by_url[canonical] = article_id
+                    if fingerprint and last_seen and last_seen >= recent:
+                        self._by_fingerprint.setdefault(fingerprint, article_id)
+            finally:
+                conn.close()
+    
+    @staticmethod
+    def _ensure_table(conn):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_identity (
+                canonical_url TEXT PRIMARY KEY,
+                article_id TEXT NOT NULL,
+                fingerprint TEXT,
+                source TEXT,
+                first_seen TEXT,
+                last_seen TEXT
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_url_identity_fp ON url_identity (fingerprint)")
+    
+    def __len__(self):
+        return len(self._by_url)
+    
+    def resolve(self, link, title='', source=''):
+        """
+        article_id d'un article, et s'il a déjà été vu pendant ce run
+        
+        Returns:
+            (article_id, duplicate) ; duplicate=True si le même article (même URL
+            canonique ou même titre) a déjà été résolu depuis l'ouverture de l'index
+        """
+        canonical = canonical_url(link)
+        fingerprint = title_fingerprint(title)
+        
+        # Sans URL : pas d'identité fiable, jamais considéré comme doublon
+        if not canonical:
+            return article_id_for(f'{source}|{title}'), False
+        
+        article_id = self._by_url.get(canonical)
+        if article_id is None and fingerprint:
+            article_id = self._by_fingerprint.get(fingerprint)
+        if article_id is None:
+            article_id = article_id_for(canonical)
+        
+        duplicate = article_id in self._seen_this_run
+        self._seen_this_run.add(article_id)
+        
+        self._by_url[canonical] = article_id
+        if fingerprint:
+            self._by_fingerprint.setdefault(fingerprint, article_id)
+        self._pending[canonical] = (article_id, fingerprint, source)
+        
+        return article_id, duplicate
+    
+    def save(self):
+        """Écrire les URLs vues pendant le run (first_seen conservé)"""
+        if not self._pending or not self.db_path:
+            return
+        
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        now = datetime.now().isoformat()
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self._ensure_table(conn)
+            conn.executemany(
+                """
+                INSERT INTO url_identity (canonical_url, article_id, fingerprint, source, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(canonical_url) DO UPDATE SET last_seen = excluded.last_seen
+                """,
+                [(canonical, article_id, fingerprint, source, now, now)
+                 for canonical, (article_id, fingerprint, source) in self._pending.items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
+        self._pending.clear()
@@ -413,6 +413,8 @@ def generate_index_page(output_dir='docs'):
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <meta name="description" content="Archives revues hebdomadaires motorsport - F1, WEC, analyses data">
     <title>Motorsport Digest - Archives</title>
+    <link rel="alternate" type="application/atom+xml" title="Motorsport Digest (Atom)" href="feed.xml">
+    <link rel="alternate" type="application/feed+json" title="Motorsport Digest (JSON Feed)" href="feed.json">
     <style>
         * {
             margin: 0;
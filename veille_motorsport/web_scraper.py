@@ -1,14 +1,23 @@
 """
 Web Scraper Module
 Scraping direct pour sources sans flux RSS (WEC, F1 Technical)
+
+Chaque page listing a sa cascade de stratégies de sélection (balises
+<article>, classes "news", liens...). La stratégie qui a fonctionné est
+mémorisée par site avec une empreinte structurelle de la page (table
+scraper_strategies) : tant que l'empreinte ne change pas, la page n'est
+parsée que pour les balises de cette stratégie ; la cascade n'est rejouée
+(et signalée) que si la structure du site change.
 """
 
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timezone, timedelta
-import time
+import hashlib
+import os
 import random
 import re
+import sqlite3
+
+DB_PATH = 'data/veille_motorsport.db'
 
 # ============================================
 # USER AGENTS
@@ -34,10 +43,243 @@ def get_headers():
     }
 
 
+# ============================================
+# STRATÉGIES DE SÉLECTION (mémorisées par site)
+# ============================================
+
+# Empreinte structurelle : noms de balises + classes CSS (chiffres retirés :
+# ids d'articles, dates), pas le texte → stable tant que le gabarit l'est
+_TAG_NAME = re.compile(rb'<([a-zA-Z][a-zA-Z0-9]*)')
+_CLASS_VALUE = re.compile(rb'\bclass\s*=\s*["\']([^"\']*)')
+_DIGITS = re.compile(rb'\d+')
+
+# Site -> (stratégie, empreinte), chargé depuis la base au premier appel
+_strategies = None
+
+
+def page_fingerprint(content):
+    """Empreinte structurelle d'une page HTML (regex sur le HTML brut, sans parsing)"""
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'replace')
+    
+    tags = {tag.lower() for tag in _TAG_NAME.findall(content)}
+    classes = {_DIGITS.sub(b'', token) for value in _CLASS_VALUE.findall(content) for token in value.split()}
+    
+    digest = hashlib.sha1()
+    for item in sorted(tags) + [b'|'] + sorted(classes):
+        digest.update(item + b' ')
+    return digest.hexdigest()[:16]
+
+
+def _connect(db_path=DB_PATH):
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scraper_strategies (
+            site TEXT PRIMARY KEY,
+            strategy TEXT,
+            fingerprint TEXT,
+            updated_at TEXT
+        )
+        """
+    )
+    return conn
+
+
+def _known_strategies():
+    global _strategies
+    
+    if _strategies is None:
+        conn = _connect()
+        try:
+            _strategies = {
+                site: (strategy, fingerprint)
+                for site, strategy, fingerprint in conn.execute(
+                    "SELECT site, strategy, fingerprint FROM scraper_strategies"
+                )
+            }
+        finally:
+            conn.close()
+    
+    return _strategies
+
+
+def _remember_strategy(site, strategy, fingerprint):
+    _known_strategies()[site] = (strategy, fingerprint)
+    
+    conn = _connect()
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO scraper_strategies (site, strategy, fingerprint, updated_at) VALUES (?, ?, ?, ?)",
+            (site, strategy, fingerprint, datetime.now().isoformat())
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def select_listing(site, content, strategies, max_articles=20):
+    """
+    Éléments d'articles d'une page listing
+    
+    Page de même empreinte qu'au dernier passage : parsing limité aux
+    balises de la stratégie mémorisée (SoupStrainer), sans cascade. Sinon
+    (premier passage, gabarit modifié, stratégie devenue vide) : page
+    entière parsée, stratégies essayées dans l'ordre, la première qui
+    trouve des articles est mémorisée. Un changement de stratégie, ou
+    aucune stratégie qui fonctionne, est signalé.
+    
+    Args:
+        site: Clé du site (ex: 'fiawec')
+        content: HTML de la page (bytes ou str)
+        strategies: Liste ordonnée de (nom, (balises, attributs) du
+                    SoupStrainer, fonction (soup, max_articles) -> éléments)
+    
+    Returns:
+        Liste d'éléments (Tag), vide si aucune stratégie ne trouve d'articles
+    """
+    
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    fingerprint = page_fingerprint(content)
+    known_strategy, known_fingerprint = _known_strategies().get(site, (None, None))
+    
+    # Structure inchangée : seule la stratégie connue, sur un arbre réduit à ses balises
+    by_name = {name: (strainer, select) for name, strainer, select in strategies}
+    if fingerprint == known_fingerprint and known_strategy in by_name:
+        (tags, attrs), select = by_name[known_strategy]
+        soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer(tags, **attrs))
+        found = select(soup, max_articles)
+        if found:
+            return found
+    
+    # Découverte : cascade complète
+    soup = BeautifulSoup(content, 'html.parser')
+    strategy, found = None, []
+    for name, _, select in strategies:
+        found = select(soup, max_articles)
+        if found:
+            strategy = name
+            break
+    
+    if strategy is None:
+        print(f"⚠️  {site}: no selector strategy matched (page structure changed?)", end=" ")
+    elif known_strategy is not None and strategy != known_strategy:
+        print(f"⚠️  {site}: page structure changed, strategy '{known_strategy}' → '{strategy}'", end=" ")
+    
+    if (strategy, fingerprint) != (known_strategy, known_fingerprint):
+        _remember_strategy(site, strategy, fingerprint)
+    
+    return found
+
+
 # ============================================
 # WEC - FIA World Endurance Championship
 # ============================================
 
+WEC_NEWS_URL = 'https://www.fiawec.com/fr/page/news/30'
+
+_WEC_ITEM_CLASS = re.compile(r'(news|article|post|item)', re.I)
+_WEC_NEWS_HREF = re.compile(r'/(news|article)/')
+_WEC_CARD_CLASS = re.compile(r'(card|box|tile)', re.I)
+_WEC_SUMMARY_CLASS = re.compile(r'(summary|excerpt|description|intro|lead)', re.I)
+_WEC_DATE_CLASS = re.compile(r'date', re.I)
+
+# Cascade WEC : (nom, SoupStrainer, sélection)
+WEC_STRATEGIES = [
+    # Stratégie 1 : Chercher balises <article>
+    ('article', ('article', {}), lambda soup, n: soup.find_all('article', limit=n)),
+    # Stratégie 2 : Chercher divs avec class contenant "news" ou "article"
+    ('news_div', ('div', {'class_': _WEC_ITEM_CLASS}),
+     lambda soup, n: soup.find_all('div', class_=_WEC_ITEM_CLASS, limit=n)),
+    # Stratégie 3 : Chercher tous les liens vers /news/ ou /article/
+    ('news_links', ('a', {'href': _WEC_NEWS_HREF}),
+     lambda soup, n: soup.find_all('a', href=_WEC_NEWS_HREF)[:n]),
+    # Stratégie 4 : Chercher structure spécifique WEC (grille de news)
+    ('card_div', ('div', {'class_': _WEC_CARD_CLASS}),
+     lambda soup, n: soup.find_all('div', class_=_WEC_CARD_CLASS, limit=n)),
+]
+
+
+def parse_wec_listing(content, max_articles=20):
+    """
+    Articles de la page news WEC (HTML déjà téléchargé)
+    
+    Returns:
+        Liste de dicts title / link / published / summary
+    """
+    
+    articles = []
+    
+    article_tags = select_listing('fiawec', content, WEC_STRATEGIES, max_articles)
+    
+    for article in article_tags:
+        try:
+            # Extraire titre
+            title = ''
+            title_tag = article.find(['h1', 'h2', 'h3', 'h4', 'h5'])
+            if title_tag:
+                title = title_tag.get_text(strip=True)
+            elif article.name == 'a':
+                title = article.get_text(strip=True)
+            
+            if not title or len(title) < 10:
+                continue
+            
+            # Extraire lien
+            link = ''
+            link_tag = article.find('a', href=True)
+            if link_tag:
+                link = link_tag['href']
+            elif article.name == 'a':
+                link = article['href']
+            
+            # Compléter lien relatif
+            if link and not link.startswith('http'):
+                if link.startswith('/'):
+                    link = 'https://www.fiawec.com' + link
+                else:
+                    link = 'https://www.fiawec.com/' + link
+            
+            if not link:
+                continue
+            
+            # Extraire résumé
+            summary = ''
+            summary_tag = article.find(['p', 'div'], class_=_WEC_SUMMARY_CLASS)
+            if summary_tag:
+                summary = summary_tag.get_text(strip=True)
+            else:
+                # Prendre premier paragraphe
+                p_tag = article.find('p')
+                if p_tag:
+                    summary = p_tag.get_text(strip=True)
+            
+            # Extraire date (si disponible)
+            published = ''
+            date_tag = article.find(['time', 'span'], class_=_WEC_DATE_CLASS)
+            if date_tag:
+                published = date_tag.get('datetime', date_tag.get_text(strip=True))
+            
+            if not published:
+                # Date par défaut (aujourd'hui)
+                published = datetime.now(timezone.utc).isoformat()
+            
+            # Ajouter article
+            articles.append({
+                'title': title,
+                'link': link,
+                'published': published,
+                'summary': summary,
+            })
+        
+        except Exception as e:
+            continue
+    
+    return articles
+
+
 def scrape_wec_news(max_articles=20):
     """
     Scraper WEC depuis fiawec.com
@@ -47,102 +289,24 @@ def scrape_wec_news(max_articles=20):
         Liste d'articles format RSS-compatible
     """
     
+    import requests
+    
     print("  → WEC (scraping)...", end=" ")
     
     articles = []
     
-    # URL exacte de la page news WEC
-    base_url = 'https://www.fiawec.com/fr/page/news/30'
-    
     try:
-        response = requests.get(base_url, headers=get_headers(), timeout=15)
+        response = requests.get(WEC_NEWS_URL, headers=get_headers(), timeout=15)
         
         if response.status_code != 200:
             print(f"⚠️  HTTP {response.status_code}")
             return articles
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Stratégie 1 : Chercher balises <article>
-        article_tags = soup.find_all('article', limit=max_articles)
-        
-        if not article_tags:
-            # Stratégie 2 : Chercher divs avec class contenant "news" ou "article"
-            article_tags = soup.find_all('div', class_=re.compile(r'(news|article|post|item)', re.I), limit=max_articles)
-        
-        if not article_tags:
-            # Stratégie 3 : Chercher tous les liens vers /news/ ou /article/
-            news_links = soup.find_all('a', href=re.compile(r'/(news|article)/'))
-            article_tags = news_links[:max_articles]
-        
-        if not article_tags:
-            # Stratégie 4 : Chercher structure spécifique WEC (grille de news)
-            article_tags = soup.find_all('div', class_=re.compile(r'(card|box|tile)', re.I), limit=max_articles)
-        
-        for article in article_tags:
-            try:
-                # Extraire titre
-                title = ''
-                title_tag = article.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-                if title_tag:
-                    title = title_tag.get_text(strip=True)
-                elif article.name == 'a':
-                    title = article.get_text(strip=True)
-                
-                if not title or len(title) < 10:
-                    continue
-                
-                # Extraire lien
-                link = ''
-                link_tag = article.find('a', href=True)
-                if link_tag:
-                    link = link_tag['href']
-                elif article.name == 'a':
-                    link = article['href']
-                
-                # Compléter lien relatif
-                if link and not link.startswith('http'):
-                    if link.startswith('/'):
-                        link = 'https://www.fiawec.com' + link
-                    else:
-                        link = 'https://www.fiawec.com/' + link
-                
-                if not link:
-                    continue
-                
-                # Extraire résumé
-                summary = ''
-                summary_tag = article.find(['p', 'div'], class_=re.compile(r'(summary|excerpt|description|intro|lead)', re.I))
-                if summary_tag:
-                    summary = summary_tag.get_text(strip=True)
-                else:
-                    # Prendre premier paragraphe
-                    p_tag = article.find('p')
-                    if p_tag:
-                        summary = p_tag.get_text(strip=True)
-                
-                # Extraire date (si disponible)
-                published = ''
-                date_tag = article.find(['time', 'span'], class_=re.compile(r'date', re.I))
-                if date_tag:
-                    published = date_tag.get('datetime', date_tag.get_text(strip=True))
-                
-                if not published:
-                    # Date par défaut (aujourd'hui)
-                    published = datetime.now(timezone.utc).isoformat()
-                
-                # Ajouter article
-                articles.append({
-                    'source': 'FIA_WEC',
-                    'title': title,
-                    'link': link,
-                    'published': published,
-                    'summary': summary,
-                    'fetched_at': datetime.now().isoformat()
-                })
-            
-            except Exception as e:
-                continue
+        fetched_at = datetime.now().isoformat()
+        articles = [
+            {'source': 'FIA_WEC', **article, 'fetched_at': fetched_at}
+            for article in parse_wec_listing(response.content, max_articles)
+        ]
         
         if articles:
             print(f"✅ {len(articles)} articles")
@@ -160,6 +324,121 @@ def scrape_wec_news(max_articles=20):
 # F1 TECHNICAL
 # ============================================
 
+F1TECHNICAL_NEWS_URL = 'https://www.f1technical.net/news/'
+
+_F1T_ITEM_CLASS = re.compile(r'(news|post|article|item)', re.I)
+_F1T_TOPIC_CLASS = re.compile(r'topictitle', re.I)
+_F1T_SECTION_CLASS = re.compile(r'news', re.I)
+_F1T_NEWS_HREF = re.compile(r'/news/|article|viewtopic')
+_F1T_SUMMARY_CLASS = re.compile(r'(summary|excerpt|description|intro)', re.I)
+_F1T_DATE_CLASS = re.compile(r'date|time', re.I)
+_F1T_SKIP_KEYWORDS = ['login', 'register', 'search', 'profile', 'logout', 'faq', 'forum index', 'board index']
+
+
+def _f1t_section_links(soup, max_articles):
+    news_section = soup.find(['div', 'section'], class_=_F1T_SECTION_CLASS)
+    return news_section.find_all('a', href=True)[:max_articles] if news_section else []
+
+
+# Cascade F1 Technical : (nom, SoupStrainer, sélection)
+F1TECHNICAL_STRATEGIES = [
+    # Stratégie 1 : Chercher balises <article>
+    ('article', ('article', {}), lambda soup, n: soup.find_all('article', limit=n)),
+    # Stratégie 2 : Chercher divs avec class contenant "news" ou "post"
+    ('news_div', ('div', {'class_': _F1T_ITEM_CLASS}),
+     lambda soup, n: soup.find_all('div', class_=_F1T_ITEM_CLASS, limit=n)),
+    # Stratégie 3 : Topics de forum (si page news redirige vers forum)
+    ('forum_topics', ('a', {'class_': _F1T_TOPIC_CLASS}),
+     lambda soup, n: soup.find_all('a', class_=_F1T_TOPIC_CLASS, limit=n)),
+    # Stratégie 4 : Tous les liens dans section news
+    ('news_section', (['div', 'section'], {'class_': _F1T_SECTION_CLASS}), _f1t_section_links),
+    # Fallback : liens vers /news/ ou contenant "news"
+    ('news_links', ('a', {'href': _F1T_NEWS_HREF}),
+     lambda soup, n: soup.find_all('a', href=_F1T_NEWS_HREF)[:n]),
+]
+
+
+def parse_f1technical_listing(content, max_articles=20):
+    """
+    Articles de la page news F1 Technical (HTML déjà téléchargé)
+    
+    Returns:
+        Liste de dicts title / link / published / summary
+    """
+    
+    articles = []
+    
+    article_tags = select_listing('f1technical', content, F1TECHNICAL_STRATEGIES, max_articles)
+    
+    for article in article_tags:
+        try:
+            # Extraire titre
+            title = ''
+            if article.name == 'a':
+                title = article.get_text(strip=True)
+            else:
+                title_tag = article.find(['h1', 'h2', 'h3', 'h4', 'h5'])
+                if title_tag:
+                    title = title_tag.get_text(strip=True)
+                else:
+                    # Fallback : prendre texte du premier lien
+                    link_tag = article.find('a')
+                    if link_tag:
+                        title = link_tag.get_text(strip=True)
+            
+            if not title or len(title) < 10:
+                continue
+            
+            # Filtrer titres non pertinents
+            if any(kw in title.lower() for kw in _F1T_SKIP_KEYWORDS):
+                continue
+            
+            # Extraire lien
+            link = ''
+            if article.name == 'a':
+                link = article['href']
+            else:
+                link_tag = article.find('a', href=True)
+                if link_tag:
+                    link = link_tag['href']
+            
+            if not link:
+                continue
+            
+            # Compléter lien relatif
+            if not link.startswith('http'):
+                if link.startswith('/'):
+                    link = 'https://www.f1technical.net' + link
+                else:
+                    link = 'https://www.f1technical.net/' + link
+            
+            # Extraire résumé (si disponible)
+            summary = ''
+            summary_tag = article.find(['p', 'div'], class_=_F1T_SUMMARY_CLASS)
+            if summary_tag:
+                summary = summary_tag.get_text(strip=True)
+            
+            # Date par défaut (F1 Technical ne montre pas toujours les dates clairement)
+            published = datetime.now(timezone.utc).isoformat()
+            
+            # Essayer de trouver date quand même
+            date_tag = article.find(['time', 'span'], class_=_F1T_DATE_CLASS)
+            if date_tag:
+                published = date_tag.get('datetime', date_tag.get_text(strip=True))
+            
+            articles.append({
+                'title': title,
+                'link': link,
+                'published': published,
+                'summary': summary,
+            })
+        
+        except Exception as e:
+            continue
+    
+    return articles
+
+
 def scrape_f1technical_news(max_articles=20):
     """
     Scraper F1 Technical depuis f1technical.net
@@ -169,112 +448,24 @@ def scrape_f1technical_news(max_articles=20):
         Liste d'articles format RSS-compatible
     """
     
+    import requests
+    
     print("  → F1_Technical (scraping)...", end=" ")
     
     articles = []
     
-    # URL exacte de la page news F1 Technical
-    base_url = 'https://www.f1technical.net/news/'
-    
     try:
-        response = requests.get(base_url, headers=get_headers(), timeout=15)
+        response = requests.get(F1TECHNICAL_NEWS_URL, headers=get_headers(), timeout=15)
         
         if response.status_code != 200:
             print(f"⚠️  HTTP {response.status_code}")
             return articles
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Stratégie 1 : Chercher balises <article>
-        article_tags = soup.find_all('article', limit=max_articles)
-        
-        if not article_tags:
-            # Stratégie 2 : Chercher divs avec class contenant "news" ou "post"
-            article_tags = soup.find_all('div', class_=re.compile(r'(news|post|article|item)', re.I), limit=max_articles)
-        
-        if not article_tags:
-            # Stratégie 3 : Topics de forum (si page news redirige vers forum)
-            topics = soup.find_all('a', class_=re.compile(r'topictitle', re.I), limit=max_articles)
-            if topics:
-                article_tags = topics
-        
-        if not article_tags:
-            # Stratégie 4 : Tous les liens dans section news
-            news_section = soup.find(['div', 'section'], class_=re.compile(r'news', re.I))
-            if news_section:
-                article_tags = news_section.find_all('a', href=True)[:max_articles]
-            else:
-                # Fallback : liens vers /news/ ou contenant "news"
-                article_tags = soup.find_all('a', href=re.compile(r'/news/|article|viewtopic'))[:max_articles]
-        
-        for article in article_tags:
-            try:
-                # Extraire titre
-                title = ''
-                if article.name == 'a':
-                    title = article.get_text(strip=True)
-                else:
-                    title_tag = article.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-                    if title_tag:
-                        title = title_tag.get_text(strip=True)
-                    else:
-                        # Fallback : prendre texte du premier lien
-                        link_tag = article.find('a')
-                        if link_tag:
-                            title = link_tag.get_text(strip=True)
-                
-                if not title or len(title) < 10:
-                    continue
-                
-                # Filtrer titres non pertinents
-                skip_keywords = ['login', 'register', 'search', 'profile', 'logout', 'faq', 'forum index', 'board index']
-                if any(kw in title.lower() for kw in skip_keywords):
-                    continue
-                
-                # Extraire lien
-                link = ''
-                if article.name == 'a':
-                    link = article['href']
-                else:
-                    link_tag = article.find('a', href=True)
-                    if link_tag:
-                        link = link_tag['href']
-                
-                if not link:
-                    continue
-                
-                # Compléter lien relatif
-                if not link.startswith('http'):
-                    if link.startswith('/'):
-                        link = 'https://www.f1technical.net' + link
-                    else:
-                        link = 'https://www.f1technical.net/' + link
-                
-                # Extraire résumé (si disponible)
-                summary = ''
-                summary_tag = article.find(['p', 'div'], class_=re.compile(r'(summary|excerpt|description|intro)', re.I))
-                if summary_tag:
-                    summary = summary_tag.get_text(strip=True)
-                
-                # Date par défaut (F1 Technical ne montre pas toujours les dates clairement)
-                published = datetime.now(timezone.utc).isoformat()
-                
-                # Essayer de trouver date quand même
-                date_tag = article.find(['time', 'span'], class_=re.compile(r'date|time', re.I))
-                if date_tag:
-                    published = date_tag.get('datetime', date_tag.get_text(strip=True))
-                
-                articles.append({
-                    'source': 'F1_Technical',
-                    'title': title,
-                    'link': link,
-                    'published': published,
-                    'summary': summary,
-                    'fetched_at': datetime.now().isoformat()
-                })
-            
-            except Exception as e:
-                continue
+        fetched_at = datetime.now().isoformat()
+        articles = [
+            {'source': 'F1_Technical', **article, 'fetched_at': fetched_at}
+            for article in parse_f1technical_listing(response.content, max_articles)
+        ]
         
         if articles:
             print(f"✅ {len(articles)} articles")
@@ -292,28 +483,42 @@ def scrape_f1technical_news(max_articles=20):
 # FONCTION PRINCIPALE
 # ============================================
 
+# Parsers de pages listing, par nom (sources 'html' du registre, voir sources.py)
+LISTING_PARSERS = {
+    'fiawec': parse_wec_listing,
+    'f1technical': parse_f1technical_listing,
+}
+
+
 def scrape_all_sources():
     """
     Scraper toutes les sources web sans RSS
     
+    Sources 'html' du registre (sources.py) interrogées en parallèle : pas de
+    délai fixe entre sites différents, la politesse est par hôte.
+    
     Returns:
         Liste combinée d'articles
     """
     
-    all_articles = []
+    from .sources import EXTRA_SOURCES, build_source, fetch_sources
     
     print("\n🕷️  Scraping web sources without RSS...\n")
     
-    # WEC
-    wec_articles = scrape_wec_news(max_articles=20)
-    all_articles.extend(wec_articles)
-    
-    # Petit délai entre sources (respecter serveurs)
-    time.sleep(2)
+    sources = [build_source(dict(config, enabled=True)) for config in EXTRA_SOURCES if config['type'] == 'html']
+    batch, _ = fetch_sources(sources)
     
-    # F1 Technical
-    f1tech_articles = scrape_f1technical_news(max_articles=20)
-    all_articles.extend(f1tech_articles)
+    all_articles = [
+        {
+            'source': record.source,
+            'title': record.title,
+            'link': record.link,
+            'published': record.published,
+            'summary': batch.summary(record),
+            'fetched_at': record.fetched_at,
+        }
+        for record in batch
+    ]
     
     print(f"\n✅ Total scraped: {len(all_articles)} articles\n")
     